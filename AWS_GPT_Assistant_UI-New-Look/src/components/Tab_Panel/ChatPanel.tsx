@@ -3,9 +3,10 @@ import { useState } from "react";
 import PanelFrame from "../Main_UI/PanelFrame";
 import ChatMessages from "../Chat_UI/ChatMessages";
 import InputRow from "../Input_Row/InputRow";
-import { CHAT_URL } from "../../config/api";
+import { CHAT_URL, CHAT_STREAM_URL } from "../../config/api";
 import FileUploadPanel from "../Widgets/S3_Uploader/FileUploadPanel";
 import { useSmartSend } from "../../hooks/useSmartSend";
+import { streamChat } from "../../utils/chatStream";
 
 export default function ChatPanel() {
   const [messages, setMessages] = useState<{ role: string; text: string }[]>([
@@ -20,6 +21,23 @@ export default function ChatPanel() {
     setMessages((p) => [...p, { role: "user", text }]);
     setIsThinking(true);
     try {
+      if (CHAT_STREAM_URL) {
+        // 🌊 Reply grows in place as tokens arrive
+        let shown = false;
+        const show = (t: string) => {
+          if (!shown) {
+            shown = true;
+            setIsThinking(false);
+            setMessages((p) => [...p, { role: "assistant", text: t }]);
+          } else {
+            setMessages((p) => [...p.slice(0, -1), { role: "assistant", text: t }]);
+          }
+        };
+        const reply = await streamChat(CHAT_STREAM_URL, { message: text }, show);
+        show(reply || "🤔 No response.");
+        return;
+      }
+
       const res = await fetch(CHAT_URL, {
         method: "POST",
         headers: { "Content-Type": "application/json" },
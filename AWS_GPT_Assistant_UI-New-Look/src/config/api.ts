@@ -10,6 +10,10 @@ export const CALENDAR_URL = `${API_BASE}/calendar`;
 export const PING_URL = `${API_BASE}/ping`;
 export const TOKEN_URL = `${API_BASE}/token`;
 
+// Streamed chat (Lambda Web Adapter function URL, RESPONSE_STREAM) – optional;
+// when unset the chat uses the JSON CHAT_URL
+export const CHAT_STREAM_URL = import.meta.env.VITE_CHAT_STREAM_URL;
+
 // Future modules
 export const TODO_URL = `${API_BASE}/todo`;
 export const NOTES_URL = `${API_BASE}/notes`;
@@ -18,6 +18,10 @@ export function useChatLogic(apiToken?: string) {
   const [input, setInput] = useState('');
   const [isThinking, setIsThinking] = useState(false);
 
+  // 🗂️ Chat server keeps the history for this session – we only send the new
+  // turn (calendar ignores it and works from the newest turn alone)
+  const [sessionId] = useState(() => crypto.randomUUID());
+
   // ✅ Push a new message into the log
   const addMessage = (role: Role, text: string) => {
     setMessages((m) => [...m, { id: crypto.randomUUID(), role, text }]);
@@ -43,6 +47,7 @@ export function useChatLogic(apiToken?: string) {
         method: 'POST',
         headers: authHeaders(apiToken),
         body: JSON.stringify({
+          session_id: sessionId,
           messages: [{ role: 'user', content: userText }],
         }),
       });
@@ -9,13 +9,9 @@ export function useS3Uploader(tabName: string) {
     setProcessing(true);
     try {
       const { upload_id } = await uploadToS3(file, user, tabName, message);
-      await new Promise((res) => setTimeout(res, 2000));
 
-      let confirm = await confirmUpload(user, upload_id, tabName);
-      await new Promise((res) => setTimeout(res, 1500)); // allow DynamoDB update
-      confirm = await confirmUpload(user, upload_id, tabName);
-
-      return confirm;
+      // 📡 One call: the Lambda waits (with backoff) for the processor's status
+      return await confirmUpload(user, upload_id, tabName, 10);
     } catch (err) {
       console.error("❌ Upload failed:", err);
       return { status: "error", message: "Upload failed" };
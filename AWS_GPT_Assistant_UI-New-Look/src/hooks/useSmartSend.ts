@@ -1,5 +1,5 @@
 import { uploadToS3 } from "../utils/uploadToS3";
-import { confirmUpload } from "../utils/confirmUpload";
+import { confirmUploads } from "../utils/confirmUpload";
 
 export function useSmartSend({
   tab,
@@ -36,6 +36,9 @@ export function useSmartSend({
           },
         ]);
 
+        // uploads grouped by user|tab → one bulk confirm per group
+        const uploaded: Record<string, { user: string; tab: string; ids: string[] }> = {};
+
         for (const entry of files) {
           try {
             // 🧠 Generate a single, unique ID ONCE here
@@ -62,32 +65,11 @@ export function useSmartSend({
 
             console.log("✅ Upload complete:", result.key);
 
-            // ⏱ Small delay before confirm (S3 metadata settle)
-            await new Promise((r) => setTimeout(r, 3000));
-
-            // 📡 Confirm with the exact same uploadId
-            const confirm = await confirmUpload(
-              entry.meta.user || user,
-              uploadId, // ← SAME ONE
-              entry.meta.tab || tab
-            );
-
-            console.log("📬 Confirm Lambda replied:", confirm);
-
-            // 💬 Show Lambda message and S3 link in chat
-            setMessages((p) => [
-              ...p,
-              {
-                role: "assistant",
-                text: `✅ ${confirm.message}${
-                  confirm?.s3_link
-                    ? `\n📎 [View uploaded file](${confirm.s3_link})`
-                    : ""
-                }`,
-              },
-            ]);
+            const u = entry.meta.user || user;
+            const t = entry.meta.tab || tab;
+            (uploaded[`${u}|${t}`] ??= { user: u, tab: t, ids: [] }).ids.push(uploadId); // ← SAME ONE
           } catch (err) {
-            console.error("❌ Upload or confirm failed:", err);
+            console.error("❌ Upload failed:", err);
             setMessages((p) => [
               ...p,
               {
@@ -98,6 +80,25 @@ export function useSmartSend({
           }
         }
 
+        // 📡 One confirm call per group (server long-polls ≤ 10 s, BatchGetItem)
+        for (const group of Object.values(uploaded)) {
+          const confirms = await confirmUploads(group.user, group.ids, group.tab, 10);
+          console.log("📬 Confirm Lambda replied:", confirms);
+
+          // 💬 Show Lambda message and S3 link in chat
+          setMessages((p) => [
+            ...p,
+            ...group.ids.map((id) => ({
+              role: "assistant",
+              text: `✅ ${confirms[id].message}${
+                confirms[id]?.s3_link
+                  ? `\n📎 [View uploaded file](${confirms[id].s3_link})`
+                  : ""
+              }`,
+            })),
+          ]);
+        }
+
         setFiles([]);
         setIsUploading(false);
         return;
@@ -0,0 +1,46 @@
+// src/utils/chatStream.ts
+// 🌊 POST a chat turn to the streaming endpoint and read its SSE frames as
+// they arrive: data: {"delta": "..."} per chunk, then {"done": true, "reply": ...}
+export async function streamChat(
+  url: string,
+  body: object,
+  onDelta: (textSoFar: string) => void
+): Promise<string> {
+  const res = await fetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+    body: JSON.stringify(body),
+  });
+
+  // failures before the first token come back as a JSON 5xx
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    throw new Error(data.reply || `Chat stream failed: ${res.status} ${res.statusText}`);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let text = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // frames end with a blank line; keep any partial frame for the next read
+    const frames = buffer.split("\n\n");
+    buffer = frames.pop() ?? "";
+    for (const frame of frames) {
+      if (!frame.startsWith("data: ")) continue;
+      const msg = JSON.parse(frame.slice("data: ".length));
+      if (msg.delta) {
+        text += msg.delta;
+        onDelta(text);
+      } else if (msg.done) {
+        return msg.reply ?? text;   // error frames carry the "⚠️ Chat error" reply
+      }
+    }
+  }
+  return text;
+}
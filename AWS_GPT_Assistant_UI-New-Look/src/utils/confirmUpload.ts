@@ -2,14 +2,17 @@
 export async function confirmUpload(
   user: string,
   uploadId: string,
-  tab: string = "documents"
+  tab: string = "documents",
+  waitSecs: number = 0 // server long-polls up to this long for a final status
 ) {
   try {
     console.log("🔍 Starting confirm check...");
 
     const confirmUrl = `${import.meta.env.VITE_API_BASE}/confirm-upload?user=${encodeURIComponent(
       user
-    )}&upload_id=${encodeURIComponent(uploadId)}&tab=${encodeURIComponent(tab)}`;
+    )}&upload_id=${encodeURIComponent(uploadId)}&tab=${encodeURIComponent(
+      tab
+    )}&wait=${waitSecs}`;
 
     console.log("📡 Calling Confirm Lambda:", confirmUrl);
 
@@ -47,3 +50,66 @@ export async function confirmUpload(
     };
   }
 }
+
+// 📦 Bulk confirm: one call (BatchGetItem server-side) for many uploads
+export async function confirmUploads(
+  user: string,
+  uploadIds: string[],
+  tab: string = "documents",
+  waitSecs: number = 0
+) {
+  try {
+    const confirmUrl = `${import.meta.env.VITE_API_BASE}/confirm-upload?user=${encodeURIComponent(
+      user
+    )}&upload_ids=${uploadIds.map(encodeURIComponent).join(",")}&tab=${encodeURIComponent(
+      tab
+    )}&wait=${waitSecs}`;
+
+    console.log(`📡 Calling Confirm Lambda for ${uploadIds.length} upload(s)`);
+
+    const res = await fetch(confirmUrl, {
+      method: "GET",
+      headers: { Accept: "application/json" },
+    });
+
+    if (!res.ok) {
+      throw new Error(`Confirm Lambda failed: ${res.status} ${res.statusText}`);
+    }
+
+    const data = await res.json();
+    console.log("✅ Confirm Lambda replied:", data.summary);
+
+    return Object.fromEntries(
+      uploadIds.map((id) => {
+        const s = data.statuses?.[id] || {};
+        return [
+          id,
+          {
+            success: true,
+            status: s.status || "unknown",
+            message: s.message || "✅ Upload confirmed.",
+            gpt_title: s.gpt_title || "",
+            gpt_summary: s.gpt_summary || "",
+            s3_link: s.s3_link || null,
+            tab,
+            upload_id: id,
+          },
+        ];
+      })
+    );
+  } catch (err) {
+    console.error("⚠️ Bulk confirm check failed:", err);
+    return Object.fromEntries(
+      uploadIds.map((id) => [
+        id,
+        {
+          success: false,
+          status: "error",
+          message: "⚠️ Failed to confirm upload.",
+          error: String(err),
+          upload_id: id,
+        },
+      ])
+    );
+  }
+}
@@ -39,8 +39,15 @@ export async function uploadToS3(
     timestamp: now,
   };
 
+  // 🧠 Set once here so the processor never has to rewrite the object:
+  // inline for readable types only
+  const contentType = sanitizeHeaderValue(file.type || "application/octet-stream");
+  const viewable = ["image/", "text/", "application/pdf"].some((t) => contentType.startsWith(t));
+
   const headers: Record<string, string> = {
-    "Content-Type": sanitizeHeaderValue(file.type || "application/octet-stream"),
+    "Content-Type": contentType,
+    "Content-Disposition": viewable ? "inline" : "attachment",
+    "Cache-Control": "no-cache",
     ...Object.fromEntries(
       Object.entries(finalMeta).map(([k, v]) => [
         `x-amz-meta-${k}`,
@@ -1,19 +1,30 @@
+import time
+_MODULE_T0 = time.perf_counter()
+
 import json
 import os
-import tempfile
+import sys
+import importlib
 import datetime as dt
-import time
 import re
+import math
+import hashlib
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from calendar import month_name
 from zoneinfo import ZoneInfo
 from difflib import SequenceMatcher
 
-import boto3
-from googleapiclient.discovery import build
-from google.oauth2.credentials import Credentials
+# boto3 / googleapiclient / google-auth / openai are imported lazily (see
+# _lazy_import) so "testing" pings and pre-parsed get/find requests don't pay
+# for SDKs they never touch.
 # from google.oauth2 import service_account
-import openai
+
+from intent_router import CALENDAR_ROUTER, LEAVE_TERMS
+from calendar_discovery import calendar_discovery_doc as _load_discovery_doc
 
 # === Config ===
 ISO_DATE = "%Y-%m-%d"
@@ -25,8 +36,33 @@ YEAR_RE = re.compile(r"\b(20\d{2})\b")
 WEEKDAYS = ["monday","tuesday","wednesday","thursday","friday","saturday","sunday"]
 WORD = re.compile(r"[a-z0-9]+")
 
-# === Init OpenAI ===
-client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+# === Lazy SDKs + startup report ===
+_STARTUP_REPORT = {"cold_start": True, "module_init_ms": None, "imports_ms": {}, "discovery_ms": None}
+
+def _lazy_import(name: str):
+    """Import on first use and record how long it took for the startup report."""
+    mod = sys.modules.get(name)
+    if mod is None:
+        t0 = time.perf_counter()
+        mod = importlib.import_module(name)
+        _STARTUP_REPORT["imports_ms"][name] = round((time.perf_counter() - t0) * 1000, 1)
+    return mod
+
+def _report_startup(invocation_ms: float) -> None:
+    if not _STARTUP_REPORT["cold_start"]:
+        return
+    print("🧊 Startup report:", json.dumps({**_STARTUP_REPORT, "first_invocation_ms": round(invocation_ms, 1)}))
+    _STARTUP_REPORT["cold_start"] = False
+
+# === Init OpenAI (on first GPT call) ===
+client = None
+
+def get_openai_client():
+    global client
+    if client is None:
+        client = _lazy_import("openai").OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+    return client
+
 print(f"🔍 Lambda cold start at: {time.time()}")
 
 # === ENV VARS ===
@@ -39,7 +75,13 @@ CALENDAR_ID  = os.environ.get("CALENDAR_ID", "primary")
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
 # === S3 CLIENT ===
-s3 = boto3.client("s3")
+s3 = None
+
+def _s3():
+    global s3
+    if s3 is None:
+        s3 = _lazy_import("boto3").client("s3")
+    return s3
 
 # === Get today's date in correct timezone for prompt ===
 today_date = dt.datetime.now(dt.timezone.utc).astimezone(ZoneInfo(DEFAULT_TZ)).strftime("%A %d %B %Y")
@@ -88,16 +130,132 @@ def _resp(body_obj: dict, status: int = 200):
     }
 
 # === Token & Service ===
-def load_token_from_s3():
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
-        s3.download_fileobj(S3_BUCKET, S3_TOKEN_KEY, tmp)
-        tmp.flush()
-        creds = Credentials.from_authorized_user_file(tmp.name, SCOPES)
-    return creds
+# Warm containers keep the credentials + built service between invocations.
+# The S3 token is only re-downloaded when its ETag changes (token rotated),
+# and the ETag itself is only re-checked every TOKEN_ETAG_CHECK_SECS.
+TOKEN_ETAG_CHECK_SECS = int(os.environ.get("TOKEN_ETAG_CHECK_SECS", "300"))
+
+_SERVICE_CACHE = {
+    "creds": None,
+    "service": None,
+    "etag": None,
+    "etag_checked_at": 0.0,
+}
+_SERVICE_STATS = {"hit": 0, "miss": 0, "refresh": 0, "etag_change": 0}
+
+def _load_token_with_etag():
+    """Single GET: returns (creds, etag) without touching /tmp."""
+    obj = _s3().get_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY)
+    info = json.loads(obj["Body"].read())
+    Credentials = _lazy_import("google.oauth2.credentials").Credentials
+    creds = Credentials.from_authorized_user_info(info, SCOPES)
+    return creds, obj.get("ETag")
+
+def _token_etag_changed() -> bool:
+    now = time.time()
+    if now - _SERVICE_CACHE["etag_checked_at"] < TOKEN_ETAG_CHECK_SECS:
+        return False
+    _SERVICE_CACHE["etag_checked_at"] = now
+    try:
+        etag = _s3().head_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY).get("ETag")
+    except Exception as e:
+        # keep serving the cached creds; Google will reject them if truly stale
+        print("⚠️ Token ETag check failed:", e)
+        return False
+    return etag != _SERVICE_CACHE["etag"]
+
+def _refresh_if_expired(creds) -> None:
+    if creds.valid or not creds.refresh_token:
+        return
+    creds.refresh(_lazy_import("google.auth.transport.requests").Request())
+    _SERVICE_STATS["refresh"] += 1
+    print("🔄 Google credentials refreshed")
+
+# === Discovery document + service factory ===
+# calendar.v3.json ships once in the shared layer (calendar_discovery) and is
+# parsed once per container; the resource built from it is reused until the
+# S3 token rotates. Expired credentials are refreshed in place; a new token
+# ETag rebuilds the resource, because batch parts authorise through the
+# service's own http (the cached doc keeps the rebuild cheap).
+def calendar_discovery_doc() -> dict:
+    if _STARTUP_REPORT["discovery_ms"] is None:
+        t0 = time.perf_counter()
+        doc = _load_discovery_doc()
+        _STARTUP_REPORT["discovery_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        return doc
+    return _load_discovery_doc()
+
+def build_calendar_service(creds):
+    discovery = _lazy_import("googleapiclient.discovery")
+    return discovery.build_from_document(calendar_discovery_doc(), credentials=creds)
+
+def calendar_cache_stats() -> dict:
+    return dict(_SERVICE_STATS)
+
+# Offline harnesses (Testing-Folder) swap in a stand-in service here: no S3
+# token, no Google. Requests still go through _execute with creds=None.
+_SERVICE_OVERRIDE = {"service": None}
+
+def set_calendar_service(service) -> None:
+    """Serve every Calendar call from `service` (None → back to Google); drops derived caches."""
+    _SERVICE_OVERRIDE["service"] = service
+    _MIRRORS.clear()
+    _MIRROR_UNAVAILABLE.clear()
+    _WINDOW_CACHE.clear()
+    _CAL_LIST_CACHE.update({"items": None, "fetched_at": 0.0})
+    _INDEX_CACHE.update({"key": None, "index": None})
 
 def init_calendar_service():
-    creds = load_token_from_s3()
-    return build("calendar", "v3", credentials=creds)
+    if _SERVICE_OVERRIDE["service"] is not None:
+        return _SERVICE_OVERRIDE["service"]
+    cached = _SERVICE_CACHE["service"]
+    if cached is not None and not _token_etag_changed():
+        _SERVICE_STATS["hit"] += 1
+        _refresh_if_expired(_SERVICE_CACHE["creds"])
+        return cached
+
+    creds, etag = _load_token_with_etag()
+    _refresh_if_expired(creds)
+    if cached is not None:
+        _SERVICE_STATS["etag_change"] += 1
+        print("🔁 Token ETag changed in S3, rebuilding service with the new credentials")
+    else:
+        _SERVICE_STATS["miss"] += 1
+    service = build_calendar_service(creds)
+    _SERVICE_CACHE.update({
+        "creds": creds,
+        "service": service,
+        "etag": etag,
+        "etag_checked_at": time.time(),
+    })
+    return service
+
+# httplib2 is not thread-safe, so every thread gets its own authorised
+# transport and requests are executed through it (built requests are shared).
+_TLS = threading.local()
+
+def _thread_http():
+    creds = _SERVICE_CACHE["creds"]
+    http = getattr(_TLS, "http", None)
+    if http is None or getattr(_TLS, "creds", None) is not creds:
+        httplib2 = _lazy_import("httplib2")
+        AuthorizedHttp = _lazy_import("google_auth_httplib2").AuthorizedHttp
+        http = AuthorizedHttp(creds, http=httplib2.Http())
+        _TLS.http, _TLS.creds = http, creds
+    return http
+
+def _execute(request):
+    # gzip: googleapiclient already asks for it, but Google only compresses
+    # when the User-Agent also contains "gzip" – make both explicit.
+    headers = getattr(request, "headers", None)
+    if isinstance(headers, dict):
+        headers["accept-encoding"] = "gzip, deflate"
+        ua = headers.get("user-agent", "")
+        if "gzip" not in ua:
+            headers["user-agent"] = f"{ua} (gzip)".strip()
+    if _SERVICE_CACHE["creds"] is None:
+        return request.execute()
+    return request.execute(http=_thread_http())
 
 # def get_calendar_service():
 #     creds = service_account.Credentials.from_service_account_file(
@@ -305,10 +463,23 @@ def stem(w: str) -> str:
     # ultra-light stemmer for plurals
     return w[:-1] if w.endswith("s") else w
 
-def loose_match_text(term: str, text: str, threshold: float = 0.64) -> bool:
+# Tier 3 of loose_match_text: difflib ratio against the whole search text.
+# EventSearchIndex only runs it on events whose length could reach the
+# threshold (Testing-Folder/fuzzy-matcher-benchmark.py checks parity).
+FUZZY_THRESHOLD = float(os.environ.get("FUZZY_THRESHOLD", "0.64"))
+
+def loose_match_text(term: str, text: str, threshold: float = FUZZY_THRESHOLD) -> bool:
     term = norm_text(term)
     text = norm_text(text)
-
+    return _loose_match_prepared(
+        term, {stem(w) for w in WORD.findall(term)},
+        text, {stem(w) for w in WORD.findall(text)},
+        threshold,
+    )
+
+def _loose_match_prepared(term: str, t_stems: set[str], text: str, x_stems: set[str],
+                          threshold: float = FUZZY_THRESHOLD) -> bool:
+    """loose_match_text on already-normalised strings + stem sets (see EventSearchIndex)."""
     if not term or not text:
         return False
 
@@ -317,8 +488,6 @@ def loose_match_text(term: str, text: str, threshold: float = 0.64) -> bool:
         return True
 
     # 2) word-boundary / token-stem match (handles "doctor" vs "doctors" & "dr")
-    t_stems = {stem(w) for w in tokens(term)}
-    x_stems = {stem(w) for w in tokens(text)}
     if t_stems and t_stems.issubset(x_stems):
         return True
 
@@ -328,8 +497,7 @@ def loose_match_text(term: str, text: str, threshold: float = 0.64) -> bool:
         return True
 
     # 3) fuzzy fallback (catches "dentist appt" vs "dentist appointment")
-    ratio = SequenceMatcher(None, term, text).ratio()
-    return ratio >= threshold
+    return SequenceMatcher(None, term, text).ratio() >= threshold
 
 def as_int(x, default: int) -> int:
     try:
@@ -349,6 +517,19 @@ def read_window_params(evt, *, fwd_default: int, back_default: int = 0):
     days_back    = max(0, min(as_int(evt.get("days_back", back_default), back_default), 365*3))
     return days_forward, days_back
 
+# === Field projection (events.list fields= masks) ===
+# Only request what each consumer reads; the mirror keeps the union (+status
+# so cancelled deltas can be applied).
+EVENT_FIELDS = {
+    "slim":  "id,summary,start,end,htmlLink,colorId",                       # get / plain windows
+    "find":  "id,summary,description,location,start,htmlLink",              # find_matching_events
+    "leave": "id,summary,description,start,end,htmlLink,colorId",           # leave sum / next leave
+}
+MIRROR_EVENT_FIELDS = "id,status,summary,description,location,start,end,htmlLink,colorId"
+
+def list_fields(event_fields: str) -> str:
+    return f"nextPageToken,nextSyncToken,items({event_fields})"
+
 def slim(e):
     return {
       "id": e.get("id"),
@@ -360,32 +541,263 @@ def slim(e):
     }
 
 
-# =========================================
-# ==============  Functions  ==============
-def _fetch_events_window(days_back: int, days_forward: int, max_results: int = 3000):
-    now = datetime.now(timezone.utc)
-    start = now - timedelta(days=days_back)
-    end   = now + timedelta(days=days_forward)
+# ==========================================
+# === Calendar mirror (syncToken deltas) ===
+# Each calendar is mirrored in memory on warm containers and kept fresh with
+# events.list(syncToken=...) deltas, so reads become one small request.
+# Optional S3 snapshot lets a cold container start from a delta instead of
+# a full re-list. A 410 GONE from Google means the token expired → full resync.
+# A calendar that can't be mirrored (too big, full sync over its time budget)
+# is remembered for MIRROR_RETRY_SECS and read live without another attempt.
+MIRROR_ENABLED       = os.environ.get("CALENDAR_MIRROR", "true").lower() == "true"
+MIRROR_FRESH_SECS    = float(os.environ.get("CALENDAR_MIRROR_FRESH_SECS", "5"))
+MIRROR_MAX_EVENTS    = int(os.environ.get("CALENDAR_MIRROR_MAX_EVENTS", "50000"))
+MIRROR_SYNC_BUDGET_SECS = float(os.environ.get("CALENDAR_MIRROR_SYNC_BUDGET_SECS", "8"))
+MIRROR_RETRY_SECS    = float(os.environ.get("CALENDAR_MIRROR_RETRY_SECS", "3600"))
+MIRROR_S3_PREFIX     = os.environ.get("CALENDAR_MIRROR_S3_PREFIX", "")   # e.g. "mirror/" (empty = off)
+MIRROR_SNAPSHOT_SECS = float(os.environ.get("CALENDAR_MIRROR_SNAPSHOT_SECS", "300"))
+MIRROR_TIMELINE_PATCH_MAX = int(os.environ.get("CALENDAR_MIRROR_TIMELINE_PATCH_MAX", "256"))
 
-    service = init_calendar_service()
-    items = []
+_MIRRORS: dict[str, dict] = {}   # cal_id -> {"events", "sync_token", "synced_at", "saved_at"}
+_MIRROR_UNAVAILABLE: dict[str, tuple[float, str]] = {}   # cal_id -> (retry_at, reason)
+
+
+class MirrorUnavailable(Exception):
+    """Calendar can't be mirrored (too big, no sync token) → use a live list."""
+
+
+def _event_epoch(part: dict | None, default: float) -> float:
+    """Epoch seconds for a Google start/end dict. All-day dates use DEFAULT_TZ midnight."""
+    part = part or {}
+    try:
+        if part.get("dateTime"):
+            return datetime.fromisoformat(part["dateTime"].replace("Z", "+00:00")).timestamp()
+        if part.get("date"):
+            d = dt.date.fromisoformat(part["date"])
+            return datetime(d.year, d.month, d.day, tzinfo=ZoneInfo(DEFAULT_TZ)).timestamp()
+    except Exception:
+        pass
+    return default
+
+def _iso_epoch(iso: str) -> float:
+    return datetime.fromisoformat(iso.replace("Z", "+00:00")).timestamp()
+
+
+class EventTimeline:
+    """
+    Events sorted once by start, with parallel epoch-second start/end arrays.
+    Window, year/month and "next after" queries are binary searches, so one
+    fetched (or mirrored) range serves every narrower window.
+    """
+    def __init__(self, events):
+        rows = [(*self._span(e), e) for e in events]
+        rows.sort(key=lambda r: r[0])
+        self.starts = [r[0] for r in rows]
+        self.ends = [r[1] for r in rows]
+        self.events = [r[2] for r in rows]
+        # longest event bounds how far back a window must look for overlaps
+        finite = [en - st for st, en, _ in rows if st != float("inf")]
+        self.max_span = max(finite, default=0.0)
+
+    @staticmethod
+    def _span(e: dict) -> tuple[float, float]:
+        st = _event_epoch(e.get("start"), float("inf"))
+        return st, max(_event_epoch(e.get("end"), st), st)
+
+    def __len__(self):
+        return len(self.events)
+
+    # edits for mirror deltas (a handful of events, no full re-sort); deltas
+    # patch a copy and swap it in, so concurrent readers never see a half edit
+    def copy(self) -> "EventTimeline":
+        twin = EventTimeline(())
+        twin.starts, twin.ends, twin.events = self.starts[:], self.ends[:], self.events[:]
+        twin.max_span = self.max_span
+        return twin
+
+    def insert(self, e: dict) -> None:
+        st, en = self._span(e)
+        i = bisect_right(self.starts, st)
+        self.starts.insert(i, st)
+        self.ends.insert(i, en)
+        self.events.insert(i, e)
+        if st != float("inf"):
+            self.max_span = max(self.max_span, en - st)
+
+    def discard(self, e: dict) -> None:
+        # max_span is left as is: a stale upper bound only widens the scan
+        st, _ = self._span(e)
+        for i in range(bisect_left(self.starts, st), bisect_right(self.starts, st)):
+            if self.events[i] is e:
+                del self.starts[i], self.ends[i], self.events[i]
+                return
+
+    def between(self, lo: float, hi: float) -> list[dict]:
+        """Events overlapping [lo, hi) – same rule as timeMin/timeMax."""
+        first = bisect_left(self.starts, lo - self.max_span)
+        last = bisect_left(self.starts, hi)
+        return [self.events[i] for i in range(first, last) if self.ends[i] > lo]
+
+    def next_after(self, ts: float, pred=None) -> dict | None:
+        for i in range(bisect_left(self.starts, ts), len(self.events)):
+            if pred is None or pred(self.events[i]):
+                return self.events[i]
+        return None
+
+def _mirror_s3_key(cal_id: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]", "_", cal_id)
+    return f"{MIRROR_S3_PREFIX}{safe}.json"
+
+def _load_mirror_snapshot(cal_id: str) -> dict | None:
+    if not MIRROR_S3_PREFIX:
+        return None
+    try:
+        obj = _s3().get_object(Bucket=S3_BUCKET, Key=_mirror_s3_key(cal_id))
+        snap = json.loads(obj["Body"].read())
+        print(f"📦 Mirror snapshot loaded for {cal_id} ({len(snap.get('events', []))} events)")
+        return {
+            "events": {e["id"]: e for e in snap.get("events", []) if e.get("id")},
+            "sync_token": snap.get("sync_token"),
+            "synced_at": 0.0,
+            "saved_at": time.time(),
+        }
+    except Exception as e:
+        print(f"⚠️ No mirror snapshot for {cal_id}: {e}")
+        return None
+
+def _save_mirror_snapshot(cal_id: str, mirror: dict) -> None:
+    if not MIRROR_S3_PREFIX or time.time() - mirror.get("saved_at", 0.0) < MIRROR_SNAPSHOT_SECS:
+        return
+    try:
+        body = json.dumps({"sync_token": mirror["sync_token"], "events": list(mirror["events"].values())})
+        _s3().put_object(Bucket=S3_BUCKET, Key=_mirror_s3_key(cal_id), Body=body.encode("utf-8"))
+        mirror["saved_at"] = time.time()
+    except Exception as e:
+        print(f"⚠️ Mirror snapshot save failed for {cal_id}: {e}")
+
+def _mirror_list_pages(service, cal_id: str, sync_token: str | None):
+    """Yield events.list pages; the last one carries nextSyncToken."""
     page_token = None
     while True:
-        resp = (service.events().list(
-            calendarId=CALENDAR_ID,
-            timeMin=start.isoformat(),
-            timeMax=end.isoformat(),
+        kwargs = dict(calendarId=cal_id, singleEvents=True, maxResults=2500, pageToken=page_token,
+                      fields=list_fields(MIRROR_EVENT_FIELDS))
+        if sync_token:
+            kwargs["syncToken"] = sync_token
+        resp = _execute(service.events().list(**kwargs))
+        yield resp
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+
+def _mirror_full_sync(service, cal_id: str) -> dict:
+    events, sync_token = {}, None
+    deadline = time.monotonic() + MIRROR_SYNC_BUDGET_SECS
+    for resp in _mirror_list_pages(service, cal_id, None):
+        for e in resp.get("items", []):
+            if e.get("status") != "cancelled":
+                events[e["id"]] = e
+        if len(events) > MIRROR_MAX_EVENTS:
+            raise MirrorUnavailable(f"{cal_id} has more than {MIRROR_MAX_EVENTS} events")
+        sync_token = resp.get("nextSyncToken") or sync_token
+        if not sync_token and time.monotonic() > deadline:
+            raise MirrorUnavailable(f"Full sync of {cal_id} took over {MIRROR_SYNC_BUDGET_SECS:g}s")
+    if not sync_token:
+        raise MirrorUnavailable(f"No sync token returned for {cal_id}")
+    print(f"🪞 Mirror full sync for {cal_id}: {len(events)} events")
+    return {"events": events, "sync_token": sync_token, "synced_at": time.time(), "saved_at": 0.0}
+
+def _mirror_apply_delta(service, cal_id: str, mirror: dict) -> int:
+    changed, sync_token = 0, mirror["sync_token"]
+    timeline, patched = mirror.get("timeline"), None
+    for resp in _mirror_list_pages(service, cal_id, mirror["sync_token"]):
+        for e in resp.get("items", []):
+            changed += 1
+            old = mirror["events"].pop(e.get("id"), None)
+            if e.get("status") != "cancelled":
+                mirror["events"][e["id"]] = e
+            if timeline is not None and changed <= MIRROR_TIMELINE_PATCH_MAX:
+                if patched is None:
+                    patched = timeline.copy()
+                if old is not None:
+                    patched.discard(old)
+                if e.get("status") != "cancelled":
+                    patched.insert(e)
+        sync_token = resp.get("nextSyncToken") or sync_token
+    if changed:
+        # big delta: one rebuild on the next read beats many list inserts
+        mirror["timeline"] = patched if changed <= MIRROR_TIMELINE_PATCH_MAX else None
+    mirror["sync_token"] = sync_token
+    mirror["synced_at"] = time.time()
+    return changed
+
+def _mirror_full_sync_or_remember(service, cal_id: str) -> dict:
+    try:
+        return _mirror_full_sync(service, cal_id)
+    except MirrorUnavailable as e:
+        _MIRROR_UNAVAILABLE[cal_id] = (time.time() + MIRROR_RETRY_SECS, str(e))
+        _MIRRORS.pop(cal_id, None)
+        raise
+
+def sync_calendar_mirror(cal_id: str, service=None) -> dict:
+    mirror = _MIRRORS.get(cal_id)
+    if mirror and time.time() - mirror["synced_at"] < MIRROR_FRESH_SECS:
+        return mirror
+
+    unavailable = _MIRROR_UNAVAILABLE.get(cal_id)
+    if unavailable and time.time() < unavailable[0]:
+        raise MirrorUnavailable(f"{unavailable[1]} (not retried for another {unavailable[0] - time.time():.0f}s)")
+
+    service = service or init_calendar_service()
+    if mirror is None:
+        mirror = _load_mirror_snapshot(cal_id)
+
+    if mirror is None or not mirror.get("sync_token"):
+        mirror = _mirror_full_sync_or_remember(service, cal_id)
+    else:
+        try:
+            changed = _mirror_apply_delta(service, cal_id, mirror)
+            print(f"🪞 Mirror delta for {cal_id}: {changed} changed")
+            if not changed:
+                _MIRRORS[cal_id] = mirror
+                return mirror
+        except Exception as e:
+            if _http_status(e) != 410:   # googleapiclient HttpError 410 GONE
+                raise
+            print(f"♻️ Sync token expired for {cal_id} (410 GONE) → full resync")
+            mirror = _mirror_full_sync_or_remember(service, cal_id)
+
+    _MIRRORS[cal_id] = mirror
+    _save_mirror_snapshot(cal_id, mirror)
+    return mirror
+
+def _mirror_events_between(cal_id: str, iso_min: str, iso_max: str, max_results: int | None,
+                           service=None) -> list[dict]:
+    """Same contract as events.list(timeMin, timeMax, orderBy=startTime): overlap, sorted, capped (None = all)."""
+    mirror = sync_calendar_mirror(cal_id, service=service)
+    if mirror.get("timeline") is None:
+        mirror["timeline"] = EventTimeline(mirror["events"].values())
+    return mirror["timeline"].between(_iso_epoch(iso_min), _iso_epoch(iso_max))[:max_results]
+
+def _list_events_live(service, cal_id: str, iso_min: str, iso_max: str, max_results: int | None,
+                      fields: str = MIRROR_EVENT_FIELDS) -> list[dict]:
+    """Paged events.list; max_results=None pages to the end (no cap)."""
+    items, page_token = [], None
+    while True:
+        resp = _execute(service.events().list(
+            calendarId=cal_id,
+            timeMin=iso_min,
+            timeMax=iso_max,
             singleEvents=True,
             orderBy="startTime",
             pageToken=page_token,
-            maxResults=min(max_results, 250),
-        ).execute())
-        batch = resp.get("items", [])
-        items.extend(batch)
+            maxResults=250 if max_results is None else min(max_results, 250),
+            fields=list_fields(fields),
+        ))
+        items.extend(resp.get("items", []))
         page_token = resp.get("nextPageToken")
-        if not page_token or len(items) >= max_results:
+        if not page_token or (max_results is not None and len(items) >= max_results):
             break
-    # dedupe
+    # de-dupe + sort
     seen, out = set(), []
     for e in items:
         eid = e.get("id")
@@ -395,6 +807,63 @@ def _fetch_events_window(days_back: int, days_forward: int, max_results: int = 3
     out.sort(key=get_event_start)
     return out
 
+# Live-list results are kept briefly as a timeline so narrower windows inside
+# the last fetched range (same calendar + fields) need no extra API call.
+_WINDOW_CACHE: dict[tuple[str, str], dict] = {}
+
+def _cached_window(cal_id: str, fields: str, lo: float, hi: float, max_results: int | None) -> list[dict] | None:
+    hit = _WINDOW_CACHE.get((cal_id, fields))
+    if not hit or time.time() - hit["fetched_at"] > MIRROR_FRESH_SECS:
+        return None
+    if hit["lo"] <= lo and hi <= hit["hi"] and not hit["truncated"]:
+        if hit["timeline"] is None:   # built on first reuse, not on every fetch
+            hit["timeline"] = EventTimeline(hit["events"])
+        return hit["timeline"].between(lo, hi)[:max_results]
+    return None
+
+def _calendar_key(cal_id: str) -> str:
+    """
+    "primary" and the primary calendar's own id (the account email, from
+    calendarList) name the same calendar – one key, so it's mirrored once.
+    """
+    for c in _CAL_LIST_CACHE["items"] or ():
+        if c.get("primary") and c.get("id") == cal_id:
+            return "primary"
+    return cal_id
+
+def _read_calendar_events(cal_id: str, iso_min: str, iso_max: str, max_results: int | None = 3000,
+                          service=None, fields: str = MIRROR_EVENT_FIELDS) -> list[dict]:
+    """All read paths go through here: mirror first, live list as fallback."""
+    cal_id = _calendar_key(cal_id)
+    if MIRROR_ENABLED:
+        try:
+            return _mirror_events_between(cal_id, iso_min, iso_max, max_results, service=service)
+        except MirrorUnavailable as e:
+            print(f"⚠️ Mirror unavailable, listing live: {e}")
+
+    lo, hi = _iso_epoch(iso_min), _iso_epoch(iso_max)
+    cached = _cached_window(cal_id, fields, lo, hi, max_results)
+    if cached is not None:
+        return cached
+
+    events = _list_events_live(service or init_calendar_service(), cal_id, iso_min, iso_max, max_results, fields)
+    _WINDOW_CACHE[(cal_id, fields)] = {
+        "lo": lo, "hi": hi, "fetched_at": time.time(),
+        "truncated": max_results is not None and len(events) >= max_results,
+        "events": events, "timeline": None,
+    }
+    return events
+
+
+# =========================================
+# ==============  Functions  ==============
+def _fetch_events_window(days_back: int, days_forward: int, max_results: int = 3000,
+                         fields: str = EVENT_FIELDS["slim"]):
+    now = datetime.now(timezone.utc)
+    start = now - timedelta(days=days_back)
+    end   = now + timedelta(days=days_forward)
+    return _read_calendar_events(CALENDAR_ID, start.isoformat(), end.isoformat(), max_results, fields=fields)
+
 # --- helpers: request parsing + GPT extraction ------------------------------
 
 def parse_apigw_body(event: dict) -> dict:
@@ -436,65 +905,284 @@ def _normalize_parsed(parsed: dict) -> dict:
     return parsed
 
 
-def extract_calendar_from_messages(event: dict) -> dict:
-    # --- decide fast paths, but DO NOT return early ---
-    force_add = False
-    fast_action = None
-    fast_terms: list[str] | None = None
-    fast_year: int | None = None
-
-    if event.get("messages"):
-        latest_msg = event["messages"][-1].get("content", "").lower()
-
-        # a) Explicit ADD words → force add later
-        if any(latest_msg.startswith(w) or f" {w} " in latest_msg
-               for w in ["add", "schedule", "book", "remind", "+"]):
-            force_add = True
-
-        # b) Annual leave routing (search vs sum)
-        leave_terms = ("annual leave", "holiday", "holidays", "vacation", "leave")
-        if any(t in latest_msg for t in leave_terms):
-            # "sum up" / "add up" / "how many" etc. → SUM
-            if any(k in latest_msg for k in ["sum up", "add up", "how many", "how much", "total", "count"]):
-                m = YEAR_RE.search(latest_msg)
-                if m:
-                    fast_year = int(m.group(1))
-                fast_action = "sum_annual_leave"
-            # "next", "upcoming", "when ..." → FIND NEXT
-            elif "next" in latest_msg or "upcoming" in latest_msg or latest_msg.startswith("when"):
-                fast_action = "find_next"
-                fast_terms = list(leave_terms)
+# ==========================================
+# === Rule-based intent (skips the LLM) ===
+# Deterministic parser for the common read phrasings. It returns a complete
+# action payload plus a confidence; only confident answers skip GPT.
+FAST_PATH_MIN_CONFIDENCE = float(os.environ.get("FAST_PATH_MIN_CONFIDENCE", "0.8"))
+
+# ADD_WORDS / SUM_WORDS / GET_PATTERNS / LEAVE_TERMS live in intent_router and
+# are matched in one pass by CALENDAR_ROUTER.route(q).
+
+# The fast path only answers messages it recognises end to end: the whole
+# message must match one of these shapes (word boundaries, no substrings).
+# Anything else – past or relative windows, dates, keywords – goes to GPT.
+# "next ___" words that describe a window, not a search term
+WINDOW_WORDS = {"day", "days", "week", "weeks", "month", "months", "year", "weekend"} | set(WEEKDAYS)
+NEXT_N_RE = re.compile(r"\bnext\s+(\d+)\s*(day|days|week|weeks|month|months)\b")
+# edits need GPT + an event id, never the read-only fast path
+MODIFY_RE = re.compile(r"\b(?:cancel|delete|remove|move|reschedule|change|update|edit|rename|clear)\b")
+_FILLER = r"(?:(?:hey|hi|ok|okay|so|kai),? )*"
+_TAIL = r"(?: please)?[ ?!.]*$"
+NEXT_QUERY_RE = re.compile(
+    "^" + _FILLER
+    + r"(?:when(?:'s| is| are| do i have)? |what(?:'s| is) |show me |find )?(?:my |the )?"
+    + r"next ([a-z' ]+?)(?: appointment| appt)?" + _TAIL
+)
+# "next ___" terms: stopwords go, a generic place tail ("at work") is dropped;
+# any other qualifier ("meeting with john") needs GPT to pick the search term
+_TERM_STOPWORDS = {"a", "an", "the", "my", "our", "your", "some"}
+_GENERIC_TAIL_RE = re.compile(r" (?:at|in) (?:the )?(?:work|home|school|office|gym)$")
+_TERM_PREP_RE = re.compile(r"\b(?:at|with|for|in|on|to|from|about|near|by|before|after)\b")
+_GET_LEAD = (r"(?:what's on|whats on|what is on|what do i have(?: on)?|do i have anything(?: on)?|any events"
+             r"|show my calendar|show events|list events|show everything|show all events|all events"
+             r"|what's my day(?: like)?|whats my day(?: like)?)")
+_GET_WINDOW = (r"today|tomorrow|this week|next week|this month|this year|next \d+ ?(?:days?|weeks?|months?)"
+               r"|(?:(?:this|next) )?(?:" + "|".join(WEEKDAYS) + r")"
+               r"|(?:" + "|".join(m for m in MONTHS) + r")(?: 20\d{2})?")
+GET_QUERY_RE = re.compile(
+    "^" + _FILLER + _GET_LEAD + r"(?: (?:in |on )?my calendar)?"
+    + r"(?: (?:for |on |in )?(?P<window>" + _GET_WINDOW + r"))?" + _TAIL
+)
+
+def _wants_add(q: str, hits: set[str] | None = None) -> bool:
+    hits = CALENDAR_ROUTER.route(q) if hits is None else hits
+    # "add up my leave" is a sum, not an add; other sum words ("total",
+    # "how many") can sit inside a genuine add
+    return "add" in hits and "add up" not in q
+
+def _same_or_next_weekday(base_dt: datetime, target_wd: int) -> datetime:
+    days_ahead = target_wd - base_dt.weekday()
+    if days_ahead < 0:
+        days_ahead += 7
+    return base_dt + timedelta(days=days_ahead)
+
+def _window_from_text(q: str, now: datetime) -> tuple[int, int] | None:
+    """(days_back, days_forward) for a window phrase matched by GET_QUERY_RE."""
+    if "today" in q:
+        return 0, 1
+    if "tomorrow" in q:
+        return 0, 2
+    m = NEXT_N_RE.search(q)
+    if m:
+        num, unit = int(m.group(1)), m.group(2)
+        mult = 1 if unit.startswith("day") else 7 if unit.startswith("week") else 30
+        return 0, num * mult
+    if "this week" in q:
+        return now.weekday(), 7 - now.weekday()
+    if "next week" in q:
+        return 0, 14 - now.weekday()
+    if "this month" in q:
+        return month_window(now.year, now.month, now)
+    if "this year" in q:
+        y_start = datetime(now.year, 1, 1, tzinfo=now.tzinfo)
+        y_end = datetime(now.year + 1, 1, 1, tzinfo=now.tzinfo)
+        return (now - y_start).days + 1, (y_end - now).days + 1
+    for mname, midx in MONTHS.items():
+        if mname in q:
+            ym = YEAR_RE.search(q)
+            year = int(ym.group(1)) if ym else now.year
+            # a days window only fits the month we are in
+            if (year, midx) == (now.year, now.month):
+                return month_window(year, midx, now)
+            return None
+    for wd in WEEKDAYS:
+        if wd in q:
+            target = _same_or_next_weekday(now, WEEKDAYS.index(wd))
+            if "next" in q.split(wd, 1)[0].split()[-1:]:
+                target += timedelta(days=7)
+            return 0, (target.date() - now.date()).days + 1
+    return None
+
+def month_window(year: int, month: int, now: datetime) -> tuple[int, int]:
+    first = datetime(year, month, 1, tzinfo=now.tzinfo)
+    nxt = datetime(year + (month == 12), month % 12 + 1, 1, tzinfo=now.tzinfo)
+    return max(0, (now - first).days + 1), max(0, (nxt - now).days + 1)
+
+def rule_based_intent(text: str, now: datetime | None = None) -> tuple[dict | None, float]:
+    """
+    Returns (payload, confidence). payload uses the same keys GPT returns
+    (action, terms, days, days_back, year); None means "no opinion".
+    """
+    q = norm_text(text).replace("’", "'")
+    if not q:
+        return None, 0.0
+    now = now or datetime.now(ZoneInfo(DEFAULT_TZ))
+    hits = CALENDAR_ROUTER.route(q)
+
+    # Adds need event extraction, edits need the event → always GPT
+    if _wants_add(q, hits) or MODIFY_RE.search(q):
+        return None, 0.0
+
+    # a) Annual leave (sum vs next)
+    if "leave" in hits:
+        if "sum" in hits:
+            payload = {"action": "sum_annual_leave"}
+            m = YEAR_RE.search(q)
+            if m:
+                payload["year"] = int(m.group(1))
+            elif re.search(r"\blast year\b", q):
+                payload["year"] = now.year - 1
+            elif re.search(r"\bnext year\b", q):
+                payload["year"] = now.year + 1
+            return payload, 0.95
+        if NEXT_QUERY_RE.match(q) or re.match(r"when\b", q):
+            return {"action": "find_next", "terms": list(LEAVE_TERMS)}, 0.9
+        return None, 0.3
+
+    # b) "when is my next <term>" → find_next (but "next week" etc. is a window)
+    m = NEXT_QUERY_RE.match(q)
+    if m:
+        term = _GENERIC_TAIL_RE.sub("", m.group(1).strip(" '"))
+        words = [w for w in term.split() if w not in _TERM_STOPWORDS]
+        if (words and not (set(words) & WINDOW_WORDS) and len(words) <= 3
+                and not _TERM_PREP_RE.search(" ".join(words))):
+            return {"action": "find_next", "terms": [" ".join(words)]}, 0.85
+
+    # c) "what's on <window>" → get; the window must be one we recognise whole
+    if "get" in hits:
+        m = GET_QUERY_RE.match(q)
+        if m and m.group("window"):
+            window = _window_from_text(m.group("window"), now)
+            if window:
+                days_back, days = window
+                return {"action": "get", "days": days, "days_back": days_back}, 0.85
+        elif m:
+            # bare "what's on?" → default get window
+            return {"action": "get"}, 0.85
+        # anything else (past, relative, keywords, other months) → GPT
+        return {"action": "get"}, 0.4
+
+    return None, 0.0
+
+
+# ======================================
+# === GPT extraction cache (LRU+DDB) ===
+# Keyed by the normalised messages sent to GPT (role + text, every turn) +
+# model + the date baked into system_prompt. Warm containers answer from memory; EXTRACT_CACHE_TABLE
+# (DynamoDB, partition key "cache_key", TTL attribute "expires_at") shares
+# results across containers.
+EXTRACT_CACHE_SIZE  = int(os.environ.get("EXTRACT_CACHE_SIZE", "256"))
+EXTRACT_CACHE_TTL   = int(os.environ.get("EXTRACT_CACHE_TTL_SECS", "86400"))
+EXTRACT_CACHE_TABLE = os.environ.get("EXTRACT_CACHE_TABLE", "")   # empty = memory only
+
+_EXTRACT_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_EXTRACT_STATS = {"memory_hit": 0, "ddb_hit": 0, "miss": 0, "evicted": 0}
+_ddb = None
+
+def _extract_ddb():
+    global _ddb
+    if _ddb is None:
+        _ddb = _lazy_import("boto3").client("dynamodb")
+    return _ddb
+
+def extract_cache_key(chat: list[dict]) -> str:
+    turns = "\n".join(f"{m.get('role', 'user')}:{norm_text(m.get('content') or '')}" for m in chat)
+    raw = f"{turns}|{OPENAI_MODEL}|{today_date}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def extract_cache_stats() -> dict:
+    lookups = _EXTRACT_STATS["memory_hit"] + _EXTRACT_STATS["ddb_hit"] + _EXTRACT_STATS["miss"]
+    hits = lookups - _EXTRACT_STATS["miss"]
+    return {**_EXTRACT_STATS, "size": len(_EXTRACT_CACHE),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0}
+
+def _extract_cache_put_memory(key: str, parsed: dict, expires_at: float) -> None:
+    _EXTRACT_CACHE[key] = (expires_at, parsed)
+    _EXTRACT_CACHE.move_to_end(key)
+    while len(_EXTRACT_CACHE) > EXTRACT_CACHE_SIZE:
+        _EXTRACT_CACHE.popitem(last=False)
+        _EXTRACT_STATS["evicted"] += 1
+
+def extract_cache_get(key: str) -> dict | None:
+    now = time.time()
+    hit = _EXTRACT_CACHE.get(key)
+    if hit:
+        expires_at, parsed = hit
+        if expires_at > now:
+            _EXTRACT_CACHE.move_to_end(key)
+            _EXTRACT_STATS["memory_hit"] += 1
+            return json.loads(json.dumps(parsed))   # callers mutate; hand out a copy
+        del _EXTRACT_CACHE[key]
+        _EXTRACT_STATS["evicted"] += 1
+
+    if EXTRACT_CACHE_TABLE:
+        try:
+            item = _extract_ddb().get_item(
+                TableName=EXTRACT_CACHE_TABLE, Key={"cache_key": {"S": key}}
+            ).get("Item")
+            # DynamoDB TTL deletes lazily, so check expiry ourselves
+            if item and float(item["expires_at"]["N"]) > now:
+                parsed = json.loads(item["parsed"]["S"])
+                _extract_cache_put_memory(key, parsed, float(item["expires_at"]["N"]))
+                _EXTRACT_STATS["ddb_hit"] += 1
+                return json.loads(item["parsed"]["S"])
+        except Exception as e:
+            print("⚠️ Extract cache read failed:", e)
+
+    _EXTRACT_STATS["miss"] += 1
+    return None
+
+def extract_cache_put(key: str, parsed: dict) -> None:
+    expires_at = time.time() + EXTRACT_CACHE_TTL
+    _extract_cache_put_memory(key, json.loads(json.dumps(parsed)), expires_at)
+    if EXTRACT_CACHE_TABLE:
+        try:
+            _extract_ddb().put_item(TableName=EXTRACT_CACHE_TABLE, Item={
+                "cache_key": {"S": key},
+                "parsed": {"S": json.dumps(parsed)},
+                "model": {"S": OPENAI_MODEL},
+                "expires_at": {"N": str(int(expires_at))},
+            })
+        except Exception as e:
+            print("⚠️ Extract cache write failed:", e)
+
 
+def extract_calendar_from_messages(event: dict) -> dict:
     if not event.get("messages"):
         return event
 
-    # --- run GPT to extract events/terms (even if we have a fast path) ---
+    latest_msg = (event["messages"][-1].get("content") or "").lower()
+    force_add = _wants_add(latest_msg)
+
+    # --- 1) deterministic fast path: confident → no GPT round trip ---
+    fast, confidence = rule_based_intent(latest_msg)
+    if fast and confidence >= FAST_PATH_MIN_CONFIDENCE:
+        event.update(fast)
+        event["intent_path"] = "rules"
+        event["intent_confidence"] = confidence
+        print(f"⚡ Rule-based intent ({confidence:.2f}):", fast)
+        return event
+
+    # --- 2) ambiguous → GPT extracts events/terms (cached per phrasing + day) ---
     try:
-        messages = [{"role": "system", "content": system_prompt}] + event["messages"]
-        resp = client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=messages,
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
-        parsed = json.loads(resp.choices[0].message.content)
-        parsed = _normalize_parsed(parsed)
-        parsed = scrub_nones(parsed)
-        print("🤖 GPT parsed:", parsed)
-
-        # Merge but preserve our fast decisions
-        gpt_action = parsed.get("action") if isinstance(parsed, dict) else None
+        # key on exactly what GPT is sent, so earlier turns can't reuse a
+        # parse made for a different conversation
+        chat = event["messages"]
+        cache_key = extract_cache_key(chat)
+        parsed = extract_cache_get(cache_key)
+        if parsed is not None:
+            print("💾 GPT extraction cache hit:", extract_cache_stats())
+            event["intent_path"] = "llm_cache"
+        else:
+            messages = [{"role": "system", "content": system_prompt}] + chat
+            resp = get_openai_client().chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+            )
+            parsed = json.loads(resp.choices[0].message.content)
+            parsed = _normalize_parsed(parsed)
+            parsed = scrub_nones(parsed)
+            print("🤖 GPT parsed:", parsed)
+            if isinstance(parsed, dict):
+                extract_cache_put(cache_key, parsed)
+            event["intent_path"] = "llm"
+
         if isinstance(parsed, dict):
             event.update(parsed)
-
-        if fast_action:
-            event["action"] = fast_action
-            if fast_terms is not None:
-                event["terms"] = fast_terms
-            if fast_year is not None:
-                event["year"] = fast_year
-        elif gpt_action:
-            event["action"] = gpt_action
+        event["intent_confidence"] = confidence
 
         # If GPT returned events but forgot action → add
         if not event.get("action") and event.get("events"):
@@ -513,33 +1201,9 @@ def extract_calendar_from_messages(event: dict) -> dict:
 
 
 
-def _fetch_events_between(iso_min: str, iso_max: str, max_results: int = 3000):
-    service = init_calendar_service()
-    items, page_token = [], None
-    while True:
-        resp = service.events().list(
-            calendarId=CALENDAR_ID,
-            timeMin=iso_min,
-            timeMax=iso_max,
-            singleEvents=True,
-            orderBy="startTime",
-            pageToken=page_token,
-            maxResults=min(max_results, 250),
-        ).execute()
-        items.extend(resp.get("items", []))
-        page_token = resp.get("nextPageToken")
-        if not page_token or len(items) >= max_results:
-            break
-    # de-dupe + sort
-    seen, out = set(), []
-    for e in items:
-        eid = e.get("id")
-        if eid not in seen:
-            seen.add(eid); out.append(e)
-    out.sort(key=get_event_start)
-    return out
-
-LEAVE_TERMS = ("annual leave", "holiday", "holidays", "vacation", "leave")
+def _fetch_events_between(iso_min: str, iso_max: str, max_results: int = 3000,
+                          fields: str = EVENT_FIELDS["slim"]):
+    return _read_calendar_events(CALENDAR_ID, iso_min, iso_max, max_results, fields=fields)
 
 def _is_annual_leave_event(e: dict) -> bool:
     text = f"{(e.get('summary') or '').lower()} {(e.get('description') or '').lower()}"
@@ -568,43 +1232,64 @@ def _leave_units_for_event(e: dict, tz: str = DEFAULT_TZ) -> float:
     # Timed event → default to 1 day unless flagged as half-day above
     return 1.0
 
-def _fetch_events_between_all_cals(iso_min: str, iso_max: str, max_results: int = 3000):
-    service = init_calendar_service()
+# === Multi-calendar fetch (bounded thread pool) ===
+FETCH_WORKERS       = int(os.environ.get("CALENDAR_FETCH_WORKERS", "8"))
+CALENDAR_LIST_TTL   = float(os.environ.get("CALENDAR_LIST_TTL_SECS", "300"))
+
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="calfetch")
+_CAL_LIST_CACHE = {"items": None, "fetched_at": 0.0}
+
+def _list_calendars(service) -> list[dict]:
+    """calendarList is near-static; reuse it for CALENDAR_LIST_TTL_SECS on warm containers."""
+    if _CAL_LIST_CACHE["items"] is not None and time.time() - _CAL_LIST_CACHE["fetched_at"] < CALENDAR_LIST_TTL:
+        return _CAL_LIST_CACHE["items"]
 
-    # Get all calendars (skip Google’s holiday/birthday calendars)
     cals, page = [], None
     while True:
-        resp = service.calendarList().list(pageToken=page, minAccessRole="reader").execute()
+        resp = _execute(service.calendarList().list(pageToken=page, minAccessRole="reader"))
         cals.extend(resp.get("items", []))
         page = resp.get("nextPageToken")
         if not page: break
 
+    _CAL_LIST_CACHE.update({"items": cals, "fetched_at": time.time()})
+    return cals
+
+def _fetch_one_calendar(service, cal: dict, iso_min: str, iso_max: str, max_results: int | None, fields: str):
+    t0 = time.perf_counter()
+    cal_id = "primary" if cal.get("primary") else cal["id"]
+    evs = _read_calendar_events(cal_id, iso_min, iso_max, max_results, service=service, fields=fields)
+    # tag the calendar for debugging/trace (copies: mirror items are shared)
+    tagged = []
+    for e in evs:
+        e = dict(e)
+        e["_calendarId"] = cal["id"]
+        e["_calendarSummary"] = cal.get("summary")
+        tagged.append(e)
+    return tagged, (time.perf_counter() - t0) * 1000
+
+def _fetch_events_between_all_cals(iso_min: str, iso_max: str, max_results: int | None = None,
+                                   fields: str = EVENT_FIELDS["leave"]):
+    service = init_calendar_service()
+
+    # Get all calendars (skip Google’s holiday/birthday calendars)
+    cals = _list_calendars(service)
+
     def _skip_cal(c):
         summary = (c.get("summary") or "").lower()
         return "holiday" in summary or "birthday" in summary
 
-    items = []
-    for cal in (c for c in cals if not _skip_cal(c)):
-        cal_id = cal["id"]
-        page_token = None
-        while True:
-            resp = service.events().list(
-                calendarId=cal_id,
-                timeMin=iso_min,
-                timeMax=iso_max,
-                singleEvents=True,
-                orderBy="startTime",
-                pageToken=page_token,
-                maxResults=min(max_results, 250),
-            ).execute()
-            evs = resp.get("items", [])
-            # tag the calendar for debugging/trace
-            for e in evs:
-                e["_calendarId"] = cal_id
-                e["_calendarSummary"] = cal.get("summary")
-            items.extend(evs)
-            page_token = resp.get("nextPageToken")
-            if not page_token: break
+    # One worker per calendar; wall-clock ≈ slowest calendar instead of the sum
+    t0 = time.perf_counter()
+    futures = {
+        cal["id"]: _FETCH_POOL.submit(_fetch_one_calendar, service, cal, iso_min, iso_max, max_results, fields)
+        for cal in cals if not _skip_cal(cal)
+    }
+    items, timings = [], {}
+    for cal_id, fut in futures.items():
+        evs, ms = fut.result()
+        items.extend(evs)
+        timings[cal_id] = round(ms, 1)
+    print(f"⏱️ Calendars fetched in {(time.perf_counter() - t0) * 1000:.1f} ms:", timings)
 
     # De-dupe by (calendarId,id) + sort
     seen, out = set(), []
@@ -617,23 +1302,133 @@ def _fetch_events_between_all_cals(iso_min: str, iso_max: str, max_results: int
     return out
 
 
+# ==============================
+# === Event search index ===
+# Built once per fetched window: normalised text, stem sets and inverted
+# indexes (stem → events, token → events, and 1–3 char substring → tokens
+# for the substring rule). Terms are resolved through the postings first; loose_match_text's rules (substring, stem subset,
+# dr↔doctor, fuzzy) then only run on that candidate set. Fuzzy candidates
+# come from a length bound no event at or above the threshold can miss:
+# ratio = 2M/(|t|+|x|) with M <= min(|t|, |x|), so only texts with
+# th/(2-th)·|t| <= |x| <= (2-th)/th·|t| can reach it.
+# Same hits as the full loose_match_text scan (Testing-Folder/fuzzy-matcher-benchmark.py).
+STEM_SYNONYMS = {"dr": ("doctor",), "doctor": ("dr",)}
+
+def _event_search_text(e: dict) -> str:
+    return " ".join([
+        e.get("summary", "") or "",
+        e.get("description", "") or "",
+        e.get("location", "") or "",
+    ])
+
+class EventSearchIndex:
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.texts: list[str] = []
+        self.stems: list[set[str]] = []
+        self.by_stem: dict[str, set[int]] = {}
+        self.by_token: dict[str, set[int]] = {}
+        self.tokens_by_gram: dict[str, set[str]] = {}
+        self.lengths: list[int] = []           # sorted text lengths ...
+        self.by_length: list[int] = []         # ... and the event index of each
+        for i, e in enumerate(events):
+            text = norm_text(_event_search_text(e))
+            toks = WORD.findall(text)
+            stems = {stem(w) for w in toks}
+            self.texts.append(text)
+            self.stems.append(stems)
+            for w in toks:
+                self.by_token.setdefault(w, set()).add(i)
+            for st in stems:
+                for key in (st, *STEM_SYNONYMS.get(st, ())):
+                    self.by_stem.setdefault(key, set()).add(i)
+        for tok in self.by_token:
+            for n in (1, 2, 3):
+                for j in range(len(tok) - n + 1):
+                    self.tokens_by_gram.setdefault(tok[j:j + n], set()).add(tok)
+        order = sorted(range(len(self.texts)), key=lambda i: len(self.texts[i]))
+        self.lengths = [len(self.texts[i]) for i in order]
+        self.by_length = order
+
+    def _tokens_containing(self, tt: str) -> set[str]:
+        # a token containing tt contains each of tt's trigrams: intersect their
+        # token sets (rarest first), then confirm the full substring
+        if len(tt) <= 3:
+            return self.tokens_by_gram.get(tt, set())
+        grams = sorted((self.tokens_by_gram.get(tt[j:j + 3], set()) for j in range(len(tt) - 2)), key=len)
+        toks = set(grams[0])
+        for g in grams[1:]:
+            toks &= g
+            if not toks:
+                return toks
+        return {tok for tok in toks if tt in tok}
+
+    def _substring_candidates(self, term_tokens: list[str]) -> set[int]:
+        # every term token must sit inside some event token (ends may be partial)
+        out = None
+        for tt in term_tokens:
+            hits = set()
+            for tok in self._tokens_containing(tt):
+                hits |= self.by_token[tok]
+            out = hits if out is None else out & hits
+            if not out:
+                return set()
+        return out or set()
+
+    def _length_candidates(self, term_len: int, threshold: float) -> set[int]:
+        # ratio >= th needs 2·min(|t|, |x|) / (|t| + |x|) >= th
+        lo = math.ceil(term_len * threshold / (2 - threshold) - 1e-9)
+        hi = math.floor(term_len * (2 - threshold) / threshold + 1e-9)
+        first = bisect_left(self.lengths, lo)
+        last = bisect_left(self.lengths, hi + 1)
+        return set(self.by_length[first:last])
+
+    def _candidates(self, term_tokens: list[str], t_stems: set[str], term_len: int) -> set[int]:
+        if not term_tokens:
+            return set(range(len(self.events)))   # punctuation-only term: substring check only
+        cands = self._substring_candidates(term_tokens)
+        # stem subset (+ synonyms) and the doctor/dentist special cases
+        for st in t_stems:
+            cands |= self.by_stem.get(st, set())
+        # fuzzy only looks at events that could clear the threshold
+        cands |= self._length_candidates(term_len, FUZZY_THRESHOLD)
+        return cands
+
+    def search(self, terms: list[str]) -> list[dict]:
+        hit: set[int] = set()
+        for t in terms:
+            t_norm = norm_text(str(t or ""))
+            if not t_norm:
+                continue
+            term_tokens = WORD.findall(t_norm)
+            t_stems = {stem(w) for w in term_tokens}
+            for i in self._candidates(term_tokens, t_stems, len(t_norm)) - hit:
+                if _loose_match_prepared(t_norm, t_stems, self.texts[i], self.stems[i]):
+                    hit.add(i)
+        return [self.events[i] for i in sorted(hit)]
+
+_INDEX_CACHE: dict = {"key": None, "index": None}
+
+def event_search_index(events: list[dict]) -> EventSearchIndex:
+    """Reuse the index while the fetched window (ids + searchable text) is unchanged."""
+    key = hash(tuple((e.get("id"), _event_search_text(e)) for e in events))
+    if _INDEX_CACHE["key"] != key:
+        _INDEX_CACHE.update({"key": key, "index": EventSearchIndex(events)})
+    return _INDEX_CACHE["index"]
+
+
 def find_matching_events(terms: list[str], days_back: int = 7, days_forward: int = 365):
-    events = _fetch_events_window(days_back, days_forward)
-    matches = []
-    for e in events:
-        combined = " ".join([
-            e.get("summary", "") or "",
-            e.get("description", "") or "",
-            e.get("location", "") or "",
-        ])
-        if any(loose_match_text(t, combined) for t in terms):
-            matches.append({
-                "summary": e.get("summary", "") or "",
-                "link": e.get("htmlLink"),
-                "start": e.get("start"),
-                "id": e.get("id"),
-            })
-    return matches
+    events = _fetch_events_window(days_back, days_forward, fields=EVENT_FIELDS["find"])
+    index = event_search_index(events)
+    return [
+        {
+            "summary": e.get("summary", "") or "",
+            "link": e.get("htmlLink"),
+            "start": e.get("start"),
+            "id": e.get("id"),
+        }
+        for e in index.search(terms)
+    ]
 
 
 def find_all(term_or_terms, horizon_years: int = 3):
@@ -656,24 +1451,122 @@ def find_next(search_terms, horizon_years=3):
     all_events = find_all(search_terms, horizon_years=horizon_years)
     return [all_events[0]] if all_events else []
 
-def add_events(events_data: dict | list[dict]) -> list[dict]:
+# === Inserts (batch endpoint + parallel fallback) ===
+# Multi-event adds go through one batch request per INSERT_BATCH_SIZE events
+# (Google caps a batch at 50). Every event gets its own ok/error result.
+# Events the batch couldn't answer, or that hit 429/5xx, are retried as
+# single inserts on the bounded fetch pool.
+INSERT_BATCH_SIZE = int(os.environ.get("CALENDAR_BATCH_SIZE", "50"))
+INSERT_USE_BATCH  = os.environ.get("CALENDAR_BATCH", "true").lower() == "true"
+RETRYABLE_STATUS  = {429, 500, 502, 503, 504}
+
+def idempotent_event_id(body: dict, calendar_id: str = CALENDAR_ID) -> str:
+    """
+    Deterministic Google event id: hash of calendar + summary + start.
+    Hex digits are valid base32hex, so a retried add hits 409 instead of
+    creating a duplicate.
+    """
+    start = body.get("start") or {}
+    raw = f"{calendar_id}|{norm_text(body.get('summary', ''))}|{start.get('dateTime') or start.get('date') or ''}"
+    return "kai" + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:40]
+
+def _resolve_conflict(service, body: dict) -> dict:
+    """409 on our own id → the event is already there (or was deleted: restore it)."""
+    try:
+        existing = _execute(service.events().get(calendarId=CALENDAR_ID, eventId=body["id"]))
+        if existing.get("status") == "cancelled":
+            restored = _execute(service.events().update(
+                calendarId=CALENDAR_ID, eventId=body["id"], body={**body, "status": "confirmed"}
+            ))
+            return _insert_result(body, restored)
+        result = _insert_result(body, existing)
+        result["already_exists"] = True
+        return result
+    except Exception as e:
+        return _insert_result(body, exc=e)
+
+def _http_status(exc) -> int | None:
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+def _insert_result(body: dict, created: dict | None = None, exc: Exception | None = None) -> dict:
+    if exc is None:
+        return {"ok": True, "event": created}
+    return {"ok": False, "event": body, "error": str(exc), "status": _http_status(exc)}
+
+def _insert_one(service, body: dict) -> dict:
+    try:
+        return _insert_result(body, _execute(service.events().insert(calendarId=CALENDAR_ID, body=body)))
+    except Exception as e:
+        return _insert_result(body, exc=e)
+
+def _insert_parallel(service, bodies: list[dict], idxs: list[int], results: list) -> None:
+    futures = {i: _FETCH_POOL.submit(_insert_one, service, bodies[i]) for i in idxs}
+    for i, fut in futures.items():
+        results[i] = fut.result()
+
+def _insert_batched(service, bodies: list[dict], results: list) -> None:
+    for chunk_start in range(0, len(bodies), INSERT_BATCH_SIZE):
+        chunk = range(chunk_start, min(chunk_start + INSERT_BATCH_SIZE, len(bodies)))
+
+        def _callback(request_id, response, exception):
+            i = int(request_id)
+            results[i] = _insert_result(bodies[i], response, exception)
+
+        batch = service.new_batch_http_request(callback=_callback)
+        for i in chunk:
+            batch.add(service.events().insert(calendarId=CALENDAR_ID, body=bodies[i]), request_id=str(i))
+        try:
+            if _SERVICE_CACHE["creds"] is None:
+                batch.execute()
+            else:
+                batch.execute(http=_thread_http())
+        except Exception as e:
+            print(f"⚠️ Batch insert failed ({len(chunk)} events), falling back to single inserts:", e)
+
+def insert_events(bodies: list[dict]) -> list[dict]:
+    """Insert ready-made bodies. Returns one {ok, event, error?} per body, same order."""
     service = init_calendar_service()
+    results: list = [None] * len(bodies)
+    t0 = time.perf_counter()
+    if INSERT_USE_BATCH and len(bodies) > 1:
+        _insert_batched(service, bodies, results)
+
+    retry = [i for i, r in enumerate(results)
+             if r is None or (not r["ok"] and r.get("status") in RETRYABLE_STATUS)]
+    if retry:
+        _insert_parallel(service, bodies, retry, results)
+
+    conflicts = [i for i, r in enumerate(results) if not r["ok"] and r.get("status") == 409 and bodies[i].get("id")]
+    if conflicts:
+        futures = {i: _FETCH_POOL.submit(_resolve_conflict, service, bodies[i]) for i in conflicts}
+        for i, fut in futures.items():
+            results[i] = fut.result()
+        print(f"♻️ {len(conflicts)} event(s) already existed (idempotent retry)")
+
+    failed = sum(1 for r in results if not r["ok"])
+    print(f"🗓️ Inserted {len(bodies) - failed}/{len(bodies)} events in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return results
+
+def add_events_with_results(events_data: dict | list[dict]) -> list[dict]:
     if isinstance(events_data, dict):
         events_data = [events_data]
 
-    valid: list[dict] = []
+    bodies, invalid = [], []
     for raw in events_data:
         e = auto_fill_event(dict(raw))          # copy + enrich
         # minimal validation: need summary + start + end (date or dateTime)
         st, en = e.get("start", {}), e.get("end", {})
         if e.get("summary") and isinstance(st, dict) and isinstance(en, dict) and \
            (("dateTime" in st) or ("date" in st)) and (("dateTime" in en) or ("date" in en)):
-            valid.append(e)
+            e.setdefault("id", idempotent_event_id(e))
+            bodies.append(e)
+        else:
+            invalid.append({"ok": False, "event": e, "error": "Missing summary/start/end", "status": None})
 
-    created: list[dict] = []
-    for body in valid:
-        created.append(service.events().insert(calendarId=CALENDAR_ID, body=body).execute())
-    return created
+    return (insert_events(bodies) if bodies else []) + invalid
+
+def add_events(events_data: dict | list[dict]) -> list[dict]:
+    return [r["event"] for r in add_events_with_results(events_data) if r["ok"]]
 
 # ====================================================================================
 # === Build a full Google Calendar event from safe defaults and minimal GPT fields ===
@@ -759,6 +1652,14 @@ def _is_google_event_like(e: dict) -> bool:
 # === MAIN HANDLER ===
 # ====================
 def lambda_handler(event, context=None):
+    t0 = time.perf_counter()
+    try:
+        return _lambda_handler(event, context)
+    finally:
+        _report_startup((time.perf_counter() - t0) * 1000)
+
+
+def _lambda_handler(event, context=None):
     print("🚀 Running calendar lambda v2.1 with all-day fix")
     print("📥 Event received:", event)
 
@@ -786,6 +1687,15 @@ def lambda_handler(event, context=None):
     except ValueError as e:
         return _resp({"error": str(e)}, status=400)
 
+    # 3) run the action; report which path decided it (rules / llm / direct)
+    intent_path = event.get("intent_path", "direct")
+    print(f"🧭 Intent path: {intent_path} → {event.get('action')}")
+    response = handle_action(event)
+    response["headers"]["X-Intent-Path"] = intent_path
+    return response
+
+
+def handle_action(event: dict) -> dict:
     action = event.get("action")
 
     try:
@@ -809,30 +1719,14 @@ def lambda_handler(event, context=None):
             if any(t in search_terms for t in LEAVE_TERMS):
                 tz_now = datetime.now(ZoneInfo(DEFAULT_TZ))
 
-                future = []
-                # search this year and next 2 years
+                next_leave = None
+                # this year, then the next 2 – stop at the first year with a future leave
                 for year_offset in range(0, 3):
                     iso_min, iso_max = year_bounds(tz_now.year + year_offset)
-                    events = _fetch_events_between_all_cals(iso_min, iso_max)
-
-                    leave_events = [e for e in events if _is_annual_leave_event(e)]
-                    leave_events.sort(key=get_event_start)
-
-                    for e in leave_events:
-                        st = get_event_start(e)
-                        try:
-                            st_dt = datetime.fromisoformat(
-                                st.replace("Z", "+00:00")
-                            ).astimezone(ZoneInfo(DEFAULT_TZ))
-                            if st_dt >= tz_now:
-                                future.append(e)
-                        except Exception:
-                            continue
-
-                    if future:
-                        break  # stop once we find any future ones
-
-                next_leave = future[0] if future else None
+                    timeline = EventTimeline(_fetch_events_between_all_cals(iso_min, iso_max))
+                    next_leave = timeline.next_after(tz_now.timestamp(), pred=_is_annual_leave_event)
+                    if next_leave:
+                        break
                 return _resp({"event": slim(next_leave) if next_leave else None})
 
             # Normal find_next (non-leave)
@@ -891,8 +1785,16 @@ def lambda_handler(event, context=None):
                     "rejected": rejected
                 }, status=200)
 
-            # 3) create in Google Calendar
-            created = add_events(safe_events)
+            # 3) create in Google Calendar (batched); per-event failures → rejected
+            results = add_events_with_results(safe_events)
+            created = [r["event"] for r in results if r["ok"]]
+            rejected.extend({**r["event"], "error": r["error"]} for r in results if not r["ok"])
+
+            if not created:
+                return _resp({
+                    "error": "Google Calendar rejected every event.",
+                    "rejected": rejected
+                }, status=200)
 
             # 4) format for UI
             def _fmt(e):
@@ -912,11 +1814,12 @@ def lambda_handler(event, context=None):
 
             cards = [
                 {
-                    "title": e.get("summary", "Untitled event"),
-                    "subtitle": _fmt(e),
-                    "link": e.get("htmlLink", "")
+                    "title": r["event"].get("summary", "Untitled event"),
+                    "subtitle": _fmt(r["event"]),
+                    "link": r["event"].get("htmlLink", ""),
+                    "already_exists": bool(r.get("already_exists")),
                 }
-                for e in created
+                for r in results if r["ok"]
             ]
 
             return _resp({
@@ -1009,3 +1912,9 @@ def lambda_handler(event, context=None):
     except Exception as e:
         print("❌ Error:", repr(e))
         return _resp({"error": str(e)}, status=500)
+
+    finally:
+        print("📊 Calendar service cache:", calendar_cache_stats())
+
+
+_STARTUP_REPORT["module_init_ms"] = round((time.perf_counter() - _MODULE_T0) * 1000, 1)
@@ -0,0 +1,95 @@
+"""
+Response-streaming host for the chat Lambda (lambda_function_v3.stream_handler).
+
+Managed Python Lambdas hand back one buffered body, so the streamed chat runs
+under AWS Lambda Web Adapter instead: the function starts this server, LWA
+forwards each function-URL request to it and, in response_stream mode,
+relays the chunked body to the browser as frames are written.
+
+Deploy (a second function from the same Lambda-OpenAI package + shared layer):
+  • layer    LambdaAdapterLayerX86 (arn:aws:lambda:<region>:753240598075:layer:LambdaAdapterLayerX86:<ver>)
+  • handler  run.sh
+  • env      AWS_LAMBDA_EXEC_WRAPPER=/opt/bootstrap, AWS_LWA_INVOKE_MODE=response_stream
+             (+ the chat Lambda's own: OPENAI_API_KEY, SESSION_TABLE, ...)
+  • function URL with InvokeMode RESPONSE_STREAM → VITE_CHAT_STREAM_URL in the UI
+
+Routes:
+  • GET  /   – readiness check (LWA polls it before the first request)
+  • POST /   – chat body as for lambda_handler → text/event-stream frames;
+               a failure before the first frame is a JSON 500 (_error_body)
+
+Run locally:  python Lambda-OpenAI/chat_stream_server.py   (PORT, default 8080)
+"""
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import lambda_function_v3 as chat
+
+PORT = int(os.environ.get("PORT", os.environ.get("AWS_LWA_PORT", "8080")))
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Methods": "OPTIONS,POST",
+}
+
+
+class ChatStreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # chunked transfer needs 1.1
+
+    def _send_json(self, body_obj: dict, status: int = 200) -> None:
+        data = json.dumps(body_obj).encode("utf-8")
+        self.send_response(status)
+        for k, v in {"Content-Type": "application/json", **CORS_HEADERS}.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_OPTIONS(self):
+        self._send_json({"ok": True})
+
+    def do_GET(self):
+        self._send_json({"ok": True})
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0)).decode("utf-8")
+        event = {"httpMethod": "POST", "headers": dict(self.headers), "body": raw}
+        started = []
+
+        def write(frame: str) -> None:
+            if not started:   # status line waits for the first frame, so early failures can still 500
+                started.append(True)
+                self.send_response(200)
+                for k, v in {"Content-Type": "text/event-stream", "Cache-Control": "no-cache", **CORS_HEADERS}.items():
+                    self.send_header(k, v)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+            self._chunk(frame.encode("utf-8"))
+
+        try:
+            chat.stream_handler(event, write)
+        except Exception as e:
+            if not started:
+                self._send_json(chat._error_body(e), status=500)
+                return
+            print("❌ Stream aborted after first frame:", repr(e))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def log_message(self, fmt, *args):
+        print("🌐", fmt % args)
+
+
+def make_server(port: int = PORT, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    return ThreadingHTTPServer((host, port), ChatStreamHandler)
+
+
+if __name__ == "__main__":
+    print(f"🚀 Chat stream server on :{PORT}")
+    make_server().serve_forever()
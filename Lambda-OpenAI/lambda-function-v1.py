@@ -9,6 +9,8 @@ from zoneinfo import ZoneInfo
 import openai
 import boto3
 
+from intent_router import IntentRouter   # shared layer (Lambda-Shared)
+
 # === Config ===
 DEFAULT_TZ = "Europe/London"
 ISO_DATE = "%Y-%m-%d"
@@ -196,14 +198,18 @@ def resolve_relative_weekday(question: str, now_dt: datetime) -> str | None:
         target_dt = same_or_next_weekday_this_week(now_dt, target_idx)
     return target_dt.strftime("%A %d %B %Y")
 
+# v1's own phrase set (narrower than intent_router.GET_PATTERNS: no "what is on",
+# "show all", "all events", "show everything")
 GET_PATTERNS = (
     "what's on", "whats on", "show my calendar", "do i have anything",
     "any events", "what do i have", "what's my day", "whats my day",
     "what's on friday", "whats on friday", "show events", "list events"
 )
+GET_ROUTER = IntentRouter({"get": GET_PATTERNS})
+
 def wants_calendar_get(text: str) -> bool:
     q = (text or "").lower()
-    return any(p in q for p in GET_PATTERNS)
+    return "get" in GET_ROUTER.route(q)
 
 def _resp(body_obj: dict, status: int = 200):
     return {
@@ -1,6 +1,5 @@
 import json
 import os
-import tempfile
 import datetime as dt
 import time
 import re
@@ -10,11 +9,15 @@ from zoneinfo import ZoneInfo
 from difflib import SequenceMatcher
 
 import boto3
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from calendar_discovery import calendar_discovery_doc   # shared layer (Lambda-Shared)
 from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
 # from google.oauth2 import service_account
 import openai
 
+from intent_router import IntentRouter
+
 # === Config ===
 ISO_DATE = "%Y-%m-%d"
 HM_TIME = "%H:%M"
@@ -90,16 +93,48 @@ def _resp(body_obj: dict, status: int = 200):
     }
 
 # === Token & Service ===
-def load_token_from_s3():
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
-        s3.download_fileobj(S3_BUCKET, S3_TOKEN_KEY, tmp)
-        tmp.flush()
-        creds = Credentials.from_authorized_user_file(tmp.name, SCOPES)
-    return creds
+# calendar.v3.json ships in the shared layer (calendar_discovery): parsed once
+# per container and the built resource reused; credentials are refreshed only
+# once expired. The S3 token's ETag is re-checked every TOKEN_ETAG_CHECK_SECS
+# and a rotated token rebuilds the service.
+TOKEN_ETAG_CHECK_SECS = int(os.environ.get("TOKEN_ETAG_CHECK_SECS", "300"))
+
+_SERVICE_CACHE = {"creds": None, "service": None, "etag": None, "etag_checked_at": 0.0}
+
+def _load_token_with_etag():
+    """Single GET: returns (creds, etag) without touching /tmp."""
+    obj = s3.get_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY)
+    info = json.loads(obj["Body"].read())
+    return Credentials.from_authorized_user_info(info, SCOPES), obj.get("ETag")
+
+def _token_etag_changed() -> bool:
+    now = time.time()
+    if now - _SERVICE_CACHE["etag_checked_at"] < TOKEN_ETAG_CHECK_SECS:
+        return False
+    _SERVICE_CACHE["etag_checked_at"] = now
+    try:
+        etag = s3.head_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY).get("ETag")
+    except Exception as e:
+        # keep serving the cached creds; Google will reject them if truly stale
+        print("⚠️ Token ETag check failed:", e)
+        return False
+    return etag != _SERVICE_CACHE["etag"]
 
 def init_calendar_service():
-    creds = load_token_from_s3()
-    return build("calendar", "v3", credentials=creds)
+    creds = _SERVICE_CACHE["creds"]
+    if creds is None or _token_etag_changed():
+        if creds is not None:
+            print("🔁 Token ETag changed in S3, rebuilding service with the new credentials")
+        creds, etag = _load_token_with_etag()
+        _SERVICE_CACHE.update({
+            "creds": creds,
+            "service": build_from_document(calendar_discovery_doc(), credentials=creds),
+            "etag": etag,
+            "etag_checked_at": time.time(),
+        })
+    if not creds.valid and creds.refresh_token:
+        creds.refresh(Request())
+    return _SERVICE_CACHE["service"]
 
 # def get_calendar_service():
 #     creds = service_account.Credentials.from_service_account_file(
@@ -397,14 +432,18 @@ def _normalize_parsed(parsed: dict) -> dict:
     return parsed
 
 
+LEAVE_SUM_ROUTER = IntentRouter({
+    "sum": ("add up", "total", "sum", "how much", "how many"),
+    "leave": ("annual leave", "holidays", "holiday", "vacation"),
+})
+
 def extract_calendar_from_messages(event: dict) -> dict:
     # heuristic nudge in case GPT didn't set the action
     if not event.get("action"):
-        user_text = " ".join(
-            m.get("content","") for m in event.get("messages", []) if m.get("role") == "user"
-        ).lower()
-        if any(k in user_text for k in ("add up", "total", "sum", "how much", "how many")) and \
-        any(t in user_text for t in ("annual leave", "holidays", "holiday", "vacation")):
+        # latest user turn only – an old "add up my leave" must not stick
+        user_msgs = [m for m in event.get("messages", []) if m.get("role") == "user"]
+        user_text = (user_msgs[-1].get("content", "") if user_msgs else "").lower()
+        if {"sum", "leave"} <= LEAVE_SUM_ROUTER.route(user_text):
             event["action"] = "sum_annual_leave"
 
 
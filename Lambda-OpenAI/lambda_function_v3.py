@@ -1,16 +1,34 @@
 import os
 import json
 import time
+import math
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from typing import Callable, Iterator
 import uuid
 
 import openai
 
+from session_store import get_session_store
+from intent_router import CHAT_ROUTER
+
+try:
+    import tiktoken   # optional: exact counts when bundled, chars/4 estimate otherwise
+except ImportError:
+    tiktoken = None
+
 # === Config ===
 DEFAULT_TZ = "Europe/London"
 OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
 
+# History window: system prompt + newest turns must fit HISTORY_TOKEN_BUDGET;
+# older turns are folded into a rolling summary of ≤ SUMMARY_MAX_TOKENS.
+HISTORY_TOKEN_BUDGET = int(os.environ.get("HISTORY_TOKEN_BUDGET", "3000"))
+SUMMARY_MAX_TOKENS   = int(os.environ.get("SUMMARY_MAX_TOKENS", "250"))
+SUMMARY_CACHE_SIZE   = int(os.environ.get("SUMMARY_CACHE_SIZE", "256"))
+
 # === Init OpenAI ===
 # Uses the new SDK pattern like you had
 client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
@@ -30,6 +48,10 @@ def _resp(body_obj: dict, status: int = 200):
         "body": json.dumps(body_obj),
     }
 
+def _sse(obj: dict) -> str:
+    """One Server-Sent Events frame."""
+    return f"data: {json.dumps(obj)}\n\n"
+
 def _parse_body(event) -> dict:
     """Parse API Gateway body safely. Returns {} on failure."""
     if not isinstance(event, dict):
@@ -45,12 +67,8 @@ def _parse_body(event) -> dict:
             return {"messages": [{"role": "user", "content": raw}]}
     return {}
 
-def _normalize_messages(payload: dict) -> list[dict]:
-    """
-    Expect payload like { messages: [{role, content}, ...] }
-    If a single 'text' is provided, wrap it into a user message.
-    Always returns a well-formed list for OpenAI.
-    """
+def _request_messages(payload: dict) -> list[dict]:
+    """The turns the client actually sent ([] when it sent none)."""
     msgs = payload.get("messages")
     if isinstance(msgs, list) and all(isinstance(m, dict) for m in msgs):
         return msgs
@@ -58,25 +76,22 @@ def _normalize_messages(payload: dict) -> list[dict]:
     text = payload.get("text") or payload.get("message") or ""
     if isinstance(text, str) and text.strip():
         return [{"role": "user", "content": text.strip()}]
+    return []
 
+def _normalize_messages(payload: dict) -> list[dict]:
+    """
+    Expect payload like { messages: [{role, content}, ...] }
+    If a single 'text' is provided, wrap it into a user message.
+    Always returns a well-formed list for OpenAI.
+    """
     # Last resort: empty chat
-    return [{"role": "user", "content": "Hello"}]
-
-# === Lambda handler (CHAT ONLY) ===
-def lambda_handler(event, context):
-    print("🔵 Event received:", event)
-    print("🔵 Raw Event:", json.dumps(event, indent=2, default=str))
-
-    # Handle preflight or quick warmups gracefully
-    if event.get("httpMethod") == "OPTIONS":
-        return _resp({"ok": True})
-
-    body = _parse_body(event)
-
-    # lightweight healthcheck/warmup knob (optional)
-    if body.get("ping") in ("health", "warmup"):
-        return _resp({"ok": True, "ts": time.time()})
+    return _request_messages(payload) or [{"role": "user", "content": "Hello"}]
 
+# === Chat turn ===
+def _prepare_chat(body: dict) -> tuple[list[dict], dict | None]:
+    """Build the GPT messages. Returns (messages, canned) – canned is a ready
+    {"reply": ...} when the turn is answered without GPT (testing / nudges);
+    messages is then empty and the session store is never touched."""
     now_ldn = datetime.now(ZoneInfo(DEFAULT_TZ))
     today_str = now_ldn.strftime("%Y-%m-%d (%A)")
 
@@ -88,36 +103,277 @@ def lambda_handler(event, context):
     )
 
     user_messages = _normalize_messages(body)
-    messages = [{"role": "system", "content": system_prompt}] + user_messages
 
-    # 👉 Intent nudge check (before GPT call)
+    # 👉 Intent nudge check (before GPT call – and before any session read)
     latest = user_messages[-1]["content"].lower() if user_messages else ""
+    canned = _canned_reply(CHAT_ROUTER.route(latest))
+    if canned is not None:
+        return [], canned
+
+    messages = [{"role": "system", "content": system_prompt}] + _session_history(body) + user_messages
+    return messages, None
 
-    # ✅ Add this block here
-    if "testing" in latest:
-        return _resp({
+def _canned_reply(hits: set[str]) -> dict | None:
+    if "testing" in hits:
+        return {
             "reply": (
                 "✅ kAI confirmed chat testing.\n"
                 "Lambda ARN: arn:aws:lambda:eu-west-2:123456789012:function:chat-lambda"
             )
-        })
+        }
 
-    if "calendar" in latest or "schedule" in latest or "add event" in latest:
-        return _resp({
+    if "calendar" in hits:
+        return {
             "reply": "📅 Looks like you want to add to the calendar. "
                      "Hit the Calendar tab at the top and send again."
-        })
-    if "todo" in latest:
-        return _resp({
+        }
+    if "todo" in hits:
+        return {
             "reply": "📝 Looks like this belongs in your To-Do list. "
                      "Switch to the To-Do tab and resend."
-        })
-    if "note" in latest:
-        return _resp({
+        }
+    if "note" in hits:
+        return {
             "reply": "🗒️ Looks like you want to save a note. "
                      "Switch to the Notes tab and resend."
-        })
+        }
+    return None
+
+# === Session history ===
+# With a session_id the client sends only the new turn(s); earlier turns come
+# from the session store and the finished turn is appended after the reply.
+# Store errors (including no SESSION_TABLE) fall back to no history.
+def _session_history(body: dict) -> list[dict]:
+    session_id = body.get("session_id")
+    if not session_id:
+        return []
+    try:
+        history = get_session_store().load(session_id)
+    except Exception as e:
+        print("⚠️ Session load failed, continuing without history:", repr(e))
+        return []
+    print(f"🗂️ Session {session_id}: {len(history)} stored turns")
+    return history
+
+def _remember_turn(body: dict, reply: str) -> None:
+    session_id = body.get("session_id")
+    turns = _request_messages(body)   # never the "Hello" placeholder
+    if not session_id or not turns:
+        return
+    try:
+        get_session_store().append(session_id, *turns, {"role": "assistant", "content": reply})
+    except Exception as e:
+        print("⚠️ Session append failed:", repr(e))
+
+def _error_body(e: Exception) -> dict:
+    err_id = str(uuid.uuid4())
+    print(f"❌ Error ID {err_id}: {repr(e)}")
+    return {
+        "reply": f"⚠️ Chat error (ID {err_id}): something went wrong.",
+        "error_id": err_id,
+        "calendar_list": [],
+        "calendar_event": None,
+        "calendar_invoke_status": {"error": str(e)}
+    }
+
+def stream_chat(messages: list[dict], context: dict | None = None,
+                on_reply: Callable[[str], None] | None = None) -> Iterator[str]:
+    """
+    Stream a GPT reply as SSE frames:
+      data: {"delta": "..."}                  – one per token chunk
+      data: {"done": true, "reply": "...", "context": {...}}
+                                              – final frame, same body as the JSON mode
+    Errors before the first chunk raise (the host answers 5xx); once frames
+    have gone out they can only arrive as a final frame with "error_id".
+    """
+    parts = []
+    try:
+        stream = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            temperature=0.5,
+            stream=True,
+        )
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield _sse({"delta": delta})
+    except Exception as e:
+        if not parts:
+            raise
+        yield _sse({"done": True, "partial": "".join(parts), **_error_body(e)})
+        return
+
+    reply = "".join(parts)
+    print("🧠 GPT RAW REPLY (streamed):", repr(reply))
+    if on_reply is not None:
+        on_reply(reply)
+    yield _sse({"done": True, "reply": reply, "context": context or {}})
+
+# === Streaming entry point ===
+# Python Lambdas can't flush a response mid-invocation (native response
+# streaming is Node-only), so chat_stream_server.py hosts this behind Lambda
+# Web Adapter on a RESPONSE_STREAM function URL. `write` is called with each
+# SSE frame as soon as it exists; exceptions mean nothing was written yet.
+def stream_handler(event, write: Callable[[str], None]) -> None:
+    body = _parse_body(event)
+    messages, canned = _prepare_chat(body)
+    if canned is not None:
+        write(_sse({"done": True, **canned}))
+        return
+    messages, context = fit_history(messages)
+    for frame in stream_chat(messages, context, on_reply=lambda r: _remember_turn(body, r)):
+        write(frame)
+
+# === Token counting ===
+MESSAGE_OVERHEAD_TOKENS = 4   # role + separators per chat message
+_ENCODING = {"enc": None, "loaded": False}
+
+def _encoding():
+    if not _ENCODING["loaded"]:
+        _ENCODING["loaded"] = True
+        if tiktoken is not None:
+            try:
+                _ENCODING["enc"] = tiktoken.encoding_for_model(OPENAI_MODEL)
+            except Exception:
+                _ENCODING["enc"] = tiktoken.get_encoding("cl100k_base")
+    return _ENCODING["enc"]
+
+def token_counter_name() -> str:
+    return "tiktoken" if _encoding() is not None else "chars/4"
+
+def count_tokens(text: str) -> int:
+    enc = _encoding()
+    if enc is not None:
+        return len(enc.encode(text or ""))
+    return math.ceil(len(text or "") / 4)
+
+def message_tokens(m: dict) -> int:
+    content = m.get("content")
+    if not isinstance(content, str):
+        content = json.dumps(content, default=str)
+    return count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+# === Rolling summary ===
+# Keyed by a hash chain over the folded turns, so when one more turn falls out
+# of the window we extend the longest cached summary instead of re-reading
+# the whole conversation.
+_SUMMARY_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SUMMARY_STATS = {"hit": 0, "extend": 0, "fail": 0}
+
+def _chain_keys(turns: list[dict]) -> list[str]:
+    keys, h = [], ""
+    for m in turns:
+        h = hashlib.sha256(f"{h}|{m.get('role')}|{m.get('content')}".encode("utf-8")).hexdigest()
+        keys.append(h)
+    return keys
+
+def _summarize(previous: str, turns: list[dict]) -> str:
+    transcript = "\n".join(f"{m.get('role')}: {m.get('content')}" for m in turns)
+    prompt = (
+        "Update the running summary of this conversation with the new turns. "
+        "Keep names, dates, decisions and open questions. Be brief.\n\n"
+        f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+    )
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0,
+        max_tokens=SUMMARY_MAX_TOKENS,
+    )
+    return (response.choices[0].message.content or "").strip()
+
+def rolling_summary(folded: list[dict]) -> str | None:
+    """Summary of `folded` (oldest first), reusing the longest cached prefix."""
+    keys = _chain_keys(folded)
+    if keys[-1] in _SUMMARY_CACHE:
+        _SUMMARY_STATS["hit"] += 1
+        _SUMMARY_CACHE.move_to_end(keys[-1])
+        return _SUMMARY_CACHE[keys[-1]]
+
+    start, previous = 0, ""
+    for i in range(len(keys) - 2, -1, -1):
+        if keys[i] in _SUMMARY_CACHE:
+            start, previous = i + 1, _SUMMARY_CACHE[keys[i]]
+            break
+    try:
+        summary = _summarize(previous, folded[start:])
+    except Exception as e:
+        _SUMMARY_STATS["fail"] += 1
+        print("⚠️ History summary failed, older turns dropped:", repr(e))
+        return None
+    _SUMMARY_STATS["extend"] += 1
+    _SUMMARY_CACHE[keys[-1]] = summary
+    while len(_SUMMARY_CACHE) > SUMMARY_CACHE_SIZE:
+        _SUMMARY_CACHE.popitem(last=False)
+    return summary
+
+# === History window ===
+def fit_history(messages: list[dict], budget: int | None = None) -> tuple[list[dict], dict]:
+    """
+    Keep leading system message(s) + the newest turns within `budget` tokens
+    (the latest turn is always kept). Older turns become one summary message.
+    Returns (messages_for_gpt, report) – report goes back to the client.
+    """
+    budget = HISTORY_TOKEN_BUDGET if budget is None else budget
+    n_system = 0
+    while n_system < len(messages) and messages[n_system].get("role") == "system":
+        n_system += 1
+    system, turns = messages[:n_system], messages[n_system:]
+    costs = [message_tokens(m) for m in turns]
+    total = sum(message_tokens(m) for m in system) + sum(costs)
+
+    report = {"counter": token_counter_name(), "budget": budget, "input_tokens": total,
+              "trimmed_messages": 0, "trimmed_tokens": 0, "summary_tokens": 0, "prompt_tokens": total}
+    if total <= budget or len(turns) <= 1:
+        return messages, report
+
+    # reserve room for the summary that replaces whatever falls out
+    room = budget - sum(message_tokens(m) for m in system) - SUMMARY_MAX_TOKENS - MESSAGE_OVERHEAD_TOKENS
+    keep_from, used = len(turns) - 1, costs[-1]
+    while keep_from > 0 and used + costs[keep_from - 1] <= room:
+        keep_from -= 1
+        used += costs[keep_from]
+
+    folded, kept = turns[:keep_from], turns[keep_from:]
+    summary = rolling_summary(folded)
+    summary_msgs = ([{"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"}]
+                    if summary else [])
+
+    out = system + summary_msgs + kept
+    report.update({
+        "trimmed_messages": len(folded),
+        "trimmed_tokens": sum(costs[:keep_from]),
+        "summary_tokens": sum(message_tokens(m) for m in summary_msgs),
+        "prompt_tokens": sum(message_tokens(m) for m in out),
+    })
+    print(f"✂️ History window: {report}")
+    return out, report
+
+# === Lambda handler (CHAT ONLY) ===
+def lambda_handler(event, context):
+    print("🔵 Event received:", event)
+    print("🔵 Raw Event:", json.dumps(event, indent=2, default=str))
+
+    # Handle preflight or quick warmups gracefully
+    if event.get("httpMethod") == "OPTIONS":
+        return _resp({"ok": True})
+
+    body = _parse_body(event)
+
+    # lightweight healthcheck/warmup knob (optional)
+    if body.get("ping") in ("health", "warmup"):
+        return _resp({"ok": True, "ts": time.time()})
+
+    # JSON only – streamed replies are served by chat_stream_server.py
+    messages, canned = _prepare_chat(body)
+    if canned is not None:
+        return _resp(canned)
 
+    messages, context = fit_history(messages)
     try:
         response = client.chat.completions.create(
             model=OPENAI_MODEL,
@@ -126,15 +382,8 @@ def lambda_handler(event, context):
         )
         reply = response.choices[0].message.content or ""
         print("🧠 GPT RAW REPLY:", repr(reply))
-        return _resp({"reply": reply})
+        _remember_turn(body, reply)
+        return _resp({"reply": reply, "context": context})
 
     except Exception as e:
-        err_id = str(uuid.uuid4())
-        print(f"❌ Error ID {err_id}: {repr(e)}")
-        return _resp({
-            "reply": f"⚠️ Chat error (ID {err_id}): something went wrong.",
-            "error_id": err_id,
-            "calendar_list": [],
-            "calendar_event": None,
-            "calendar_invoke_status": {"error": str(e)}
-        }, status=500)
+        return _resp(_error_body(e), status=500)
@@ -0,0 +1,3 @@
+#!/bin/sh
+# Lambda Web Adapter entry (handler: run.sh) – see chat_stream_server.py
+exec python3 chat_stream_server.py
@@ -0,0 +1,51 @@
+"""
+Google Calendar v3 discovery document, shared by the calendar, token and
+OpenAI v2 Lambdas.
+
+    from calendar_discovery import calendar_discovery_doc
+    service = build_from_document(calendar_discovery_doc(), credentials=creds)
+
+calendar.v3.json ships once, next to this file in the shared Lambda layer
+(Lambda-Shared → /opt/python), and is parsed once per container. If it is
+missing, the static copy inside google-api-python-client is used – still no
+network fetch. With neither available the call fails with the paths tried.
+"""
+import json
+import os
+import threading
+
+# === Config ===
+CALENDAR_DISCOVERY_DOC = os.environ.get(
+    "CALENDAR_DISCOVERY_DOC",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "calendar.v3.json"),
+)
+
+_DOC = {"doc": None}
+_LOCK = threading.Lock()
+
+
+def calendar_discovery_doc() -> dict:
+    """Parsed discovery document (cached for the container's lifetime)."""
+    with _LOCK:
+        if _DOC["doc"] is None:
+            _DOC["doc"] = json.loads(_read_doc())
+        return _DOC["doc"]
+
+
+def _read_doc() -> str:
+    if os.path.exists(CALENDAR_DISCOVERY_DOC):
+        with open(CALENDAR_DISCOVERY_DOC, encoding="utf-8") as f:
+            return f.read()
+    print(f"⚠️ {CALENDAR_DISCOVERY_DOC} not bundled, using googleapiclient's static copy")
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+        text = get_static_doc("calendar", "v3")
+    except ImportError:
+        text = None
+    if not text:
+        raise FileNotFoundError(
+            f"Calendar discovery document not found: {CALENDAR_DISCOVERY_DOC} is missing and "
+            "google-api-python-client has no static calendar v3 copy (deploy the shared layer "
+            "or set CALENDAR_DISCOVERY_DOC)"
+        )
+    return text
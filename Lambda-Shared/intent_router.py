@@ -0,0 +1,125 @@
+"""
+Keyword intent routing shared by the chat, calendar and OpenAI Lambdas.
+
+Every phrase of every intent is compiled into ONE regex – a prefix-trie
+alternation – and scanned left to right in one pass, reporting the longest
+phrase at each position where any phrase starts. Shorter phrases that
+start at the same position (e.g. "add" inside "add up") are covered by a
+precomputed prefix closure, so the result equals running every
+`any(p in q for p in PHRASES)` check separately. Tiny routers (the chat
+nudges) keep per-phrase `in` checks behind the same route() API.
+
+Two match modes per intent:
+  • substring – `phrase in text`                               (the default)
+  • word      – `text.startswith(phrase) or f" {phrase} " in text`
+                (the calendar's ADD_WORDS rule)
+
+Callers pass text already lowercased/normalised the way their old checks did.
+Deployed as part of the shared Lambda layer (Lambda-Shared → /opt/python).
+"""
+import re
+from typing import Iterable
+
+# Below this many phrases, CPython's C-level `in` per phrase beats any
+# single regex pass (see Testing-Folder/intent-router-benchmark.py).
+SMALL_SET_PHRASES = 8
+
+# === Shared phrase sets ===
+TESTING_WORDS = ("testing",)
+CALENDAR_NUDGE = ("calendar", "schedule", "add event")
+TODO_NUDGE = ("todo",)
+NOTE_NUDGE = ("note",)
+
+ADD_WORDS = ("add", "schedule", "book", "remind", "+")
+SUM_WORDS = ("sum up", "add up", "how many", "how much", "total", "count")
+LEAVE_TERMS = ("annual leave", "holiday", "holidays", "vacation", "leave")
+GET_PATTERNS = (
+    "what's on", "whats on", "what is on", "show my calendar", "do i have anything",
+    "any events", "what do i have", "what's my day", "whats my day",
+    "show events", "list events", "show everything", "show all", "all events",
+)
+
+
+def _trie_regex(phrases: Iterable[str]) -> str:
+    """Longest-first alternation factored into a prefix trie, so the regex
+    engine rejects most positions on their first character."""
+    trie: dict = {}
+    for p in phrases:
+        node = trie
+        for ch in p:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        end = "" in node
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # greedy "?" keeps longest-first: try the longer phrase, else stop here
+        return f"(?:{body})?" if end else body
+
+    return emit(trie)
+
+
+class IntentRouter:
+    def __init__(self, intents: dict[str, Iterable[str]], word_intents: dict[str, Iterable[str]] | None = None):
+        # phrase → [(intent, word_mode)]
+        owners: dict[str, list[tuple[str, bool]]] = {}
+        for word_mode, table in ((False, intents), (True, word_intents or {})):
+            for intent, phrases in table.items():
+                for p in phrases:
+                    owners.setdefault(p, []).append((intent, word_mode))
+        self.intents = sorted({i for table in (intents, word_intents or {}) for i in table})
+
+        # prefix closure: matching phrase L at i implies every phrase P with
+        # L.startswith(P) also starts at i (its own boundary check still applies)
+        phrases = sorted(owners, key=len, reverse=True)
+        self._closure = {
+            long_p: [(len(p), intent, word_mode)
+                     for p in phrases if long_p.startswith(p)
+                     for intent, word_mode in owners[p]]
+            for long_p in phrases
+        }
+        self._pattern = re.compile(_trie_regex(phrases)) if phrases else None
+        self._small = [(p, owners[p]) for p in phrases] if len(phrases) <= SMALL_SET_PHRASES else None
+
+    def route(self, text: str) -> set[str]:
+        """All intents whose phrases occur in `text` (one regex pass)."""
+        hits: set[str] = set()
+        if not text or self._pattern is None:
+            return hits
+        if self._small is not None:
+            for p, owned in self._small:
+                if p in text:
+                    for intent, word_mode in owned:
+                        if not word_mode or text.startswith(p) or f" {p} " in text:
+                            hits.add(intent)
+            return hits
+        search = self._pattern.search
+        m = search(text)
+        while m is not None:
+            i = m.start()
+            for length, intent, word_mode in self._closure[m.group()]:
+                if intent in hits:
+                    continue
+                if not word_mode or i == 0 or (text[i - 1] == " " and text[i + length:i + length + 1] == " "):
+                    hits.add(intent)
+            # restart one char later (not after the match) so overlapping
+            # phrases are still seen; the engine skips ahead by first char
+            m = search(text, i + 1)
+        return hits
+
+
+# === Prebuilt routers ===
+CHAT_ROUTER = IntentRouter({
+    "testing": TESTING_WORDS,
+    "calendar": CALENDAR_NUDGE,
+    "todo": TODO_NUDGE,
+    "note": NOTE_NUDGE,
+})
+
+CALENDAR_ROUTER = IntentRouter(
+    {"testing": TESTING_WORDS, "sum": SUM_WORDS, "leave": LEAVE_TERMS, "get": GET_PATTERNS},
+    word_intents={"add": ADD_WORDS},
+)
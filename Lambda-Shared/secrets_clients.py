@@ -0,0 +1,121 @@
+"""
+Secrets Manager values and API clients, cached per Lambda container.
+
+    from secrets_clients import get_openai_key, openai_call
+    reply = openai_call(lambda client: client.chat.completions.create(...))
+
+  • Secret values are kept in memory for SECRETS_TTL_SECS, then re-read, so a
+    warm container makes no Secrets Manager call per request but still picks
+    up a rotated key within the TTL.
+  • One OpenAI client is reused while the key is unchanged; it keeps its
+    HTTP connection pool (keep-alive) across invocations.
+  • openai_call() retries once with a freshly read key when OpenAI rejects
+    the cached one (key rotated before the TTL ran out).
+
+Thread-safe: the upload processor calls GPT from a worker pool.
+Deployed as part of the shared Lambda layer (Lambda-Shared → /opt/python).
+"""
+import json
+import os
+import threading
+import time
+
+# === Config ===
+SECRETS_TTL_SECS     = float(os.environ.get("SECRETS_TTL_SECS", "900"))
+OPENAI_SECRET_ID     = os.environ.get("OPENAI_SECRET_ID", "openai/api-key")
+OPENAI_SECRET_FIELD  = os.environ.get("OPENAI_SECRET_FIELD", "OPENAI_API_KEY")
+OPENAI_TIMEOUT_SECS  = float(os.environ.get("OPENAI_TIMEOUT_SECS", "30"))
+
+
+# === Secrets Manager cache ===
+class SecretCache:
+    def __init__(self, ttl_secs: float = SECRETS_TTL_SECS):
+        self.ttl_secs = ttl_secs
+        self._values: dict[str, tuple[str, float]] = {}   # secret_id → (value, fetched_at)
+        self._lock = threading.Lock()
+        self._client = None
+        self.fetches = 0
+
+    def _sm(self):
+        if self._client is None:
+            import boto3
+            self._client = boto3.client("secretsmanager")
+        return self._client
+
+    def get(self, secret_id: str, refresh: bool = False) -> str:
+        """SecretString, from memory unless older than the TTL (or refresh=True)."""
+        with self._lock:
+            cached = self._values.get(secret_id)
+            if cached and not refresh and time.monotonic() - cached[1] < self.ttl_secs:
+                return cached[0]
+            # one fetch under the lock – parallel workers don't stampede
+            value = self._sm().get_secret_value(SecretId=secret_id)["SecretString"]
+            self.fetches += 1
+            self._values[secret_id] = (value, time.monotonic())
+            print(f"🔑 Secret '{secret_id}' {'refreshed' if cached else 'loaded'}")
+            return value
+
+    def get_field(self, secret_id: str, field: str, refresh: bool = False) -> str:
+        return json.loads(self.get(secret_id, refresh))[field]
+
+    def invalidate(self, secret_id: str | None = None) -> None:
+        with self._lock:
+            if secret_id is None:
+                self._values.clear()
+            else:
+                self._values.pop(secret_id, None)
+
+
+_SECRETS = SecretCache()
+
+def get_secret_cache() -> SecretCache:
+    return _SECRETS
+
+def get_openai_key(refresh: bool = False) -> str:
+    return _SECRETS.get_field(OPENAI_SECRET_ID, OPENAI_SECRET_FIELD, refresh)
+
+
+# === OpenAI client (one per key) ===
+_CLIENT = {"client": None, "key": None, "factory": None}
+_CLIENT_LOCK = threading.Lock()
+
+def get_openai_client(refresh: bool = False):
+    """Shared client; rebuilt only when the key changes."""
+    key = get_openai_key(refresh)
+    with _CLIENT_LOCK:
+        if _CLIENT["client"] is None or _CLIENT["key"] != key:
+            factory = _CLIENT["factory"]
+            if factory is None:
+                from openai import OpenAI
+                factory = OpenAI
+            _CLIENT["client"] = factory(api_key=key, timeout=OPENAI_TIMEOUT_SECS)
+            _CLIENT["key"] = key
+            print("🤖 OpenAI client created")
+        return _CLIENT["client"]
+
+def set_openai_factory(factory) -> None:
+    """Swap the client class (harnesses / tests); drops the cached client."""
+    with _CLIENT_LOCK:
+        _CLIENT.update(client=None, key=None, factory=factory)
+
+def _is_auth_error(e: Exception) -> bool:
+    try:
+        import openai
+        if isinstance(e, openai.AuthenticationError):
+            return True
+    except (ImportError, AttributeError, TypeError):
+        pass
+    return getattr(e, "status_code", None) == 401
+
+def openai_call(fn):
+    """
+    fn(client) with the shared client. On 401 (key rotated since it was
+    cached) the secret is re-read and fn retried once with the new key.
+    """
+    try:
+        return fn(get_openai_client())
+    except Exception as e:
+        if not _is_auth_error(e):
+            raise
+        print("🔑 OpenAI rejected the cached key – refreshing secret and retrying once")
+        return fn(get_openai_client(refresh=True))
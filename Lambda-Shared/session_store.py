@@ -0,0 +1,159 @@
+"""
+Conversation session store for the chat Lambda.
+
+The browser sends only the newest turn plus a `session_id`; the Lambda loads
+the earlier turns from here and appends the new ones once the turn is done.
+The UI also sends `session_id` to the calendar endpoint, which ignores it:
+calendar extraction only ever sees the newest turn.
+
+Backends (SESSION_BACKEND):
+  • "dynamodb" – table SESSION_TABLE, partition key `session_id` (S). Each
+                 message is one JSON string in the `history` list, appended
+                 with list_append (no read-modify-write). `expires_at` is
+                 the table's TTL attribute.
+  • "file"     – one JSON file (SESSION_FILE), for local runs and harnesses.
+
+Defaults to "dynamodb"; without SESSION_TABLE get_session_store() raises
+instead of quietly writing to /tmp (the chat logs it and answers without
+history). The file backend must be asked for.
+Deployed as part of the shared Lambda layer (Lambda-Shared → /opt/python).
+"""
+import json
+import os
+import threading
+import time
+
+# === Config ===
+SESSION_TABLE        = os.environ.get("SESSION_TABLE", "")
+SESSION_BACKEND      = os.environ.get("SESSION_BACKEND", "dynamodb")
+SESSION_FILE         = os.environ.get("SESSION_FILE", "/tmp/kai-sessions.json")
+SESSION_TTL_SECS     = int(os.environ.get("SESSION_TTL_SECS", str(7 * 24 * 3600)))
+SESSION_MAX_MESSAGES = int(os.environ.get("SESSION_MAX_MESSAGES", "200"))
+
+
+def compact_message(m: dict) -> dict:
+    """Only what OpenAI needs – drops UI ids, timestamps, etc."""
+    return {"role": m.get("role", "user"), "content": m.get("content", "")}
+
+
+# === DynamoDB backend ===
+class DynamoSessionStore:
+    def __init__(self, table: str, ttl_secs: int = SESSION_TTL_SECS, max_messages: int = SESSION_MAX_MESSAGES):
+        import boto3
+        self.table = table
+        self.ttl_secs = ttl_secs
+        self.max_messages = max_messages
+        self.ddb = boto3.client("dynamodb")
+
+    def _key(self, session_id: str) -> dict:
+        return {"session_id": {"S": session_id}}
+
+    def load(self, session_id: str) -> list[dict]:
+        item = self.ddb.get_item(
+            TableName=self.table,
+            Key=self._key(session_id),
+            ConsistentRead=True,
+            ProjectionExpression="history, expires_at",
+        ).get("Item")
+        if not item:
+            return []
+        # DynamoDB TTL deletes lazily (up to days later) – treat as gone now
+        if int(item.get("expires_at", {}).get("N", "0")) < time.time():
+            self.clear(session_id)
+            return []
+        return [json.loads(v["S"]) for v in item.get("history", {}).get("L", [])]
+
+    def append(self, session_id: str, *messages: dict) -> int:
+        """Append turns in one UpdateItem; returns the new history length."""
+        new = [{"S": json.dumps(compact_message(m), ensure_ascii=False)} for m in messages]
+        resp = self.ddb.update_item(
+            TableName=self.table,
+            Key=self._key(session_id),
+            UpdateExpression="SET history = list_append(if_not_exists(history, :empty), :new), expires_at = :exp",
+            ExpressionAttributeValues={
+                ":empty": {"L": []},
+                ":new": {"L": new},
+                ":exp": {"N": str(int(time.time()) + self.ttl_secs)},
+            },
+            ReturnValues="UPDATED_NEW",
+        )
+        history = resp.get("Attributes", {}).get("history", {}).get("L", [])
+        if len(history) > self.max_messages:
+            self.ddb.update_item(
+                TableName=self.table,
+                Key=self._key(session_id),
+                UpdateExpression="SET history = :h",
+                ExpressionAttributeValues={":h": {"L": history[-self.max_messages:]}},
+            )
+            return self.max_messages
+        return len(history)
+
+    def clear(self, session_id: str) -> None:
+        self.ddb.delete_item(TableName=self.table, Key=self._key(session_id))
+
+
+# === Local JSON-file backend ===
+class FileSessionStore:
+    def __init__(self, path: str, ttl_secs: int = SESSION_TTL_SECS, max_messages: int = SESSION_MAX_MESSAGES):
+        self.path = path
+        self.ttl_secs = ttl_secs
+        self.max_messages = max_messages
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, data: dict) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def load(self, session_id: str) -> list[dict]:
+        with self._lock:
+            item = self._read().get(session_id)
+        if not item or item["expires_at"] < time.time():
+            return []
+        return item["history"]
+
+    def append(self, session_id: str, *messages: dict) -> int:
+        with self._lock:
+            data = self._read()
+            now = time.time()
+            data = {k: v for k, v in data.items() if v["expires_at"] >= now}
+            item = data.setdefault(session_id, {"history": []})
+            item["history"] = (item["history"] + [compact_message(m) for m in messages])[-self.max_messages:]
+            item["expires_at"] = int(now) + self.ttl_secs
+            self._write(data)
+            return len(item["history"])
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            data = self._read()
+            if data.pop(session_id, None) is not None:
+                self._write(data)
+
+
+# === Factory (one store per container) ===
+_STORE = {"store": None}
+
+def get_session_store():
+    if _STORE["store"] is None:
+        if SESSION_BACKEND == "dynamodb":
+            if not SESSION_TABLE:
+                raise RuntimeError("SESSION_TABLE is not set (use SESSION_BACKEND=file for local runs)")
+            _STORE["store"] = DynamoSessionStore(SESSION_TABLE)
+        elif SESSION_BACKEND == "file":
+            _STORE["store"] = FileSessionStore(SESSION_FILE)
+        else:
+            raise RuntimeError(f"Unknown SESSION_BACKEND: {SESSION_BACKEND!r}")
+        print(f"🗂️ Session store: {SESSION_BACKEND}")
+    return _STORE["store"]
+
+def set_session_store(store) -> None:
+    """Swap the backend (harnesses / tests)."""
+    _STORE["store"] = store
@@ -1,10 +1,12 @@
 import json
 import os
-import tempfile
+import time
 import datetime as dt
 import boto3
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from calendar_discovery import calendar_discovery_doc   # shared layer (Lambda-Shared)
 from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
 
 # === ENV VARS ===
 S3_BUCKET    = os.environ.get("S3_BUCKET_NAME", "gpt-assistant-static-web-app")
@@ -15,20 +17,65 @@ CALENDAR_ID  = os.environ.get("CALENDAR_ID", "primary")
 # === CONSTANTS ===
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
+# Partial response for internal scans only (find_next ranks by start, then
+# fetches the winner in full); actions that return events send them unprojected
+SCAN_FIELDS = "nextPageToken,items(id,start)"
+
 # === S3 CLIENT ===
 s3 = boto3.client("s3")
 
 # === Token & Service ===
-def load_token_from_s3():
-    with tempfile.NamedTemporaryFile(delete=False) as tmp:
-        s3.download_fileobj(S3_BUCKET, S3_TOKEN_KEY, tmp)
-        tmp.flush()
-        creds = Credentials.from_authorized_user_file(tmp.name, SCOPES)
-    return creds
+# calendar.v3.json ships in the shared layer (calendar_discovery): parsed once
+# per container and the built resource reused; credentials are refreshed only
+# once expired. The S3 token's ETag is re-checked every TOKEN_ETAG_CHECK_SECS
+# and a rotated token rebuilds the service.
+TOKEN_ETAG_CHECK_SECS = int(os.environ.get("TOKEN_ETAG_CHECK_SECS", "300"))
+
+_SERVICE_CACHE = {"creds": None, "service": None, "etag": None, "etag_checked_at": 0.0}
+
+def _load_token_with_etag():
+    """Single GET: returns (creds, etag) without touching /tmp."""
+    obj = s3.get_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY)
+    info = json.loads(obj["Body"].read())
+    return Credentials.from_authorized_user_info(info, SCOPES), obj.get("ETag")
+
+def _token_etag_changed() -> bool:
+    now = time.time()
+    if now - _SERVICE_CACHE["etag_checked_at"] < TOKEN_ETAG_CHECK_SECS:
+        return False
+    _SERVICE_CACHE["etag_checked_at"] = now
+    try:
+        etag = s3.head_object(Bucket=S3_BUCKET, Key=S3_TOKEN_KEY).get("ETag")
+    except Exception as e:
+        # keep serving the cached creds; Google will reject them if truly stale
+        print("⚠️ Token ETag check failed:", e)
+        return False
+    return etag != _SERVICE_CACHE["etag"]
+
+# Load tests / offline runs point this at a fake Calendar (Testing-Folder/fake_google_calendar.py)
+_SERVICE_OVERRIDE = {"service": None}
+
+def set_calendar_service(service) -> None:
+    """Serve every Calendar call from `service` (None → back to Google)."""
+    _SERVICE_OVERRIDE["service"] = service
 
 def init_calendar_service():
-    creds = load_token_from_s3()
-    return build("calendar", "v3", credentials=creds)
+    if _SERVICE_OVERRIDE["service"] is not None:
+        return _SERVICE_OVERRIDE["service"]
+    creds = _SERVICE_CACHE["creds"]
+    if creds is None or _token_etag_changed():
+        if creds is not None:
+            print("🔁 Token ETag changed in S3, rebuilding service with the new credentials")
+        creds, etag = _load_token_with_etag()
+        _SERVICE_CACHE.update({
+            "creds": creds,
+            "service": build_from_document(calendar_discovery_doc(), credentials=creds),
+            "etag": etag,
+            "etag_checked_at": time.time(),
+        })
+    if not creds.valid and creds.refresh_token:
+        creds.refresh(Request())
+    return _SERVICE_CACHE["service"]
 
 # === Color logic (annual leave/work -> RED, else YELLOW) ===
 COLOR_KEYWORDS = {
@@ -78,9 +125,11 @@ def year_bounds(year: int) -> tuple[str, str]:
 def get_events(time_min: str | None = None,
                time_max: str | None = None,
                max_results: int = 500,
-               q: str | None = None):
+               q: str | None = None,
+               fields: str | None = None):
     """
     Pull events (paginated). If q is provided, uses Google API server-side search.
+    `fields` is a partial-response projection for internal scans.
     Returns events sorted by startTime.
     """
     service = init_calendar_service()
@@ -94,6 +143,8 @@ def get_events(time_min: str | None = None,
         orderBy="startTime",
         maxResults=min(max_results, 250),  # per page limit
     )
+    if fields:
+        kwargs["fields"] = fields
     if time_max:
         kwargs["timeMax"] = time_max
     if q:
@@ -105,7 +156,12 @@ def get_events(time_min: str | None = None,
     while True:
         if page_token:
             kwargs["pageToken"] = page_token
-        resp = service.events().list(**kwargs).execute()
+        req = service.events().list(**kwargs)
+        # Google only gzips when both headers ask for it
+        req.headers["accept-encoding"] = "gzip, deflate"
+        if "gzip" not in req.headers.get("user-agent", ""):
+            req.headers["user-agent"] = (req.headers.get("user-agent", "") + " (gzip)").strip()
+        resp = req.execute()
         batch = resp.get("items", [])
         items.extend(batch)
         remaining -= len(batch)
@@ -154,12 +210,16 @@ def find_next(term_or_terms, horizon_years: int = 3):
         results = get_events(time_min=to_rfc3339(now),
                              time_max=to_rfc3339(end),
                              max_results=1000,
-                             q=term)
+                             q=term,
+                             fields=SCAN_FIELDS)
         matches.extend(results)
 
     # Sort by start time
     matches.sort(key=lambda e: e.get("start", {}).get("dateTime", "9999"))
-    return matches[0] if matches else None
+    if not matches:
+        return None
+    return init_calendar_service().events().get(calendarId=CALENDAR_ID,
+                                                eventId=matches[0]["id"]).execute()
 
 
 # === Response helper ===
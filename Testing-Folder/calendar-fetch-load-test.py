@@ -0,0 +1,158 @@
+"""
+Load test for the Calendar fetch paths against fake_google_calendar.
+
+Paths under load (each run by --concurrency threads for --requests calls):
+  • window    – lambda_calendar_v3._fetch_events_window(31, 365)
+  • all_cals  – lambda_calendar_v3._fetch_events_between_all_cals(this year)
+  • token     – Lambda-Token get_events(this year, max_results=2500)
+
+The fake answers with --api-ms (+ --jitter-ms) latency per round trip and
+fails --error-rate of calls with 429/503, in-process or (--http) on
+localhost behind the real googleapiclient. --mode live switches the calendar
+Lambda's mirror off and drops its window cache before every call, so each
+request lists from the API like a cold container; --mode mirror (default)
+keeps the mirror on with a syncToken delta per request.
+
+Reported per path: throughput, p50 / p95 / max latency, failed calls and
+the API calls the fake saw.
+
+Run:  python Testing-Folder/calendar-fetch-load-test.py --events 20000 --api-ms 80 --concurrency 8
+      python Testing-Folder/calendar-fetch-load-test.py --mode live --error-rate 0.05 --http
+(the token Lambda imports googleapiclient at module level; without it that path is skipped)
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-Calendar"))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+os.environ.setdefault("OPENAI_API_KEY", "load-test-not-used")
+os.environ.setdefault("SESSION_BACKEND", "file")
+
+import local_aws  # noqa: E402
+local_aws.install()   # the token Lambda builds its S3 client at import
+
+import lambda_calendar_v3 as cal  # noqa: E402
+from fake_google_calendar import FakeGoogleCalendar  # noqa: E402
+
+try:
+    tok = local_aws.load_lambda(HERE.parent / "Lambda-Token" / "lambda-function.py", "token_lambda")
+except ImportError as e:
+    print(f"⚠️ Token Lambda not loaded ({e}) – 'token' path skipped")
+    tok = None
+
+
+def _year_bounds() -> tuple[str, str]:
+    year = datetime.now(timezone.utc).year
+    return f"{year}-01-01T00:00:00Z", f"{year + 1}-01-01T00:00:00Z"
+
+def _paths(mode: str) -> dict:
+    lo, hi = _year_bounds()
+
+    def fresh():
+        if mode == "live":
+            cal._WINDOW_CACHE.clear()
+
+    def window():
+        fresh()
+        return cal._fetch_events_window(31, 365)
+
+    def all_cals():
+        fresh()
+        return cal._fetch_events_between_all_cals(lo, hi)
+
+    paths = {"window": window, "all_cals": all_cals}
+    if tok is not None:
+        paths["token"] = lambda: tok.get_events(lo, hi, max_results=2500)
+    return paths
+
+
+def _pct(samples: list[float], p: float) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, max(0, round(p * (len(s) - 1))))] if s else 0.0
+
+def run_path(fake: FakeGoogleCalendar, fn, requests: int, concurrency: int) -> dict:
+    before = dict(fake.stats)
+    samples, failures, sizes = [], [], []
+    lock = threading.Lock()
+
+    def one(_):
+        t0 = time.perf_counter()
+        try:
+            n = len(fn())
+            ok = True
+        except Exception as e:
+            n, ok = 0, False
+            err = f"{type(e).__name__}: {getattr(getattr(e, 'resp', None), 'status', e)}"
+        ms = (time.perf_counter() - t0) * 1000
+        with lock:
+            samples.append(ms)
+            sizes.append(n)
+            if not ok:
+                failures.append(err)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    wall = time.perf_counter() - t0
+    calls = {k: v - before.get(k, 0) for k, v in fake.stats.items() if v != before.get(k, 0)}
+    return {"rps": requests / wall, "p50": _pct(samples, 0.5), "p95": _pct(samples, 0.95), "max": max(samples),
+            "failed": len(failures), "errors": sorted(set(failures)), "events": max(sizes), "api_calls": calls}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--events", type=int, default=10000)
+    ap.add_argument("--requests", type=int, default=40, help="calls per path")
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--api-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=20.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--mode", choices=("mirror", "live"), default="mirror")
+    ap.add_argument("--http", action="store_true", help="serve the fake on localhost behind googleapiclient")
+    ap.add_argument("--paths", nargs="+", help="subset of: window all_cals token")
+    ap.add_argument("--verbose", action="store_true", help="keep the Lambdas' own logging")
+    args = ap.parse_args()
+
+    if not args.verbose:
+        cal.print = lambda *a, **k: None
+    cal.MIRROR_ENABLED = args.mode == "mirror"
+    cal.MIRROR_FRESH_SECS = 0.0
+
+    fake = FakeGoogleCalendar.synthetic(args.events, latency_ms=args.api_ms, jitter_ms=args.jitter_ms,
+                                        error_rate=args.error_rate)
+    paths = {k: v for k, v in _paths(args.mode).items() if not args.paths or k in args.paths}
+    print(f"📅 {sum(len(c.live) for c in fake.calendars.values())} events, {args.mode} mode, "
+          f"API {args.api_ms:g}+{args.jitter_ms:g} ms, errors {args.error_rate:.0%}"
+          f"{' over HTTP' if args.http else ''}, {args.requests} calls × {args.concurrency} threads per path")
+
+    with (fake.serve() if args.http else nullcontext()) as url:
+        service = fake.http_service(url) if url else fake.service()
+        cal.set_calendar_service(service)
+        if tok is not None:
+            tok.set_calendar_service(service)
+
+        print(f"\n   {'path':<9} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'failed':>7} {'events':>7}  API calls")
+        for name, fn in paths.items():
+            r = run_path(fake, fn, args.requests, args.concurrency)
+            calls = ", ".join(f"{k}×{v}" for k, v in sorted(r["api_calls"].items()))
+            print(f"   {name:<9} {r['rps']:7.1f} {r['p50']:8.1f} {r['p95']:8.1f} {r['max']:8.1f} "
+                  f"{r['failed']:7d} {r['events']:7d}  {calls}")
+            for err in r["errors"]:
+                print(f"   {'':<9} ↳ {err}")
+
+        cal.set_calendar_service(None)
+        if tok is not None:
+            tok.set_calendar_service(None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
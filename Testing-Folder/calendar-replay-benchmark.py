@@ -0,0 +1,227 @@
+"""
+Offline replay benchmark for the calendar Lambda (Lambda-Calendar/lambda_calendar_v3.py).
+
+Runs lambda_handler end to end with no network:
+  • Google Calendar – fake_google_calendar.FakeGoogleCalendar plugged in
+                      through cal.set_calendar_service(), in-process or
+                      (--http) behind the real googleapiclient on localhost,
+                      with optional API latency (--api-ms) and injected
+                      429/503s (--error-rate)
+  • OpenAI          – replies recorded in test_data/calendar-replay-openai.json,
+                      matched on the user's latest message
+
+The calendar is either a recording (--calendar-file, JSON
+{"calendars": [...], "events": {calendarId: [event, ...]}}) or a seeded
+synthetic one sized by --sizes. Each size starts from a cold service (full
+mirror sync, reported separately), then --iterations requests per action run
+round-robin, mixing direct payloads, rule-path and recorded-GPT chat messages.
+
+Reported per action: p50 / p95 / max of lambda_handler wall time, the
+intent paths seen and, with --error-rate, how many requests did not get a
+200. The run FAILS (exit 1) when any p95 exceeds --max-p95-ms,
+or exceeds a saved baseline (--baseline) by more than --tolerance.
+
+Run:  python Testing-Folder/calendar-replay-benchmark.py --sizes 100 1000 10000 50000
+      python Testing-Folder/calendar-replay-benchmark.py --save-baseline /tmp/cal-baseline.json
+      python Testing-Folder/calendar-replay-benchmark.py --baseline /tmp/cal-baseline.json --tolerance 0.3
+      python Testing-Folder/calendar-replay-benchmark.py --sizes 10000 --api-ms 60 --error-rate 0.02 --http
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import types
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-Calendar"))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+os.environ.setdefault("OPENAI_API_KEY", "replay-not-used")
+os.environ.setdefault("SESSION_BACKEND", "file")
+
+import lambda_calendar_v3 as cal  # noqa: E402
+from fake_google_calendar import FakeGoogleCalendar  # noqa: E402
+
+RECORDED_GPT = HERE / "test_data" / "calendar-replay-openai.json"
+TZ = ZoneInfo(cal.DEFAULT_TZ)
+ACTIONS = ("get", "find", "find_next", "find_year", "add", "sum_annual_leave")
+
+
+# === Recorded OpenAI ===
+class ReplayOpenAI:
+    """chat.completions.create → the recorded reply for the latest user message."""
+    def __init__(self, path: Path):
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+        recorded.pop("_comment", None)
+        today = datetime.now(TZ).date()
+        dates = {"{friday}": self._next(today, 4), "{saturday}": self._next(today, 5)}
+        text = json.dumps(recorded)
+        for k, v in dates.items():
+            text = text.replace(k, v)
+        self.replies = json.loads(text)
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=self)
+
+    @staticmethod
+    def _next(today: date, weekday: int) -> str:
+        return (today + timedelta(days=(weekday - today.weekday()) % 7 or 7)).isoformat()
+
+    def create(self, model, messages, **_):
+        self.calls += 1
+        key = messages[-1]["content"].strip().lower()
+        if key not in self.replies:
+            raise KeyError(f"No recorded GPT reply for {key!r}")
+        msg = types.SimpleNamespace(content=json.dumps(self.replies[key]))
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=msg)])
+
+
+# === Requests per action (direct payloads + chat phrasings) ===
+def _chat(text: str) -> dict:
+    return {"body": json.dumps({"messages": [{"role": "user", "content": text}]})}
+
+def _direct(payload: dict) -> dict:
+    return {"body": json.dumps(payload)}
+
+def requests_for(action: str, i: int) -> dict:
+    day = (datetime.now(TZ) + timedelta(days=3 + i % 300)).date().isoformat()
+    variants = {
+        "get": [_direct({"action": "get", "days": 31}), _chat("what's on next week"),
+                _chat("show me everything this month")],
+        "find": [_direct({"action": "find", "terms": ["dentist"], "days": 365}),
+                 _chat("have i got anything with the physio coming up"), _chat("find my dentist appointments")],
+        "find_next": [_chat("when is my next dentist appointment"), _chat("when is my next annual leave")],
+        "find_year": [_direct({"action": "find_year", "terms": ["gym"]}), _chat("any gym sessions this year")],
+        "add": [_direct({"action": "add", "events": [{"summary": f"Replay event {i}", "start": f"{day}T10:00:00"}]}),
+                _direct({"action": "add", "events": [{"summary": f"Replay batch {i}-{k}", "start": f"{day}T1{k}:00:00"}
+                                                      for k in range(5)]}),
+                _chat("add team lunch on friday at 1pm"), _chat("put the car mot and a haircut in on saturday")],
+        "sum_annual_leave": [_direct({"action": "sum_annual_leave"}),
+                             _chat("how many days annual leave have i booked this year")],
+    }[action]
+    return variants[i % len(variants)]
+
+
+# === Run ===
+def _pct(samples: list[float], p: float) -> float:
+    s = sorted(samples)
+    return s[min(len(s) - 1, max(0, round(p * (len(s) - 1))))]
+
+def run_size(fake: FakeGoogleCalendar, iterations: int, url: str | None = None) -> dict:
+    cal.set_calendar_service(fake.http_service(url) if url else fake.service())
+    cal._EXTRACT_CACHE.clear()   # each size starts with a cold GPT extraction cache too
+    injected = bool(fake.error_rate)
+
+    t0 = time.perf_counter()
+    cold = cal.lambda_handler(_direct({"action": "get", "days": 31}))
+    cold_ms = (time.perf_counter() - t0) * 1000
+    assert injected or cold["statusCode"] == 200, cold
+
+    samples = {a: [] for a in ACTIONS}
+    paths = {a: {} for a in ACTIONS}
+    errors = {a: 0 for a in ACTIONS}
+    for i in range(iterations):
+        for action in ACTIONS:
+            event = requests_for(action, i)
+            t0 = time.perf_counter()
+            try:
+                resp = cal.lambda_handler(event)
+            except Exception as e:   # only reachable with injected API errors
+                if not injected:
+                    raise
+                resp = {"statusCode": 500, "headers": {}, "body": repr(e)}
+            samples[action].append((time.perf_counter() - t0) * 1000)
+            if resp["statusCode"] != 200:
+                assert injected, (action, event, resp["body"][:300])
+                errors[action] += 1
+            path = resp.get("headers", {}).get("X-Intent-Path", "?")
+            paths[action][path] = paths[action].get(path, 0) + 1
+
+    return {
+        "events": sum(len(c.live) for c in fake.calendars.values()),
+        "cold_ms": cold_ms,
+        "actions": {a: {"n": len(s), "p50": _pct(s, 0.5), "p95": _pct(s, 0.95), "max": max(s),
+                        "errors": errors[a], "paths": paths[a]}
+                    for a, s in samples.items()},
+        "api_calls": {k: v for k, v in fake.stats.items()},
+    }
+
+def check(report: dict, max_p95: float, baseline: dict | None, tolerance: float) -> list[str]:
+    failures = []
+    for size, res in report.items():
+        for action, m in res["actions"].items():
+            if m["p95"] > max_p95:
+                failures.append(f"{size} events / {action}: p95 {m['p95']:.1f} ms > {max_p95:.0f} ms")
+            base = ((baseline or {}).get(size) or {}).get("actions", {}).get(action)
+            if base and m["p95"] > base["p95"] * (1 + tolerance):
+                failures.append(f"{size} events / {action}: p95 {m['p95']:.1f} ms > baseline "
+                                f"{base['p95']:.1f} ms +{tolerance:.0%}")
+    return failures
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    ap.add_argument("--calendar-file", type=Path, help="recorded calendar JSON (replaces --sizes)")
+    ap.add_argument("--iterations", type=int, default=30, help="requests per action per size")
+    ap.add_argument("--fresh-secs", type=float, default=0.0,
+                    help="mirror freshness window (0 = a syncToken delta on every request, as for spaced-out requests)")
+    ap.add_argument("--api-ms", type=float, default=0.0, help="fake Calendar latency per API round trip")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="extra random latency, 0..N ms")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="share of API calls answered 429/503")
+    ap.add_argument("--http", action="store_true", help="serve the fake on localhost behind googleapiclient")
+    ap.add_argument("--max-p95-ms", type=float, default=500.0)
+    ap.add_argument("--baseline", type=Path)
+    ap.add_argument("--tolerance", type=float, default=0.25)
+    ap.add_argument("--save-baseline", type=Path)
+    ap.add_argument("--verbose", action="store_true", help="keep the Lambda's own logging")
+    args = ap.parse_args()
+
+    if not args.verbose:
+        cal.print = lambda *a, **k: None
+    cal.MIRROR_FRESH_SECS = args.fresh_secs
+    replay_gpt = ReplayOpenAI(RECORDED_GPT)
+    cal.client = replay_gpt
+
+    api = dict(latency_ms=args.api_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+    if args.calendar_file:
+        recorded = json.loads(args.calendar_file.read_text(encoding="utf-8"))
+        fakes = {"recorded": lambda: FakeGoogleCalendar.from_recording(recorded, **api)}
+    else:
+        fakes = {str(n): (lambda n=n: FakeGoogleCalendar.synthetic(n, **api)) for n in args.sizes}
+
+    report = {}
+    print(f"📅 Replay benchmark: {args.iterations} requests/action, mirror fresh {args.fresh_secs:g}s, "
+          f"API {args.api_ms:g}+{args.jitter_ms:g} ms, errors {args.error_rate:.0%}"
+          f"{' over HTTP' if args.http else ''}, p95 limit {args.max_p95_ms:.0f} ms")
+    for size, make_fake in fakes.items():
+        fake = make_fake()
+        with (fake.serve() if args.http else nullcontext()) as url:
+            res = run_size(fake, args.iterations, url)
+        report[size] = res
+        print(f"\n── {res['events']} events  (cold first request {res['cold_ms']:.0f} ms: full mirror sync)")
+        print(f"   {'action':<17} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'non-200':>8}  paths")
+        for action, m in res["actions"].items():
+            paths = ", ".join(f"{k}×{v}" for k, v in sorted(m["paths"].items()))
+            print(f"   {action:<17} {m['p50']:8.2f} {m['p95']:8.2f} {m['max']:8.2f} {m['errors']:8d}  {paths}")
+        print(f"   API calls: {res['api_calls']}")
+    print(f"\n🤖 Recorded GPT replies served: {replay_gpt.calls}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    failures = check(report, args.max_p95_ms, baseline, args.tolerance)
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2))
+        print(f"💾 Baseline saved to {args.save_baseline}")
+    if failures:
+        print("\n❌ FAIL")
+        for f in failures:
+            print("   •", f)
+        return 1
+    print("\n✅ PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
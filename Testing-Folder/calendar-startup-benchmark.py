@@ -0,0 +1,111 @@
+"""
+Calendar service startup benchmark.
+
+Compares what each invocation paid to get a Calendar service object:
+  • before – build("calendar", "v3", ...) on every invocation (parses the
+             discovery JSON and rebuilds the resource each time)
+  • after  – lambda_calendar_v3.init_calendar_service(): shared-layer
+             calendar.v3.json parsed once, resource reused while warm
+
+The S3 token download is replaced by in-memory credentials so only the
+discovery/build cost is measured. Needs google-api-python-client installed.
+
+Run:  python Testing-Folder/calendar-startup-benchmark.py --invocations 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-Calendar"))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-not-used")
+
+from google.oauth2.credentials import Credentials  # noqa: E402
+
+import calendar_discovery  # noqa: E402
+import lambda_calendar_v3 as cal  # noqa: E402
+
+
+def fake_creds() -> Credentials:
+    return Credentials(token="benchmark-token", scopes=cal.SCOPES)
+
+
+def _ms(samples: list[float]) -> str:
+    return f"mean {statistics.mean(samples):7.2f} ms, p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:7.2f} ms"
+
+
+# === Before: build() per invocation ===
+def bench_build_per_call(n: int) -> tuple[float, list[float]]:
+    t0 = time.perf_counter()
+    from googleapiclient.discovery import build
+    import_ms = (time.perf_counter() - t0) * 1000
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        build("calendar", "v3", credentials=fake_creds(), cache_discovery=False)
+        samples.append((time.perf_counter() - t0) * 1000)
+    return import_ms, samples
+
+
+# === After: bundled doc + cached factory ===
+def bench_factory(n: int) -> tuple[float, list[float]]:
+    cal._load_token_with_etag = lambda: (fake_creds(), '"bench-etag"')
+    cal.TOKEN_ETAG_CHECK_SECS = 10 ** 9   # no S3 HEAD during the run
+    calendar_discovery._DOC["doc"] = None
+    cal._STARTUP_REPORT["discovery_ms"] = None
+    cal._SERVICE_CACHE.update({"creds": None, "service": None, "etag": None, "etag_checked_at": 0.0})
+
+    t0 = time.perf_counter()
+    cal.init_calendar_service()
+    first_ms = (time.perf_counter() - t0) * 1000
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        cal.init_calendar_service()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return first_ms, samples
+
+
+# === Token rotation: a new ETag must rebuild the service ===
+def check_rotation() -> None:
+    old = cal.init_calendar_service()
+    new_creds = fake_creds()
+    cal._load_token_with_etag = lambda: (new_creds, '"rotated-etag"')
+    etag_changed, cal._token_etag_changed = cal._token_etag_changed, lambda: True
+    try:
+        rotated = cal.init_calendar_service()
+    finally:
+        cal._token_etag_changed = etag_changed
+    assert rotated is not old, "service reused across token rotation"
+    # batch parts authorise through the request's http, i.e. the service's own
+    assert rotated._http.credentials is new_creds, "rebuilt service still holds the old credentials"
+    print("🔁 Rotation: service rebuilt with the new credentials")
+
+
+def run(n: int) -> None:
+    bundled = os.path.exists(calendar_discovery.CALENDAR_DISCOVERY_DOC)
+    print(f"📄 Discovery doc: {calendar_discovery.CALENDAR_DISCOVERY_DOC} ({'bundled' if bundled else 'missing, static fallback'})")
+
+    import_ms, before = bench_build_per_call(n)
+    first_ms, after = bench_factory(n)
+
+    print(f"\n⏱️ {n} warm invocations")
+    print(f"  before  build() per call : {_ms(before)}   (googleapiclient import {import_ms:.1f} ms, once)")
+    print(f"  after   first call       : {first_ms:7.2f} ms   (parse doc {cal._STARTUP_REPORT['discovery_ms']} ms + build)")
+    print(f"  after   warm calls       : {_ms(after)}")
+    saved = statistics.mean(before) - statistics.mean(after)
+    print(f"\n📊 Saving per warm invocation: {saved:.2f} ms "
+          f"({statistics.mean(before) / max(statistics.mean(after), 1e-6):.0f}× faster)")
+    print("📊 Service cache:", cal.calendar_cache_stats())
+    check_rotation()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--invocations", type=int, default=50)
+    args = ap.parse_args()
+    run(args.invocations)
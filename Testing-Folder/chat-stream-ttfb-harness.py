@@ -0,0 +1,157 @@
+"""
+Time-to-first-byte harness for the chat Lambda (Lambda-OpenAI/lambda_function_v3.py).
+
+A fake OpenAI client stands in for the API: it waits --first-token-ms before
+the first chunk, then --token-ms per chunk (non-streaming calls wait for the
+whole completion). The harness compares:
+  • json    – lambda_handler, one {"reply": ...} body at the end
+  • stream  – chat_stream_server (the Lambda Web Adapter host) on localhost,
+              TTFB = first SSE frame read off the socket
+and checks that both modes produce the same final reply, and that an OpenAI
+failure before the first token is a 500 in both.
+
+Run:  python Testing-Folder/chat-stream-ttfb-harness.py --tokens 200
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-OpenAI"))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+os.environ.setdefault("OPENAI_API_KEY", "harness-not-used")
+
+REPLY_WORDS = ("Sure", " –", " here", " is", " your", " plan", " for", " today", ":", " gym",
+               " at", " 7,", " dentist", " at", " 10", " and", " school", " pick-up", " at", " 3.")
+
+
+# === Fake streaming OpenAI ===
+class FakeCompletions:
+    def __init__(self, tokens: int, first_token_ms: float, token_ms: float):
+        self.words = [REPLY_WORDS[i % len(REPLY_WORDS)] for i in range(tokens)]
+        self.first_token_s = first_token_ms / 1000
+        self.token_s = token_ms / 1000
+        self.fail = False
+
+    def _chunk(self, text: str):
+        delta = types.SimpleNamespace(content=text)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(delta=delta)])
+
+    def _stream(self):
+        time.sleep(self.first_token_s)
+        for i, w in enumerate(self.words):
+            if i:
+                time.sleep(self.token_s)
+            yield self._chunk(w)
+        yield types.SimpleNamespace(choices=[])   # usage-style trailer chunk
+
+    def create(self, model, messages, temperature=None, stream=False):
+        if self.fail:
+            raise RuntimeError("fake OpenAI outage")
+        if stream:
+            return self._stream()
+        time.sleep(self.first_token_s + self.token_s * (len(self.words) - 1))
+        message = types.SimpleNamespace(content="".join(self.words))
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+class FakeOpenAI:
+    def __init__(self, *args, completions: FakeCompletions | None = None, **kwargs):
+        self.chat = types.SimpleNamespace(completions=completions)
+
+
+try:
+    import openai  # noqa: F401
+except ImportError:
+    # The harness never calls the real API; let the Lambda import without the SDK.
+    sys.modules["openai"] = types.SimpleNamespace(OpenAI=FakeOpenAI)
+
+import lambda_function_v3 as chat  # noqa: E402
+import chat_stream_server  # noqa: E402
+
+
+# === Measurements ===
+def event_for(text: str) -> dict:
+    return {"httpMethod": "POST", "body": json.dumps({"messages": [{"role": "user", "content": text}]})}
+
+def run_json(event: dict) -> tuple[float, str]:
+    t0 = time.perf_counter()
+    resp = chat.lambda_handler(event, None)
+    return (time.perf_counter() - t0) * 1000, json.loads(resp["body"])["reply"]
+
+def run_stream(port: int, event: dict) -> tuple[float, float, str]:
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    t0 = time.perf_counter()
+    conn.request("POST", "/", body=event["body"], headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    assert resp.status == 200, f"stream status {resp.status}"
+    first, frames = None, []
+    while True:
+        line = resp.readline()   # http.client de-chunks; one "data: {...}" line per frame
+        if not line:
+            break
+        if line.startswith(b"data: "):
+            if first is None:
+                first = (time.perf_counter() - t0) * 1000
+            frames.append(json.loads(line[len(b"data: "):]))
+    total = (time.perf_counter() - t0) * 1000
+    conn.close()
+    return first, total, frames[-1]["reply"]
+
+def check_errors(port: int, event: dict) -> None:
+    chat.client.chat.completions.fail = True
+    try:
+        assert chat.lambda_handler(event, None)["statusCode"] == 500, "json error not a 500"
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        conn.request("POST", "/", body=event["body"], headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        body = json.loads(resp.read())
+        assert resp.status == 500 and body.get("error_id"), f"stream error gave {resp.status}"
+        conn.close()
+    finally:
+        chat.client.chat.completions.fail = False
+
+def run(tokens: int, first_token_ms: float, token_ms: float, runs: int) -> None:
+    chat.client = FakeOpenAI(completions=FakeCompletions(tokens, first_token_ms, token_ms))
+    chat.print = lambda *a, **k: None   # keep the Lambda's logging out of the report
+    chat_stream_server.print = lambda *a, **k: None
+    event = event_for("what should I focus on today?")
+
+    server = chat_stream_server.make_server(port=0, host="127.0.0.1")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        json_ms, stream_first, stream_total = [], [], []
+        for _ in range(runs):
+            ms, json_reply = run_json(event)
+            json_ms.append(ms)
+            first, total, stream_reply = run_stream(port, event)
+            stream_first.append(first)
+            stream_total.append(total)
+            assert stream_reply == json_reply, "streamed reply differs from JSON reply"
+        check_errors(port, event)
+    finally:
+        server.shutdown()
+
+    print(f"🧪 Fake OpenAI: {tokens} tokens, first token {first_token_ms:.0f} ms, {token_ms:.0f} ms/token, {runs} runs")
+    print(f"  json    TTFB  {statistics.median(json_ms):8.1f} ms (whole reply)")
+    print(f"  stream  TTFB  {statistics.median(stream_first):8.1f} ms, complete {statistics.median(stream_total):8.1f} ms (HTTP, chunked)")
+    print(f"\n📊 First byte {statistics.median(json_ms) / max(statistics.median(stream_first), 1e-6):.1f}× sooner; "
+          f"replies identical, errors 500 in both ✅")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tokens", type=int, default=120)
+    ap.add_argument("--first-token-ms", type=float, default=250)
+    ap.add_argument("--token-ms", type=float, default=15)
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+    run(args.tokens, args.first_token_ms, args.token_ms, args.runs)
@@ -0,0 +1,585 @@
+"""
+Fake Google Calendar v3 for offline runs and load tests of the calendar
+Lambdas' fetch layer (Lambda-Calendar/lambda_calendar_v3.py,
+Lambda-Token/lambda-function.py).
+
+Implements what the Lambdas call, with Google's semantics where they matter:
+  • events.list       – timeMin/timeMax overlap, orderBy=startTime (needs
+                        singleEvents), q search, maxResults (≤ 2500) paging,
+                        syncToken deltas (cancelled events included) and
+                        410 GONE once tokens are expired
+  • events.insert/get/update/delete – client ids must be base32hex, a
+                        duplicate id is 409, missing start/end is 400
+  • calendarList.list – paged
+  • batch requests    – ≤ 50 parts, each part can fail on its own
+plus per-request latency (+ jitter) and error injection (random rate or
+scripted failures for the next N calls of an operation).
+
+Two ways in:
+
+    fake = FakeGoogleCalendar.synthetic(10_000, latency_ms=40, error_rate=0.01)
+
+    # in-process, duck-typed googleapiclient resource
+    cal.set_calendar_service(fake.service())
+
+    # over HTTP on localhost, driven by the real googleapiclient
+    with fake.serve() as url:
+        cal.set_calendar_service(fake.http_service(url))
+
+The `fields` partial-response mask is accepted and ignored (full events are
+returned).
+"""
+import copy
+import email.parser
+import json
+import random
+import re
+import threading
+import time
+import types
+import uuid
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+DEFAULT_TZ = "Europe/London"
+DISCOVERY_DOC = Path(__file__).resolve().parent.parent / "Lambda-Shared" / "calendar.v3.json"
+MAX_PAGE = 2500
+MAX_BATCH = 50
+EVENT_ID_RE = re.compile(r"^[a-v0-9]{5,1024}$")
+REASONS = {400: "badRequest", 404: "notFound", 409: "duplicate", 410: "fullSyncRequired",
+           429: "rateLimitExceeded", 500: "backendError", 503: "backendError"}
+
+
+class FakeCalendarError(Exception):
+    """Shaped like googleapiclient.errors.HttpError (.resp.status, .content)."""
+    def __init__(self, status: int, message: str = ""):
+        self.status = status
+        self.reason = REASONS.get(status, "error")
+        self.message = message or self.reason
+        self.resp = types.SimpleNamespace(status=status, reason=self.reason)
+        self.content = json.dumps(self.body()).encode("utf-8")
+        super().__init__(f"<HttpError {status} \"{self.message}\">")
+
+    def body(self) -> dict:
+        return {"error": {"code": self.status, "message": self.message,
+                          "errors": [{"domain": "calendar", "reason": self.reason, "message": self.message}]}}
+
+
+def _epoch(part: dict | None, tz: ZoneInfo) -> float:
+    part = part or {}
+    if part.get("dateTime"):
+        return datetime.fromisoformat(part["dateTime"].replace("Z", "+00:00")).timestamp()
+    if part.get("date"):
+        d = date.fromisoformat(part["date"])
+        return datetime(d.year, d.month, d.day, tzinfo=tz).timestamp()
+    raise FakeCalendarError(400, "Missing start/end time.")
+
+
+def _rfc3339(value) -> float | None:
+    if value in (None, ""):
+        return None
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def _truthy(value) -> bool:
+    return value is True or str(value).lower() == "true"
+
+
+# === One calendar ===
+class _Calendar:
+    """Live events sorted by start + an append-only change log for sync tokens."""
+    def __init__(self, entry: dict, tz: ZoneInfo):
+        self.entry = entry
+        self.tz = tz
+        self.by_id: dict[str, dict] = {}
+        self.changes: list[dict] = []
+        self.starts: list[float] = []
+        self.ends: list[float] = []
+        self.live: list[dict] = []
+        self.max_span = 0.0
+
+    def load(self, events: list[dict]) -> None:
+        for e in events:
+            self.by_id[e["id"]] = e
+        self._reindex()
+
+    def _reindex(self) -> None:
+        rows = sorted(((_epoch(e["start"], self.tz), _epoch(e["end"], self.tz), e)
+                       for e in self.by_id.values() if e.get("status") != "cancelled"), key=lambda r: r[0])
+        self.starts = [r[0] for r in rows]
+        self.ends = [r[1] for r in rows]
+        self.live = [r[2] for r in rows]
+        self.max_span = max((en - st for st, en, _ in rows), default=0.0)
+
+    def put(self, event: dict) -> None:
+        previous = self.by_id.get(event["id"])
+        self.by_id[event["id"]] = event
+        self.changes.append(event)
+        if previous is not None:
+            self._reindex()
+        elif event.get("status") != "cancelled":
+            st, en = _epoch(event["start"], self.tz), _epoch(event["end"], self.tz)
+            i = bisect_left(self.starts, st)
+            self.starts.insert(i, st)
+            self.ends.insert(i, en)
+            self.live.insert(i, event)
+            self.max_span = max(self.max_span, en - st)
+
+    def window(self, lo: float | None, hi: float | None) -> list[dict]:
+        lo = float("-inf") if lo is None else lo
+        hi = float("inf") if hi is None else hi
+        first = bisect_left(self.starts, lo - self.max_span) if lo != float("-inf") else 0
+        last = bisect_left(self.starts, hi)
+        return [self.live[i] for i in range(first, last) if self.ends[i] > lo]
+
+    def delta(self, seq: int) -> list[dict]:
+        """Latest state of every event changed since `seq` (deletions as status=cancelled)."""
+        latest = {}
+        for e in self.changes[seq:]:
+            latest[e["id"]] = e
+        return list(latest.values())
+
+
+# === The fake ===
+class FakeGoogleCalendar:
+    def __init__(self, calendars: list[dict] | None = None, *, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_statuses: tuple[int, ...] = (429, 503), seed: int = 0,
+                 tz: str = DEFAULT_TZ):
+        self.tz = ZoneInfo(tz)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.stats = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._scripted: dict[str, deque] = {}
+        self._token_gen = 1
+        self.calendars: dict[str, _Calendar] = {}
+        for entry in calendars or [{"id": "me@example.com", "summary": "Me", "primary": True}]:
+            self.add_calendar(entry)
+
+    # --- setup ---
+    @classmethod
+    def from_recording(cls, recording: dict, **kwargs) -> "FakeGoogleCalendar":
+        """{"calendars": [calendarList entries], "events": {calendarId: [events]}}"""
+        fake = cls(recording["calendars"], **kwargs)
+        for cal_id, events in recording.get("events", {}).items():
+            fake.add_events(cal_id, events)
+        return fake
+
+    @classmethod
+    def synthetic(cls, n: int, seed: int = 7, **kwargs) -> "FakeGoogleCalendar":
+        return cls.from_recording(synthetic_recording(n, seed), seed=seed, **kwargs)
+
+    def add_calendar(self, entry: dict) -> None:
+        entry = {"accessRole": "owner", "timeZone": self.tz.key, **entry}
+        self.calendars[entry["id"]] = _Calendar(entry, self.tz)
+
+    def add_events(self, cal_id: str, events: list[dict]) -> None:
+        """Bulk load (not part of the change log – like events that predate a sync)."""
+        with self._lock:
+            c = self._calendar(cal_id)
+            c.load([self._stamp(copy.deepcopy(e), c.entry["id"]) for e in events])
+
+    def fail_next(self, op: str, status: int = 503, count: int = 1) -> None:
+        """Scripted failures: the next `count` calls of `op` (e.g. "events.list", "batch") fail."""
+        with self._lock:
+            self._scripted.setdefault(op, deque()).extend([status] * count)
+
+    def expire_sync_tokens(self) -> None:
+        """Every sync token issued so far now answers 410 GONE."""
+        with self._lock:
+            self._token_gen += 1
+
+    # --- request plumbing: latency + errors ---
+    def _gate(self, op: str, latency: bool = True) -> None:
+        with self._lock:
+            self.stats[op] += 1
+            scripted = self._scripted.get(op)
+            status = scripted.popleft() if scripted else None
+            if status is None and self.error_rate and self._rng.random() < self.error_rate:
+                status = self._rng.choice(self.error_statuses)
+            delay = (self.latency_ms + self._rng.uniform(0, self.jitter_ms)) / 1000 if latency else 0.0
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            with self._lock:
+                self.stats[f"{op}:{status}"] += 1
+            raise FakeCalendarError(status, f"Injected {status} on {op}")
+
+    def call(self, op: str, params: dict, body: dict | None = None, latency: bool = True) -> dict | None:
+        """Run one API operation. Raises FakeCalendarError like the real API would."""
+        self._gate(op, latency)
+        handler = {
+            "events.list": self._events_list, "events.insert": self._events_insert,
+            "events.get": self._events_get, "events.update": self._events_update,
+            "events.delete": self._events_delete, "calendarList.list": self._calendar_list,
+        }.get(op)
+        if handler is None:
+            raise FakeCalendarError(400, f"Unsupported operation {op}")
+        with self._lock:
+            return handler(dict(params), body)
+
+    def _calendar(self, cal_id: str) -> _Calendar:
+        if cal_id == "primary":   # alias for the entry flagged primary, as in Google
+            cal_id = next((k for k, c in self.calendars.items() if c.entry.get("primary")), cal_id)
+        c = self.calendars.get(cal_id)
+        if c is None:
+            raise FakeCalendarError(404, f"Calendar {cal_id} not found")
+        return c
+
+    def _stamp(self, event: dict, cal_id: str) -> dict:
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        event.setdefault("id", uuid.uuid4().hex[:26])
+        event.setdefault("status", "confirmed")
+        event.setdefault("created", now)
+        event["updated"] = now
+        event["etag"] = f'"{int(time.time() * 1000)}"'
+        event.setdefault("iCalUID", f"{event['id']}@google.com")
+        event.setdefault("htmlLink", f"https://www.google.com/calendar/event?eid={quote(event['id'])}&cal={quote(cal_id)}")
+        return event
+
+    # --- operations ---
+    def _page(self, items: list[dict], params: dict, sync_seq: int | None) -> dict:
+        size = max(1, min(int(params.get("maxResults") or 250), MAX_PAGE))
+        start = int(params.get("pageToken") or 0)
+        page = {"kind": "calendar#events", "items": copy.deepcopy(items[start:start + size])}
+        if start + size < len(items):
+            page["nextPageToken"] = str(start + size)
+        elif sync_seq is not None:
+            page["nextSyncToken"] = f"{self._token_gen}.{sync_seq}"
+        return page
+
+    def _events_list(self, params: dict, _body) -> dict:
+        c = self._calendar(params["calendarId"])
+        single = _truthy(params.get("singleEvents"))
+        if params.get("orderBy") == "startTime" and not single:
+            raise FakeCalendarError(400, "The requested ordering is not available for the particular query.")
+
+        if params.get("syncToken"):
+            if any(params.get(k) for k in ("timeMin", "timeMax", "orderBy", "q")):
+                raise FakeCalendarError(400, "Sync token cannot be combined with timeMin/timeMax/orderBy/q.")
+            try:
+                gen, seq = (int(x) for x in str(params["syncToken"]).split("."))
+            except ValueError:
+                raise FakeCalendarError(400, "Invalid sync token value.")
+            if gen != self._token_gen or seq > len(c.changes):
+                raise FakeCalendarError(410, "Sync token is no longer valid, a full sync is required.")
+            return self._page(c.delta(seq), params, len(c.changes))
+
+        items = c.window(_rfc3339(params.get("timeMin")), _rfc3339(params.get("timeMax")))
+        if params.get("q"):
+            q = str(params["q"]).lower()
+            items = [e for e in items
+                     if q in " ".join(str(e.get(k) or "") for k in ("summary", "description", "location")).lower()]
+        if _truthy(params.get("showDeleted")):
+            items = items + [e for e in c.by_id.values() if e.get("status") == "cancelled"]
+        # full (unbounded, unordered) lists end with a sync token, as Google's do
+        bounded = any(params.get(k) for k in ("timeMin", "timeMax", "orderBy", "q"))
+        return self._page(items, params, None if bounded else len(c.changes))
+
+    def _events_insert(self, params: dict, body: dict | None) -> dict:
+        c = self._calendar(params["calendarId"])
+        body = copy.deepcopy(body or {})
+        if "id" in body and not EVENT_ID_RE.match(str(body["id"])):
+            raise FakeCalendarError(400, "Invalid resource id value.")
+        if body.get("id") in c.by_id:
+            raise FakeCalendarError(409, "The requested identifier already exists.")
+        for part in ("start", "end"):
+            if not isinstance(body.get(part), dict) or not (body[part].get("date") or body[part].get("dateTime")):
+                raise FakeCalendarError(400, f"Missing {part} time.")
+        event = self._stamp(body, c.entry["id"])
+        event["status"] = "confirmed"
+        c.put(event)
+        return copy.deepcopy(event)
+
+    def _events_get(self, params: dict, _body) -> dict:
+        e = self._calendar(params["calendarId"]).by_id.get(params["eventId"])
+        if e is None:
+            raise FakeCalendarError(404, "Not Found")
+        return copy.deepcopy(e)
+
+    def _events_update(self, params: dict, body: dict | None) -> dict:
+        c = self._calendar(params["calendarId"])
+        existing = c.by_id.get(params["eventId"])
+        if existing is None:
+            raise FakeCalendarError(404, "Not Found")
+        event = self._stamp({**copy.deepcopy(body or {}), "id": params["eventId"],
+                             "created": existing.get("created")}, c.entry["id"])
+        c.put(event)
+        return copy.deepcopy(event)
+
+    def _events_delete(self, params: dict, _body) -> None:
+        c = self._calendar(params["calendarId"])
+        existing = c.by_id.get(params["eventId"])
+        if existing is None or existing.get("status") == "cancelled":
+            raise FakeCalendarError(410 if existing else 404, "Resource has been deleted" if existing else "Not Found")
+        c.put(self._stamp({**existing, "status": "cancelled"}, c.entry["id"]))
+        return None
+
+    def _calendar_list(self, params: dict, _body) -> dict:
+        entries = [copy.deepcopy(c.entry) for c in self.calendars.values()]
+        size = max(1, min(int(params.get("maxResults") or 100), 250))
+        start = int(params.get("pageToken") or 0)
+        page = {"kind": "calendar#calendarList", "items": entries[start:start + size]}
+        if start + size < len(entries):
+            page["nextPageToken"] = str(start + size)
+        return page
+
+    def batch(self, parts: list[tuple[str, dict, dict | None]]) -> list[tuple[dict | None, FakeCalendarError | None]]:
+        """One batch round trip; each part succeeds or fails independently."""
+        if len(parts) > MAX_BATCH:
+            raise FakeCalendarError(400, f"Too many requests in a batch (max {MAX_BATCH}).")
+        self._gate("batch")
+        out = []
+        for op, params, body in parts:
+            try:
+                out.append((self.call(op, params, body, latency=False), None))
+            except FakeCalendarError as e:
+                out.append((None, e))
+        return out
+
+    # --- front ends ---
+    def service(self) -> "FakeService":
+        return FakeService(self)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0):
+        """Run the REST + batch endpoints on localhost; yields the root URL."""
+        server = ThreadingHTTPServer((host, port), _make_handler(self))
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def http_service(self, url: str):
+        """A real googleapiclient resource pointed at serve()'s URL (needs google-api-python-client)."""
+        from googleapiclient.discovery import build_from_document
+        doc = json.loads(DISCOVERY_DOC.read_text(encoding="utf-8"))
+        doc["rootUrl"] = f"{url}/"
+        doc["baseUrl"] = f"{url}/{doc['servicePath']}"
+        return build_from_document(doc, http=_ThreadLocalHttp())
+
+
+# === In-process front end (duck-typed googleapiclient resource) ===
+class _FakeRequest:
+    def __init__(self, fake: FakeGoogleCalendar, op: str, params: dict, body: dict | None = None):
+        self.fake, self.op, self.params, self.body = fake, op, params, body
+        self.headers = {"user-agent": "fake-google-calendar"}
+
+    def execute(self, http=None, num_retries=0):
+        return self.fake.call(self.op, self.params, self.body)
+
+
+class _FakeEvents:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list(self, **params):
+        return _FakeRequest(self.fake, "events.list", params)
+
+    def insert(self, calendarId, body, **params):
+        return _FakeRequest(self.fake, "events.insert", {**params, "calendarId": calendarId}, body)
+
+    def get(self, calendarId, eventId, **params):
+        return _FakeRequest(self.fake, "events.get", {**params, "calendarId": calendarId, "eventId": eventId})
+
+    def update(self, calendarId, eventId, body, **params):
+        return _FakeRequest(self.fake, "events.update", {**params, "calendarId": calendarId, "eventId": eventId}, body)
+
+    def delete(self, calendarId, eventId, **params):
+        return _FakeRequest(self.fake, "events.delete", {**params, "calendarId": calendarId, "eventId": eventId})
+
+
+class _FakeCalendarList:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list(self, **params):
+        return _FakeRequest(self.fake, "calendarList.list", params)
+
+
+class _FakeBatch:
+    def __init__(self, fake, callback=None):
+        self.fake, self.callback, self.requests = fake, callback, []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((str(request_id if request_id is not None else len(self.requests) + 1), request, callback))
+
+    def execute(self, http=None):
+        results = self.fake.batch([(r.op, r.params, r.body) for _, r, _ in self.requests])
+        for (request_id, _, callback), (response, exc) in zip(self.requests, results):
+            (callback or self.callback)(request_id, response, exc)
+
+
+class FakeService:
+    def __init__(self, fake: FakeGoogleCalendar):
+        self.fake = fake
+
+    def events(self):
+        return _FakeEvents(self.fake)
+
+    def calendarList(self):
+        return _FakeCalendarList(self.fake)
+
+    def new_batch_http_request(self, callback=None):
+        return _FakeBatch(self.fake, callback)
+
+
+# === HTTP front end ===
+_ROUTES = [
+    ("GET", re.compile(r"^/calendar/v3/users/me/calendarList$"), "calendarList.list"),
+    ("GET", re.compile(r"^/calendar/v3/calendars/(?P<calendarId>[^/]+)/events$"), "events.list"),
+    ("POST", re.compile(r"^/calendar/v3/calendars/(?P<calendarId>[^/]+)/events$"), "events.insert"),
+    ("GET", re.compile(r"^/calendar/v3/calendars/(?P<calendarId>[^/]+)/events/(?P<eventId>[^/]+)$"), "events.get"),
+    ("PUT", re.compile(r"^/calendar/v3/calendars/(?P<calendarId>[^/]+)/events/(?P<eventId>[^/]+)$"), "events.update"),
+    ("DELETE", re.compile(r"^/calendar/v3/calendars/(?P<calendarId>[^/]+)/events/(?P<eventId>[^/]+)$"), "events.delete"),
+]
+
+def _route(method: str, target: str) -> tuple[str, dict]:
+    url = urlsplit(target)
+    for m, pattern, op in _ROUTES:
+        match = pattern.match(url.path)
+        if m == method and match:
+            params = {k: unquote(v) for k, v in match.groupdict().items()}
+            params.update((k, v) for k, v in parse_qsl(url.query) if k not in ("alt", "prettyPrint"))
+            return op, params
+    raise FakeCalendarError(404, f"No route for {method} {url.path}")
+
+def _http_response(status: int, payload: dict | None) -> bytes:
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    head = f"HTTP/1.1 {status} {'OK' if status < 300 else REASONS.get(status, 'Error')}\r\n"
+    head += "Content-Type: application/json; charset=UTF-8\r\n"
+    head += f"Content-Length: {len(body)}\r\n\r\n"
+    return head.encode("utf-8") + body
+
+def _make_handler(fake: FakeGoogleCalendar):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json; charset=UTF-8"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def _handle(self):
+            raw = self._body()
+            if self.command == "POST" and urlsplit(self.path).path == "/batch/calendar/v3":
+                return self._batch(raw)
+            try:
+                op, params = _route(self.command, self.path)
+                result = fake.call(op, params, json.loads(raw) if raw else None)
+                self._send(200 if result is not None else 204, json.dumps(result).encode("utf-8") if result is not None else b"")
+            except FakeCalendarError as e:
+                self._send(e.status, e.content)
+
+        def _batch(self, raw: bytes):
+            msg = email.parser.BytesParser().parsebytes(
+                f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8") + raw)
+            parts, ids = [], []
+            try:
+                for part in msg.get_payload():
+                    request_line, _, rest = part.get_payload().partition("\n")
+                    method, target, _ = request_line.strip().split(" ", 2)
+                    _, _, body = rest.replace("\r\n", "\n").partition("\n\n")
+                    op, params = _route(method, target)
+                    parts.append((op, params, json.loads(body) if body.strip() else None))
+                    ids.append(part.get("Content-ID", f"<{uuid.uuid4()}+{len(ids) + 1}>"))
+                results = fake.batch(parts)
+            except FakeCalendarError as e:
+                return self._send(e.status, e.content)
+
+            boundary = f"batch_{uuid.uuid4().hex}"
+            out = []
+            for content_id, (response, exc) in zip(ids, results):
+                inner = _http_response(exc.status, exc.body()) if exc else _http_response(200, response)
+                out.append(f"--{boundary}\r\nContent-Type: application/http\r\n"
+                           f"Content-ID: <response-{content_id.strip('<>')}>\r\n\r\n".encode("utf-8") + inner + b"\r\n")
+            out.append(f"--{boundary}--\r\n".encode("utf-8"))
+            self._send(200, b"".join(out), f"multipart/mixed; boundary={boundary}")
+
+        do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    return Handler
+
+
+class _ThreadLocalHttp:
+    """httplib2.Http is not thread-safe; one per thread behind a single object."""
+    def __init__(self):
+        self._tls = threading.local()
+
+    def _http(self):
+        http = getattr(self._tls, "http", None)
+        if http is None:
+            import httplib2
+            http = self._tls.http = httplib2.Http()
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._http(), name)
+
+
+# === Synthetic calendars ===
+TITLES = [("Dentist check-up", "Bring NHS card"), ("Gym session", "Legs"), ("Physio", "Knee exercises"),
+          ("Team meeting", "Weekly sync"), ("School run", ""), ("Doctor appointment", "Blood results"),
+          ("Car MOT", "Kwik Fit"), ("Dinner with Sam", "Booked for 7"), ("Football training", "Bring boots"),
+          ("Haircut", ""), ("Parents evening", "Room 4"), ("Bin day", "Recycling")]
+
+def synthetic_recording(n: int, seed: int = 7, tz: str = DEFAULT_TZ) -> dict:
+    """n events over [-1 y, +2 y] on the primary calendar, 5% as many on a work calendar, plus a holiday calendar."""
+    rng = random.Random(seed)
+    zone = ZoneInfo(tz)
+    today = datetime.now(zone).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def make(i: int, prefix: str) -> dict:
+        day = today + timedelta(days=rng.randint(-365, 730))
+        event_id = f"{prefix}{i:07d}"
+        if rng.random() < 0.03:
+            days = rng.choice((1, 1, 2, 5))
+            summary = rng.choice(("Annual Leave", "Annual leave - half day", "Holiday"))
+            return {"id": event_id, "summary": summary, "description": "",
+                    "start": {"date": day.date().isoformat()},
+                    "end": {"date": (day + timedelta(days=days)).date().isoformat()}}
+        title, desc = rng.choice(TITLES)
+        start = day + timedelta(hours=rng.randint(7, 19), minutes=rng.choice((0, 15, 30, 45)))
+        end = start + timedelta(minutes=rng.choice((30, 45, 60, 90)))
+        return {"id": event_id, "summary": title, "description": desc, "location": "", "colorId": "5",
+                "start": {"dateTime": start.isoformat(), "timeZone": tz},
+                "end": {"dateTime": end.isoformat(), "timeZone": tz}}
+
+    bank_holidays = [{"id": f"bh{y}{m:02d}{d:02d}", "summary": name,
+                      "start": {"date": f"{y}-{m:02d}-{d:02d}"},
+                      "end": {"date": (date(y, m, d) + timedelta(days=1)).isoformat()}}
+                     for y in (today.year - 1, today.year, today.year + 1, today.year + 2)
+                     for m, d, name in ((1, 1, "New Year's Day"), (12, 25, "Christmas Day"), (12, 26, "Boxing Day"))]
+    return {
+        "calendars": [{"id": "me@example.com", "summary": "Me", "primary": True},
+                      {"id": "work@example.com", "summary": "Work"},
+                      {"id": "en.uk#holiday@group.v.calendar.google.com", "summary": "Holidays in United Kingdom",
+                       "accessRole": "reader"}],
+        "events": {"me@example.com": [make(i, "p") for i in range(n)],
+                   "work@example.com": [make(i, "w") for i in range(max(1, n // 20))],
+                   "en.uk#holiday@group.v.calendar.google.com": bank_holidays},
+    }
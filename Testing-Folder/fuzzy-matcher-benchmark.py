@@ -0,0 +1,150 @@
+"""
+Fuzzy matcher benchmark for the calendar Lambda.
+
+Ground truth is the original full scan: loose_match_text(term, event text)
+with SequenceMatcher(0.64) for every event × term. Query terms are perturbed
+phrases from test_data/Calendar_Add_Test_Cases_UPDATED.csv. On a synthetic
+calendar (default 3k events) it reports:
+  • parity      – EventSearchIndex must return exactly the full scan's hits,
+                  on the synthetic calendar and on transposition typos
+                  ("dnetist", "pyhsio", ...); the run FAILS (exit 1) otherwise
+  • throughput  – index build + search time vs. the full scan
+
+Run:  python Testing-Folder/fuzzy-matcher-benchmark.py --events 3000
+"""
+import argparse
+import ast
+import csv
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-Calendar"))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-not-used")
+
+import lambda_calendar_v3 as cal  # noqa: E402
+
+CSV_PATH = HERE / "test_data" / "Calendar_Add_Test_Cases_UPDATED.csv"
+FILLER = ("bring forms", "park at the back", "ask about invoice", "with the kids",
+          "remember charger", "room 4", "call if late", "zoom link in email")
+
+
+# === Test phrases ===
+def load_summaries() -> list[str]:
+    with open(CSV_PATH, newline="", encoding="utf-8") as f:
+        return [ast.literal_eval(r["expected_result"])["summary"] for r in csv.DictReader(f)]
+
+def perturb(term: str, rng: random.Random) -> list[str]:
+    """Exact, dropped-char and swapped-char typos and common abbreviations of a phrase."""
+    out = [term]
+    for _ in range(4):
+        if len(term) > 3:
+            i = rng.randrange(len(term))
+            out.append(term[:i] + term[i + 1:])
+    if len(term) > 3:
+        i = rng.randrange(len(term) - 1)
+        out.append(term[:i] + term[i + 1] + term[i] + term[i + 2:])
+    out.append(term.replace("appointment", "appt").replace("session", "sesh"))
+    return out
+
+def perturbed_terms(summaries: list[str], rng: random.Random) -> list[str]:
+    terms = []
+    for s in summaries:
+        terms.extend(perturb(" ".join(cal.WORD.findall(cal.norm_text(s))), rng))
+    return terms
+
+
+# === Synthetic calendar ===
+def synthetic_events(n: int, summaries: list[str], rng: random.Random) -> list[dict]:
+    events = []
+    for i in range(n):
+        events.append({
+            "id": f"evt{i:06d}",
+            "summary": rng.choice(summaries),
+            "description": " ".join(rng.sample(FILLER, rng.randint(0, 3))),
+            "location": rng.choice(["", "", "Home", "Leeds", "Clinic"]),
+        })
+    return events
+
+
+# === Benchmarks ===
+TYPO_CASES = [("dnetist", "Dentist"), ("dentsit", "Dentist"), ("pyhsio", "Physio"),
+              ("hiarcut", "Haircut"), ("dentist appt", "Dentist appointment"), ("gym sesh", "Gym session")]
+
+def bench_index(events: list[dict], terms: list[str]) -> tuple[set[str], float, float]:
+    t0 = time.perf_counter()
+    index = cal.EventSearchIndex(events)
+    build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    hits = set()
+    for t in terms:
+        hits |= {(t, e["id"]) for e in index.search([t])}
+    return hits, build, time.perf_counter() - t0
+
+def bench_full_scan(events: list[dict], terms: list[str]) -> tuple[set[str], float]:
+    """The pre-index loop: loose_match_text per event × term with SequenceMatcher(0.64)."""
+    t0 = time.perf_counter()
+    hits = set()
+    for t in terms:
+        for e in events:
+            if cal.loose_match_text(t, cal._event_search_text(e)):
+                hits.add((t, e["id"]))
+    return hits, time.perf_counter() - t0
+
+def typo_parity() -> list[str]:
+    """Single-word transpositions against title-only events: index vs. full scan."""
+    events = [{"id": f"t{i}", "summary": title} for i, (_, title) in enumerate(TYPO_CASES)]
+    terms = [t for t, _ in TYPO_CASES]
+    scan, _ = bench_full_scan(events, terms)
+    hits, _, _ = bench_index(events, terms)
+    missed = sorted(t for t, _ in scan - hits)
+    print(f"  typos: {len(hits & scan)}/{len(scan)} full-scan hits" + (f", missed {missed}" if missed else ""))
+    if hits != scan:
+        return [f"index differs from full scan on typos: {sorted(hits ^ scan)}"]
+    return []
+
+def run(n_events: int, n_terms: int, seed: int) -> int:
+    rng = random.Random(seed)
+    summaries = load_summaries()
+    terms = perturbed_terms(summaries, rng)
+
+    events = synthetic_events(n_events, summaries, rng)
+    query_terms = rng.sample(terms, min(n_terms, len(terms)))
+    print(f"\n📅 Synthetic calendar: {n_events} events, {len(query_terms)} query terms "
+          f"(threshold {cal.FUZZY_THRESHOLD})")
+
+    scan_hits, scan_time = bench_full_scan(events, query_terms)
+    idx_hits, idx_build, idx_search = bench_index(events, query_terms)
+
+    print(f"  full scan (pre-index):                 search {scan_time*1000:8.1f} ms")
+    print(f"  indexed:  build {idx_build*1000:8.1f} ms, search {idx_search*1000:8.1f} ms")
+
+    failures = []
+    if idx_hits != scan_hits:
+        failures.append(f"index differs from full scan by {len(idx_hits ^ scan_hits)} (term, event) hits")
+    print(f"\n📊 vs. full scan ({len(scan_hits)} (term, event) hits): "
+          f"{'identical' if idx_hits == scan_hits else 'DIFFERENT'}")
+
+    print("\n🔤 Transposition typos")
+    failures += typo_parity()
+
+    if failures:
+        print("\n❌ FAIL")
+        for f in failures:
+            print("   •", f)
+        return 1
+    print("\n✅ PASS – indexed search matches the full scan")
+    return 0
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--events", type=int, default=3000)
+    ap.add_argument("--terms", type=int, default=25)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    sys.exit(run(args.events, args.terms, args.seed))
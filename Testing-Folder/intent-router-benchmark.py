@@ -0,0 +1,114 @@
+"""
+Intent router microbenchmark (Lambda-Shared/intent_router.py).
+
+Times the one-pass IntentRouter against the chained `in` checks it replaced:
+  • chat     – the chat Lambda's testing / calendar / todo / note nudges
+  • calendar – rule_based_intent + force_add (add, sum, leave, get sets)
+and checks both give identical intents on every message.
+
+Messages come from test_data/Calendar_Add_Test_Cases_UPDATED.csv plus
+synthetic chat lines, optionally padded to --pad words to mimic long turns.
+
+Run:  python Testing-Folder/intent-router-benchmark.py --repeat 2000
+"""
+import argparse
+import ast
+import csv
+import random
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+
+import intent_router as ir  # noqa: E402
+
+CSV_PATH = HERE / "test_data" / "Calendar_Add_Test_Cases_UPDATED.csv"
+EXTRA = (
+    "what's on this week", "how many holidays have i taken this year", "when is my next annual leave",
+    "add up my leave for 2025", "book the car in for an mot on friday", "testing", "can you add a todo",
+    "remind me to call mum", "write a note about the boiler", "show all events in march",
+    "tell me a joke about penguins", "draft an email to the school about the trip",
+)
+FILLER = ("please", "thanks", "the", "and", "after", "work", "kids", "maybe", "later", "today", "quickly")
+
+
+# === The checks before the router (copied from the Lambdas) ===
+def chained_chat(q: str) -> set[str]:
+    hits = set()
+    if "testing" in q:
+        hits.add("testing")
+    if "calendar" in q or "schedule" in q or "add event" in q:
+        hits.add("calendar")
+    if "todo" in q:
+        hits.add("todo")
+    if "note" in q:
+        hits.add("note")
+    return hits
+
+def chained_calendar(q: str) -> set[str]:
+    hits = set()
+    if "testing" in q:
+        hits.add("testing")
+    if any(k in q for k in ir.SUM_WORDS):
+        hits.add("sum")
+    if any(t in q for t in ir.LEAVE_TERMS):
+        hits.add("leave")
+    if any(p in q for p in ir.GET_PATTERNS):
+        hits.add("get")
+    if any(q.startswith(w) or f" {w} " in q for w in ir.ADD_WORDS):
+        hits.add("add")
+    return hits
+
+
+# === Corpus ===
+def load_messages(pad: int, rng: random.Random) -> list[str]:
+    msgs = list(EXTRA)
+    with open(CSV_PATH, newline="", encoding="utf-8") as f:
+        for r in csv.DictReader(f):
+            msgs.append(ast.literal_eval(r["expected_result"])["summary"])
+            msgs.append(r["input"] if "input" in r else next(iter(r.values())))
+    out = []
+    for m in msgs:
+        words = m.lower().split()
+        for _ in range(pad):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(FILLER))
+        out.append(" ".join(words))
+    return out
+
+
+def bench(name: str, msgs: list[str], chained, router: ir.IntentRouter, repeat: int) -> None:
+    for q in msgs:
+        assert chained(q) == router.route(q), f"{name}: mismatch on {q!r}"
+    n = len(msgs) * repeat
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for q in msgs:
+            chained(q)
+    old = (time.perf_counter() - t0) / n * 1e6
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for q in msgs:
+            router.route(q)
+    new = (time.perf_counter() - t0) / n * 1e6
+    print(f"  {name:<9} chained {old:6.2f} µs/msg   router {new:6.2f} µs/msg   ({old / new:.2f}×)")
+
+
+def run(repeat: int, pad_levels: list[int], seed: int) -> None:
+    rng = random.Random(seed)
+    for pad in pad_levels:
+        msgs = load_messages(pad, rng)
+        avg = sum(len(m) for m in msgs) / len(msgs)
+        print(f"\n🔎 {len(msgs)} messages, +{pad} filler words (avg {avg:.0f} chars), identical intents ✅")
+        bench("chat", msgs, chained_chat, ir.CHAT_ROUTER, repeat)
+        bench("calendar", msgs, chained_calendar, ir.CALENDAR_ROUTER, repeat)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=2000)
+    ap.add_argument("--pad", type=int, nargs="*", default=[0, 20, 80])
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    run(args.repeat, args.pad, args.seed)
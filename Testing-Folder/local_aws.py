@@ -0,0 +1,274 @@
+"""
+In-memory stand-ins for the AWS calls the upload Lambdas make, for the
+Testing-Folder harnesses. Each call sleeps for a configurable latency and is
+counted, together with the object bytes S3 would read/write.
+
+    import local_aws
+    aws = local_aws.install(s3_ms=15, ddb_ms=5)   # before importing a Lambda
+    aws.s3.put_object(Bucket=..., Key=..., Body=b"...", Metadata={...})
+
+install() puts a `boto3` module into sys.modules whose client("s3" |
+"dynamodb" | "secretsmanager") returns these objects, so Lambdas that build
+clients at import time run unchanged and never reach AWS. load_lambda()
+imports the extension-less Lambda files by path, with Lambda-Shared on
+sys.path as the shared layer would be at /opt/python.
+"""
+import copy
+import hashlib
+import importlib.machinery
+import importlib.util
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from pathlib import Path
+
+SHARED_LAYER = Path(__file__).resolve().parent.parent / "Lambda-Shared"
+
+
+class ClientError(Exception):
+    def __init__(self, code: str, op: str):
+        super().__init__(f"An error occurred ({code}) when calling the {op} operation")
+        status = 404 if code in ("404", "NoSuchKey") else 403 if code == "403" else 400
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+class _Service:
+    def __init__(self, latency_ms: float):
+        self.latency_s = latency_ms / 1000
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def _call(self, op: str) -> None:
+        with self._lock:
+            self.calls[op] += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+
+# === S3 ===
+class LocalS3(_Service):
+    exceptions = types.SimpleNamespace(ClientError=ClientError)
+
+    def __init__(self, latency_ms: float = 0, mb_per_s: float = 100):
+        super().__init__(latency_ms)
+        self.mb_per_s = mb_per_s
+        self.objects: dict[tuple[str, str], dict] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        # "403" mimics a role without s3:ListBucket (missing keys HEAD as 403)
+        self.head_missing_code = "404"
+
+    def _transfer(self, n: int, write: bool) -> None:
+        with self._lock:
+            if write:
+                self.bytes_written += n
+            else:
+                self.bytes_read += n
+        if self.mb_per_s:
+            time.sleep(n / (self.mb_per_s * 1024 * 1024))
+
+    def _get(self, bucket: str, key: str, op: str) -> dict:
+        obj = self.objects.get((bucket, key))
+        if obj is None:
+            raise ClientError(self.head_missing_code if op == "HeadObject" else "NoSuchKey", op)
+        return obj
+
+    def put_object(self, Bucket, Key, Body=b"", Metadata=None, ContentType="binary/octet-stream",
+                   ContentDisposition=None, CacheControl=None, **_):
+        self._call("put_object")
+        body = Body.encode() if isinstance(Body, str) else bytes(Body)
+        self._transfer(len(body), write=True)
+        self.objects[(Bucket, Key)] = {
+            "Body": body, "Metadata": dict(Metadata or {}), "ContentType": ContentType,
+            "ContentDisposition": ContentDisposition, "CacheControl": CacheControl,
+            "ETag": f'"{hashlib.md5(body).hexdigest()}"', "Tags": [],
+        }
+        return {"ETag": self.objects[(Bucket, Key)]["ETag"]}
+
+    def head_object(self, Bucket, Key, **_):
+        self._call("head_object")
+        obj = self._get(Bucket, Key, "HeadObject")
+        out = {k: copy.deepcopy(v) for k, v in obj.items() if k not in ("Body", "Tags") and v is not None}
+        out["ContentLength"] = len(obj["Body"])
+        return out
+
+    def get_object(self, Bucket, Key, **_):
+        self._call("get_object")
+        obj = self._get(Bucket, Key, "GetObject")
+        self._transfer(len(obj["Body"]), write=False)
+        return {"Body": types.SimpleNamespace(read=lambda: obj["Body"]), "ETag": obj["ETag"],
+                "Metadata": dict(obj["Metadata"]), "ContentType": obj["ContentType"]}
+
+    def copy_object(self, Bucket, Key, CopySource, MetadataDirective="COPY", Metadata=None, **kw):
+        self._call("copy_object")
+        src = self._get(CopySource["Bucket"], CopySource["Key"], "CopyObject")
+        n = len(src["Body"])
+        self._transfer(n, write=False)   # server-side, but S3 still reads + rewrites every byte
+        self._transfer(n, write=True)
+        new = dict(src)
+        if MetadataDirective == "REPLACE":
+            new["Metadata"] = dict(Metadata or {})
+            for field in ("ContentType", "ContentDisposition", "CacheControl"):
+                new[field] = kw.get(field)
+        self.objects[(Bucket, Key)] = new
+        return {"CopyObjectResult": {"ETag": new["ETag"]}}
+
+    def copy(self, CopySource, Bucket, Key, ExtraArgs=None, Config=None, **_):
+        """boto3's managed copy: multipart UploadPartCopy above the threshold."""
+        src = self._get(CopySource["Bucket"], CopySource["Key"], "CopyObject")
+        chunk = getattr(Config, "multipart_chunksize", 8 * 1024 * 1024)
+        parts = max(1, -(-len(src["Body"]) // chunk))
+        self._call("create_multipart_upload")
+        for _ in range(parts):
+            self._call("upload_part_copy")
+        self._transfer(len(src["Body"]), write=False)
+        self._transfer(len(src["Body"]), write=True)
+        self._call("complete_multipart_upload")
+        new = dict(src)
+        extra = dict(ExtraArgs or {})
+        new["Metadata"] = dict(extra.get("Metadata", src["Metadata"]))
+        for field in ("ContentType", "ContentDisposition", "CacheControl"):
+            new[field] = extra.get(field, src.get(field))
+        new["Tags"] = []   # multipart copies don't carry tags over
+        self.objects[(Bucket, Key)] = new
+
+    def put_object_tagging(self, Bucket, Key, Tagging, **_):
+        self._call("put_object_tagging")
+        self._get(Bucket, Key, "PutObjectTagging")["Tags"] = list(Tagging["TagSet"])
+        return {}
+
+    def get_object_tagging(self, Bucket, Key, **_):
+        self._call("get_object_tagging")
+        return {"TagSet": list(self._get(Bucket, Key, "GetObjectTagging")["Tags"])}
+
+
+# === DynamoDB (low-level client, typed attribute values) ===
+class ConditionalCheckFailedException(ClientError):
+    def __init__(self, op: str):
+        super().__init__("ConditionalCheckFailedException", op)
+
+
+class LocalDynamoDB(_Service):
+    exceptions = types.SimpleNamespace(ClientError=ClientError,
+                                       ConditionalCheckFailedException=ConditionalCheckFailedException)
+
+    def __init__(self, latency_ms: float = 0, key_names: tuple[str, ...] = ("user_id", "file_id")):
+        super().__init__(latency_ms)
+        self.key_names = key_names
+        self.tables: dict[str, dict[tuple, dict]] = {}
+
+    def _key(self, item: dict) -> tuple:
+        return tuple(item[k]["S"] for k in self.key_names if k in item)
+
+    def put_item(self, TableName, Item, **_):
+        self._call("put_item")
+        self.tables.setdefault(TableName, {})[self._key(Item)] = copy.deepcopy(Item)
+        return {}
+
+    def update_item(self, TableName, Key, UpdateExpression, ConditionExpression=None,
+                    ExpressionAttributeNames=None, ExpressionAttributeValues=None, **_):
+        """SET-only updates; conditions are OR-ed attribute_not_exists(a) / a = :v / a <> :v."""
+        self._call("update_item")
+        names, values = ExpressionAttributeNames or {}, ExpressionAttributeValues or {}
+        rows = self.tables.setdefault(TableName, {})
+        with self._lock:
+            item = rows.get(self._key(Key))
+            if ConditionExpression and not any(self._holds(c.strip(), item or {}, names, values)
+                                               for c in ConditionExpression.split(" OR ")):
+                raise ConditionalCheckFailedException("UpdateItem")
+            item = copy.deepcopy(item) if item else copy.deepcopy(Key)
+            for assignment in UpdateExpression.removeprefix("SET ").split(","):
+                attr, value = (part.strip() for part in assignment.split("="))
+                item[names.get(attr, attr)] = copy.deepcopy(values[value])
+            rows[self._key(Key)] = item
+        return {}
+
+    @staticmethod
+    def _holds(clause: str, item: dict, names: dict, values: dict) -> bool:
+        if clause.startswith("attribute_not_exists(") and clause.endswith(")"):
+            attr = clause[len("attribute_not_exists("):-1]
+            return names.get(attr, attr) not in item
+        for op in ("<>", "="):
+            if op in clause:
+                attr, value = (part.strip() for part in clause.split(op))
+                equal = item.get(names.get(attr, attr)) == values[value]
+                return equal if op == "=" else not equal
+        raise ValueError(f"Unsupported condition: {clause}")
+
+    def get_item(self, TableName, Key, **_):
+        self._call("get_item")
+        item = self.tables.get(TableName, {}).get(self._key(Key))
+        return {"Item": copy.deepcopy(item)} if item else {}
+
+    def batch_get_item(self, RequestItems, **_):
+        """Set `batch_max_keys` to hand the rest back as UnprocessedKeys (throttling)."""
+        self._call("batch_get_item")
+        out, unprocessed = {}, {}
+        budget = getattr(self, "batch_max_keys", None)
+        for table, req in RequestItems.items():
+            rows = self.tables.get(table, {})
+            keys = list(req["Keys"])
+            if budget is not None:
+                keys, rest = keys[:budget], keys[budget:]
+                budget -= len(keys)
+                if rest:
+                    unprocessed[table] = {**req, "Keys": rest}
+            out[table] = [copy.deepcopy(rows[self._key(k)]) for k in keys if self._key(k) in rows]
+        return {"Responses": out, "UnprocessedKeys": unprocessed}
+
+
+# === Secrets Manager ===
+class LocalSecrets(_Service):
+    def __init__(self, secrets: dict[str, str] | None = None):
+        super().__init__(0)
+        self.secrets = dict(secrets or {})
+
+    def get_secret_value(self, SecretId, **_):
+        self._call("get_secret_value")
+        return {"SecretString": self.secrets[SecretId]}
+
+
+# === boto3 stand-in ===
+class LocalAWS:
+    def __init__(self, s3_ms: float = 0, ddb_ms: float = 0, s3_mb_per_s: float = 100):
+        self.s3 = LocalS3(s3_ms, s3_mb_per_s)
+        self.ddb = LocalDynamoDB(ddb_ms)
+        self.secrets = LocalSecrets({"openai/api-key": '{"OPENAI_API_KEY": "local-not-used"}'})
+
+    def client(self, name: str, *args, **kwargs):
+        return {"s3": self.s3, "dynamodb": self.ddb, "secretsmanager": self.secrets}[name]
+
+    def calls(self) -> dict:
+        return {"s3": dict(self.s3.calls), "dynamodb": dict(self.ddb.calls)}
+
+
+class TransferConfig:
+    def __init__(self, multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=10, **_):
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+
+
+def install(**kwargs) -> LocalAWS:
+    aws = LocalAWS(**kwargs)
+    transfer = types.ModuleType("boto3.s3.transfer")
+    transfer.TransferConfig = TransferConfig
+    s3_pkg = types.ModuleType("boto3.s3")
+    s3_pkg.transfer = transfer
+    boto3 = types.ModuleType("boto3")
+    boto3.client = aws.client
+    boto3.s3 = s3_pkg
+    sys.modules.update({"boto3": boto3, "boto3.s3": s3_pkg, "boto3.s3.transfer": transfer})
+    return aws
+
+
+def load_lambda(path, name: str):
+    """Import a Lambda source file by path (the upload Lambdas have no .py suffix)."""
+    if str(SHARED_LAYER) not in sys.path:
+        sys.path.insert(0, str(SHARED_LAYER))
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,111 @@
+"""
+Secrets + OpenAI client reuse (Lambda-Shared/secrets_clients.py).
+
+A fake OpenAI client charges --connect-ms (TCP + TLS) on the first request
+of each client instance and --gpt-ms per request; Secrets Manager is the
+local_aws.py stand-in. --uploads GPT calls on one warm container, with the
+key rotated halfway through:
+  • old    – what kai-upload-function-chat-v3 did: key read once at import,
+             new OpenAI(api_key=...) per call (fresh connection every time,
+             stale key after rotation until the next cold start)
+  • shared – openai_call(): cached key (TTL), one pooled client, refresh +
+             single retry when the rotated-out key is rejected
+
+Run:  python Testing-Folder/secrets-clients-benchmark.py --uploads 200 --connect-ms 40
+"""
+import argparse
+import json
+import sys
+import time
+import types
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+sys.path.insert(0, str(HERE.parent / "Lambda-Shared"))
+
+import local_aws  # noqa: E402
+
+
+class FakeAuthError(Exception):
+    status_code = 401
+
+
+class FakeOpenAI:
+    valid_key = ""
+    connect_s = 0.0
+    gpt_s = 0.0
+    instances = 0
+
+    def __init__(self, api_key=None, **kwargs):
+        FakeOpenAI.instances += 1
+        self.api_key = api_key
+        self.connected = False
+        self.chat = types.SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        if not self.connected:
+            time.sleep(FakeOpenAI.connect_s)
+            self.connected = True
+        if self.api_key != FakeOpenAI.valid_key:
+            raise FakeAuthError("Incorrect API key provided")
+        time.sleep(FakeOpenAI.gpt_s)
+        return "ok"
+
+
+def rotate(aws, new_key: str) -> None:
+    aws.secrets.secrets["openai/api-key"] = json.dumps({"OPENAI_API_KEY": new_key})
+    FakeOpenAI.valid_key = new_key
+
+
+def run_old(aws, n: int) -> tuple[float, int]:
+    key = json.loads(aws.secrets.get_secret_value(SecretId="openai/api-key")["SecretString"])["OPENAI_API_KEY"]
+    failures, t0 = 0, time.perf_counter()
+    for i in range(n):
+        if i == n // 2:
+            rotate(aws, "sk-rotated-old")
+        try:
+            FakeOpenAI(api_key=key).create(model="gpt-4o-mini", messages=[])
+        except FakeAuthError:
+            failures += 1
+    return time.perf_counter() - t0, failures
+
+
+def run_shared(aws, n: int) -> tuple[float, int]:
+    import secrets_clients
+    secrets_clients.get_secret_cache().invalidate()
+    secrets_clients.set_openai_factory(FakeOpenAI)
+    failures, t0 = 0, time.perf_counter()
+    for i in range(n):
+        if i == n // 2:
+            rotate(aws, "sk-rotated-shared")
+        try:
+            secrets_clients.openai_call(lambda c: c.chat.completions.create(model="gpt-4o-mini", messages=[]))
+        except FakeAuthError:
+            failures += 1
+    return time.perf_counter() - t0, failures
+
+
+def run(n: int, connect_ms: float, gpt_ms: float) -> None:
+    aws = local_aws.install()
+    import secrets_clients
+    secrets_clients.print = lambda *a, **k: None
+    FakeOpenAI.connect_s, FakeOpenAI.gpt_s = connect_ms / 1000, gpt_ms / 1000
+
+    print(f"🔑 {n} GPT calls on a warm container, key rotated after {n // 2}; connect {connect_ms:.0f} ms, GPT {gpt_ms:.0f} ms")
+    for name, fn in (("old", run_old), ("shared", run_shared)):
+        rotate(aws, "sk-original")
+        FakeOpenAI.instances = 0
+        aws.secrets.calls.clear()
+        elapsed, failures = fn(aws, n)
+        print(f"  {name:<7} {elapsed:6.2f} s  {elapsed / n * 1000:6.1f} ms/call  clients {FakeOpenAI.instances:4d}  "
+              f"secret reads {aws.secrets.calls['get_secret_value']:2d}  auth failures {failures:4d}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--uploads", type=int, default=200)
+    ap.add_argument("--connect-ms", type=float, default=40)
+    ap.add_argument("--gpt-ms", type=float, default=5)
+    args = ap.parse_args()
+    run(args.uploads, args.connect_ms, args.gpt_ms)
@@ -0,0 +1,130 @@
+"""
+Upload processor batch benchmark (Lambda-Upload/kai-upload-function-chat-v3).
+
+Pushes --uploads simulated uploads through lambda_handler as SQS batches
+(10 messages per batch, one S3 event each) against the local S3 / DynamoDB
+stand-ins in local_aws.py and a fake OpenAI client with --gpt-ms latency.
+
+Compares a single worker (records one after another) with the bounded
+pool, and checks the partial batch response: uploads without a `message`
+fail, and exactly their SQS messageIds must come back in batchItemFailures.
+
+Run:  python Testing-Folder/upload-batch-benchmark.py --uploads 100 --workers 8
+"""
+import argparse
+import json
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+
+import local_aws  # noqa: E402
+
+UPLOAD_LAMBDA = HERE.parent / "Lambda-Upload" / "kai-upload-function-chat-v3"
+BUCKET = "kai-assistant-data-2448"
+SQS_BATCH = 10
+
+
+# === Fake OpenAI ===
+class FakeOpenAI:
+    latency_s = 0.0
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        self.chat = types.SimpleNamespace(completions=self)
+
+    def create(self, model, messages, **kwargs):
+        FakeOpenAI.calls += 1
+        time.sleep(FakeOpenAI.latency_s)
+        text = messages[-1]["content"]
+        content = json.dumps({"gpt_title": text[:40].title(), "gpt_tags": ["receipt", "benchmark"],
+                              "gpt_summary": f"Summary of: {text}"})
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))])
+
+
+def load_upload_lambda():
+    module = local_aws.load_lambda(UPLOAD_LAMBDA, "upload_processor")
+    import secrets_clients  # on sys.path once load_lambda has run
+    secrets_clients.set_openai_factory(FakeOpenAI)
+    module.print = lambda *a, **k: None
+    module.GPT_CACHE_ENABLED = False   # both modes must pay for GPT (see upload-gpt-cache-benchmark.py)
+    return module
+
+
+# === Simulated uploads ===
+def seed_uploads(aws: local_aws.LocalAWS, n: int, fail_every: int, size_kb: int) -> tuple[list[str], set[str]]:
+    keys, bad = [], set()
+    for i in range(n):
+        key = f"uploads/user-1/receipt {i:03d}.pdf"
+        meta = {"user": "user-1", "upload_id": f"up-{i:03d}", "original_name": f"receipt {i:03d}.pdf",
+                "tab": "taxclaim" if i % 3 == 0 else "chat", "timestamp": "2026-10-17T09:00:00Z"}
+        if fail_every and i % fail_every == fail_every - 1:
+            bad.add(key)                       # no message → process_and_save raises
+        else:
+            meta["message"] = f"train ticket to leeds number {i}"
+        # headers as uploadToS3.ts sets them, so the processor never rewrites
+        aws.s3.put_object(Bucket=BUCKET, Key=key, Body=b"%PDF" + b"x" * (size_kb * 1024), Metadata=meta,
+                          ContentType="application/pdf", ContentDisposition="inline", CacheControl="no-cache")
+        keys.append(key)
+    return keys, bad
+
+def sqs_batches(keys: list[str]) -> list[dict]:
+    batches = []
+    for start in range(0, len(keys), SQS_BATCH):
+        records = []
+        for key in keys[start:start + SQS_BATCH]:
+            s3_event = {"Records": [{"s3": {"bucket": {"name": BUCKET},
+                                            "object": {"key": key.replace(" ", "+")}}}]}
+            records.append({"eventSource": "aws:sqs", "messageId": f"msg-{key}", "body": json.dumps(s3_event)})
+        batches.append({"Records": records})
+    return batches
+
+
+def run_mode(upl, aws, n: int, fail_every: int, size_kb: int, workers: int) -> float:
+    keys, bad = seed_uploads(aws, n, fail_every, size_kb)
+    aws.s3.calls.clear()
+    aws.ddb.calls.clear()
+    upl._UPLOAD_POOL = ThreadPoolExecutor(max_workers=workers)
+    failed = set()
+    t0 = time.perf_counter()
+    for batch in sqs_batches(keys):
+        resp = upl.lambda_handler(batch, None)
+        failed |= {f["itemIdentifier"] for f in resp["batchItemFailures"]}
+    elapsed = time.perf_counter() - t0
+    expected = {f"msg-{k}" for k in bad}
+    assert failed == expected, f"batchItemFailures mismatch: {failed ^ expected}"
+    return elapsed
+
+
+def run(n: int, workers: int, gpt_ms: float, s3_ms: float, ddb_ms: float, fail_every: int, size_kb: int) -> None:
+    aws = local_aws.install(s3_ms=s3_ms, ddb_ms=ddb_ms)
+    upl = load_upload_lambda()
+    FakeOpenAI.latency_s = gpt_ms / 1000
+    n_bad = n // fail_every if fail_every else 0
+
+    print(f"📤 {n} uploads in SQS batches of {SQS_BATCH} ({n_bad} without message → expected failures)")
+    print(f"   latency: GPT {gpt_ms:.0f} ms, S3 {s3_ms:.0f} ms, DDB {ddb_ms:.0f} ms per call")
+    serial = run_mode(upl, aws, n, fail_every, size_kb, 1)
+    print(f"  1 worker   : {serial:7.2f} s  ({(n - n_bad) / serial:6.1f} uploads/s)")
+    pooled = run_mode(upl, aws, n, fail_every, size_kb, workers)
+    print(f"  {workers} workers  : {pooled:7.2f} s  ({(n - n_bad) / pooled:6.1f} uploads/s)")
+    print(f"\n📊 {serial / pooled:.1f}× throughput; batchItemFailures exact ✅")
+    print(f"📊 Calls per pooled run: {aws.calls()}")
+    print(f"📊 DynamoDB rows: {len(aws.ddb.tables.get('kai-assistant-data', {}))}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--uploads", type=int, default=100)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--gpt-ms", type=float, default=60)
+    ap.add_argument("--s3-ms", type=float, default=10)
+    ap.add_argument("--ddb-ms", type=float, default=5)
+    ap.add_argument("--fail-every", type=int, default=20, help="every Nth upload lacks a message (0 = none)")
+    ap.add_argument("--size-kb", type=int, default=256)
+    args = ap.parse_args()
+    run(args.uploads, args.workers, args.gpt_ms, args.s3_ms, args.ddb_ms, args.fail_every, args.size_kb)
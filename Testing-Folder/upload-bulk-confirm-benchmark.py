@@ -0,0 +1,125 @@
+"""
+Bulk upload confirmation (Lambda-Upload/kai-Upload-confirmation-v3).
+
+A user drops --files receipts at once. Mixed states are seeded in the local
+stand-ins (local_aws.py): processed, processing, failed, uploaded-but-not-yet-
+recorded, and missing from S3. Compared:
+  • per-file – what the UI did: one confirmation Lambda per upload_id, all in
+               flight at once (get_item, plus head_object when unrecorded)
+  • bulk     – one Lambda with ?upload_ids=…: BatchGetItem in chunks of 100
+               (with --throttle-keys, DynamoDB returns part as UnprocessedKeys)
+               and parallel head_object for the unrecorded ones
+
+Both must return the same status for every upload. With --no-list-bucket,
+S3 answers HEAD on a missing key with 403 (a role without s3:ListBucket);
+those uploads must still come back "missing". A final check throttles every
+BatchGetItem key: the bulk call must stop retrying before the Lambda timeout
+and report the unread uploads as pending.
+
+Run:  python Testing-Folder/upload-bulk-confirm-benchmark.py --files 20 --throttle-keys 7 --no-list-bucket
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+
+import local_aws  # noqa: E402
+
+BUCKET = "kai-assistant-data-2448"
+TABLE = "kai-assistant-data"
+STATES = ("processed", "processing", "failed", "unrecorded", "missing")
+
+
+def seed(aws, n: int) -> list[str]:
+    ids = []
+    for i in range(n):
+        upload_id = f"user-1_2026-10-17_receipt-{i:03d}.pdf"
+        state = STATES[i % len(STATES)]
+        if state != "missing":
+            aws.s3.put_object(Bucket=BUCKET, Key=f"user/user-1/uploads/receipts/{upload_id}", Body=b"%PDF",
+                              ContentType="application/pdf", Metadata={"upload_id": upload_id})
+        if state in ("processed", "processing", "failed"):
+            item = {"user_id": {"S": "user-1"}, "file_id": {"S": upload_id}, "status": {"S": state}}
+            if state == "processed":
+                item.update(gpt_title={"S": f"Receipt {i}"}, gpt_summary={"S": "Train ticket"})
+            if state == "failed":
+                item["error"] = {"S": "No message provided"}
+            aws.ddb.tables.setdefault(TABLE, {})[("user-1", upload_id)] = item
+        ids.append(upload_id)
+    return ids
+
+
+def call(conf, params: dict, context=None) -> dict:
+    return json.loads(conf.lambda_handler({"queryStringParameters": params}, context)["body"])
+
+
+class FakeContext:
+    def __init__(self, timeout_ms: int):
+        self.deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return int((self.deadline - time.monotonic()) * 1000)
+
+
+def check_throttled(aws, conf, ids: list[str], base: dict, timeout_ms: int = 1500) -> None:
+    """DynamoDB hands every key back as UnprocessedKeys until the Lambda runs out of time."""
+    aws.ddb.batch_max_keys = 0
+    aws.s3.calls.clear()
+    t0 = time.perf_counter()
+    bulk = call(conf, {**base, "upload_ids": ",".join(ids)}, FakeContext(timeout_ms))
+    took = (time.perf_counter() - t0) * 1000
+    assert took < timeout_ms, f"bulk call ran {took:.0f} ms, past the {timeout_ms} ms timeout"
+    assert {r["status"] for r in bulk["statuses"].values()} == {"pending"}, bulk["summary"]
+    assert not aws.s3.calls, "unread uploads should not be looked up in S3"
+    print(f"\n🧱 Fully throttled: returned in {took:.0f} ms of a {timeout_ms} ms Lambda, {bulk['summary']} ✅")
+
+
+def run(n: int, s3_ms: float, ddb_ms: float, throttle_keys: int, no_list_bucket: bool) -> None:
+    aws = local_aws.install(s3_ms=s3_ms, ddb_ms=ddb_ms, s3_mb_per_s=0)
+    if no_list_bucket:
+        aws.s3.head_missing_code = "403"
+    conf = local_aws.load_lambda(HERE.parent / "Lambda-Upload" / "kai-Upload-confirmation-v3", "upload_confirm")
+    conf.print = lambda *a, **k: None
+    conf.BACKOFF_BASE_SECS = 0.01
+    ids = seed(aws, n)
+    base = {"user": "user-1", "tab": "claimtax"}
+
+    aws.s3.calls.clear(); aws.ddb.calls.clear()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        single = dict(zip(ids, pool.map(lambda u: call(conf, {**base, "upload_id": u}), ids)))
+    per_file = (time.perf_counter() - t0, sum(aws.s3.calls.values()) + sum(aws.ddb.calls.values()), aws.calls())
+
+    aws.ddb.batch_max_keys = throttle_keys or None
+    aws.s3.calls.clear(); aws.ddb.calls.clear()
+    t0 = time.perf_counter()
+    bulk = call(conf, {**base, "upload_ids": ",".join(ids)})
+    bulk_run = (time.perf_counter() - t0, sum(aws.s3.calls.values()) + sum(aws.ddb.calls.values()), aws.calls())
+
+    assert bulk["statuses"] == single, "bulk and per-file statuses differ"
+    missing = [u for i, u in enumerate(ids) if STATES[i % len(STATES)] == "missing"]
+    assert all(bulk["statuses"][u]["status"] == "missing" for u in missing), "missing uploads not reported as missing"
+    print(f"📦 {n} uploads, states cycled through {', '.join(STATES)}")
+    print(f"   latency: S3 {s3_ms:.0f} ms, DDB {ddb_ms:.0f} ms per call"
+          + (f"; BatchGetItem serves {throttle_keys} keys per call" if throttle_keys else "")
+          + ("; missing keys HEAD as 403" if no_list_bucket else ""))
+    print(f"  per-file : {n:4d} Lambda invocations  {per_file[1]:4d} AWS calls  {per_file[0] * 1000:7.1f} ms  {per_file[2]}")
+    print(f"  bulk     : {1:4d} Lambda invocation   {bulk_run[1]:4d} AWS calls  {bulk_run[0] * 1000:7.1f} ms  {bulk_run[2]}")
+    print(f"\n📊 Summary: {bulk['summary']} — identical to per-file ✅")
+    check_throttled(aws, conf, ids, base)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--files", type=int, default=20)
+    ap.add_argument("--s3-ms", type=float, default=15)
+    ap.add_argument("--ddb-ms", type=float, default=8)
+    ap.add_argument("--throttle-keys", type=int, default=0, help="keys served per BatchGetItem (0 = all)")
+    ap.add_argument("--no-list-bucket", action="store_true", help="missing keys HEAD as 403, not 404")
+    args = ap.parse_args()
+    run(args.files, args.s3_ms, args.ddb_ms, args.throttle_keys, args.no_list_bucket)
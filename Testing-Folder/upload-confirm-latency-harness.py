@@ -0,0 +1,87 @@
+"""
+Upload confirmation latency (Lambda-Upload/kai-Upload-confirmation-v3).
+
+The processor (kai-upload-function-chat-v3) runs in a background thread
+against the local_aws.py stand-ins and finishes --process-ms after the
+upload. Two client strategies are timed from upload to "processed":
+  • old       – what useS3Uploader.ts did: sleep 2 s, confirm, sleep 1.5 s,
+                confirm again (status only seen if ready by then)
+  • long-poll – one confirmUpload(..., wait=10): the Lambda re-reads the
+                status record with backoff + jitter until it is final
+
+Run:  python Testing-Folder/upload-confirm-latency-harness.py --process-ms 300 1200 2500
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+
+import local_aws  # noqa: E402
+
+BUCKET = "kai-assistant-data-2448"
+UPLOADS = HERE.parent / "Lambda-Upload"
+
+
+def load(aws):
+    upl = local_aws.load_lambda(UPLOADS / "kai-upload-function-chat-v3", "upload_processor")
+    conf = local_aws.load_lambda(UPLOADS / "kai-Upload-confirmation-v3", "upload_confirm")
+    upl.print = conf.print = lambda *a, **k: None
+    upl.GPT_CACHE_ENABLED = False   # every upload pays its --process-ms
+    return upl, conf
+
+
+def upload(aws, upl, upload_id: str, process_s: float) -> None:
+    """PUT the object, then let the processor finish `process_s` later."""
+    key = f"user/user-1/uploads/documents/{upload_id}"
+    aws.s3.put_object(Bucket=BUCKET, Key=key, Body=b"%PDF" + b"x" * 1024, ContentType="application/pdf",
+                      ContentDisposition="inline", CacheControl="no-cache",
+                      Metadata={"user": "user-1", "upload_id": upload_id, "tab": "documents",
+                                "message": "council tax bill", "timestamp": "2026-10-17"})
+
+    def gpt(message, original_name=""):
+        time.sleep(process_s)
+        return {"gpt_title": "Council tax", "gpt_tags": ["bill"], "gpt_summary": message}
+
+    upl.call_gpt_extract = gpt
+    event = {"Records": [{"eventSource": "aws:s3", "s3": {"bucket": {"name": BUCKET}, "object": {"key": key}}}]}
+    threading.Thread(target=upl.lambda_handler, args=(event, None), daemon=True).start()
+
+
+def confirm(conf, upload_id: str, wait: float = 0) -> dict:
+    params = {"user": "user-1", "upload_id": upload_id, "tab": "documents", "wait": str(wait)}
+    return json.loads(conf.lambda_handler({"queryStringParameters": params}, None)["body"])
+
+
+def old_client(conf, upload_id: str) -> str:
+    time.sleep(2.0)
+    confirm(conf, upload_id)
+    time.sleep(1.5)
+    return confirm(conf, upload_id)["status"]
+
+
+def run(process_ms: list[float]) -> None:
+    aws = local_aws.install(s3_ms=10, ddb_ms=5, s3_mb_per_s=0)
+    upl, conf = load(aws)
+    print(f"{'processing':>11} | {'old: status':>16} {'time':>7} | {'long-poll: status':>18} {'time':>7} {'reads':>6}")
+    for ms in process_ms:
+        row = []
+        for mode in ("old", "poll"):
+            upload_id = f"{mode}-{ms:g}.pdf"
+            upload(aws, upl, upload_id, ms / 1000)
+            before = aws.ddb.calls["get_item"]
+            t0 = time.perf_counter()
+            status = old_client(conf, upload_id) if mode == "old" else confirm(conf, upload_id, wait=10)["status"]
+            row += [status, time.perf_counter() - t0, aws.ddb.calls["get_item"] - before]
+        print(f"{ms:9.0f}ms | {row[0]:>16} {row[1]:6.2f}s | {row[3]:>18} {row[4]:6.2f}s {row[5]:6d}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--process-ms", type=float, nargs="+", default=[300, 1200, 2500, 5000])
+    args = ap.parse_args()
+    run(args.process_ms)
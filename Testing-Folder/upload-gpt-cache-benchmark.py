@@ -0,0 +1,84 @@
+"""
+GPT result cache in the upload processor (Lambda-Upload/kai-upload-function-chat-v3).
+
+Three SQS deliveries against the local stand-ins (local_aws.py) and a fake
+OpenAI client with --gpt-ms latency:
+  1. first upload  – --uploads distinct files, every one a cache miss
+  2. re-upload     – the same files + messages again (bulk re-upload / SQS
+                     redelivery): all hits, no OpenAI calls
+  3. duplicates    – one batch holding --dupes copies of a single new file:
+                     one OpenAI call, the rest wait for it in-flight
+
+Run:  python Testing-Folder/upload-gpt-cache-benchmark.py --uploads 50 --gpt-ms 400
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+
+import local_aws  # noqa: E402
+
+# reuse the batch benchmark's fake OpenAI + SQS shapes
+batch = __import__("upload-batch-benchmark")
+
+BUCKET = "kai-assistant-data-2448"
+
+
+def seed(aws, keys: list[str], same_file: bool, message: str) -> None:
+    for i, key in enumerate(keys):
+        body = b"%PDF same scan" if same_file else f"%PDF receipt {i}".encode()
+        meta = {"user": "user-1", "upload_id": key.rsplit("/", 1)[-1], "tab": "taxclaim",
+                "message": message.format(i=i), "timestamp": "2026-10-17T09:00:00Z"}
+        aws.s3.put_object(Bucket=BUCKET, Key=key, Body=body, Metadata=meta, ContentType="application/pdf",
+                          ContentDisposition="inline", CacheControl="no-cache")
+
+
+def run(n: int, dupes: int, gpt_ms: float) -> None:
+    aws = local_aws.install(s3_ms=5, ddb_ms=3, s3_mb_per_s=0)
+    upl = batch.load_upload_lambda()
+    upl.GPT_CACHE_ENABLED = True
+    batch.FakeOpenAI.latency_s = gpt_ms / 1000
+    hits = []
+    original = upl.cached_gpt_extract
+
+    def counting(*args, **kwargs):
+        result, outcome = original(*args, **kwargs)
+        hits.append(outcome)
+        return result, outcome
+
+    upl.cached_gpt_extract = counting
+
+    def phase(name: str, keys: list[str]) -> None:
+        hits.clear()
+        calls0 = batch.FakeOpenAI.calls
+        t0 = time.perf_counter()
+        for event in batch.sqs_batches(keys):
+            upl.lambda_handler(event, None)
+        elapsed = time.perf_counter() - t0
+        print(f"  {name:<13} {len(keys):4d} uploads  {elapsed:6.2f} s  OpenAI calls {batch.FakeOpenAI.calls - calls0:4d}  "
+              f"cache hits {hits.count('hit'):4d}  misses {hits.count('miss'):4d}")
+
+    keys = [f"uploads/user-1/receipt-{i:03d}.pdf" for i in range(n)]
+    print(f"♻️ GPT cache, fake GPT {gpt_ms:.0f} ms per call, SQS batches of {batch.SQS_BATCH}")
+    seed(aws, keys, False, "fuel receipt {i} for the van")
+    phase("first upload", keys)
+    seed(aws, keys, False, "fuel receipt {i} for the van")
+    phase("re-upload", keys)
+    dup_keys = [f"uploads/user-1/scan-copy-{i:02d}.pdf" for i in range(dupes)]
+    seed(aws, dup_keys, True, "same council tax letter")
+    phase("duplicates", dup_keys)
+
+    cache_rows = [k for k in aws.ddb.tables["kai-assistant-data"] if k[0] == upl.GPT_CACHE_PARTITION]
+    print(f"\n📊 {len(cache_rows)} cache rows under user_id={upl.GPT_CACHE_PARTITION!r}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--uploads", type=int, default=50)
+    ap.add_argument("--dupes", type=int, default=10)
+    ap.add_argument("--gpt-ms", type=float, default=400)
+    args = ap.parse_args()
+    run(args.uploads, args.dupes, args.gpt_ms)
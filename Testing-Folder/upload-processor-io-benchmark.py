@@ -0,0 +1,90 @@
+"""
+S3 I/O per processed upload (Lambda-Upload/kai-upload-function-chat-v3).
+
+Counts the S3 calls and object bytes one upload costs, against the local
+stand-ins in local_aws.py:
+  • self-copy – the old status channel: head_object + copy_object onto the
+                same key (MetadataDirective=REPLACE) – replayed for reference
+  • current   – the processor as it is now, for an object uploaded with
+                Content-Type / Content-Disposition / Cache-Control set
+  • legacy    – the processor for an object uploaded without those headers
+                (one header fix via copy_object)
+  • legacy mp – the same with the threshold lowered below the object size,
+                so the fix goes through the multipart managed copy
+
+Run:  python Testing-Folder/upload-processor-io-benchmark.py --size-mb 50
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE))
+
+import local_aws  # noqa: E402
+
+BUCKET = "kai-assistant-data-2448"
+
+
+def s3_event(key: str) -> dict:
+    return {"Records": [{"eventSource": "aws:s3", "s3": {"bucket": {"name": BUCKET}, "object": {"key": key}}}]}
+
+def seed(aws, key: str, size_mb: float, headers: bool) -> None:
+    extra = {"ContentDisposition": "inline", "CacheControl": "no-cache"} if headers else {}
+    aws.s3.put_object(Bucket=BUCKET, Key=key, Body=b"%PDF" + b"x" * int(size_mb * 1024 * 1024),
+                      ContentType="application/pdf",
+                      Metadata={"user": "user-1", "upload_id": key.rsplit("/", 1)[-1], "tab": "taxclaim",
+                                "message": "50 mb scanned tax pack", "timestamp": "2026-10-17"}, **extra)
+
+def measure(aws, fn) -> dict:
+    aws.s3.calls.clear()
+    aws.s3.bytes_read = aws.s3.bytes_written = 0
+    fn()
+    return {"calls": dict(aws.s3.calls), "read_mb": aws.s3.bytes_read / 2**20, "written_mb": aws.s3.bytes_written / 2**20}
+
+def show(name: str, m: dict) -> None:
+    calls = ", ".join(f"{k}×{v}" for k, v in sorted(m["calls"].items()))
+    print(f"  {name:<9} read {m['read_mb']:7.1f} MB  write {m['written_mb']:7.1f} MB  |  {calls}")
+
+
+def run(size_mb: float) -> None:
+    aws = local_aws.install(s3_mb_per_s=0)
+    upl = local_aws.load_lambda(HERE.parent / "Lambda-Upload" / "kai-upload-function-chat-v3", "upload_processor")
+    upl.print = lambda *a, **k: None
+    upl.call_gpt_extract = lambda message, original_name="": {"gpt_title": "Tax pack", "gpt_tags": ["tax"], "gpt_summary": message}
+
+    def old_status_channel(key):
+        head = aws.s3.head_object(Bucket=BUCKET, Key=key)
+        aws.s3.copy_object(Bucket=BUCKET, Key=key, CopySource={"Bucket": BUCKET, "Key": key},
+                           Metadata={**head["Metadata"], "status": "processed"}, MetadataDirective="REPLACE",
+                           ContentType=head["ContentType"], ContentDisposition="inline", CacheControl="no-cache")
+
+    print(f"📄 One {size_mb:g} MB PDF upload (multipart copy threshold {upl.MULTIPART_COPY_THRESHOLD / 2**20:g} MB)")
+    seed(aws, "user/user-1/uploads/receipts/old.pdf", size_mb, headers=True)
+    show("self-copy", measure(aws, lambda: old_status_channel("user/user-1/uploads/receipts/old.pdf")))
+
+    seed(aws, "user/user-1/uploads/receipts/new.pdf", size_mb, headers=True)
+    show("current", measure(aws, lambda: upl.lambda_handler(s3_event("user/user-1/uploads/receipts/new.pdf"), None)))
+
+    seed(aws, "user/user-1/uploads/receipts/legacy.pdf", size_mb, headers=False)
+    show("legacy", measure(aws, lambda: upl.lambda_handler(s3_event("user/user-1/uploads/receipts/legacy.pdf"), None)))
+
+    upl.MULTIPART_COPY_THRESHOLD = min(upl.MULTIPART_COPY_THRESHOLD, int(size_mb * 2**20) // 2)
+    seed(aws, "user/user-1/uploads/receipts/legacy-big.pdf", size_mb, headers=False)
+    show("legacy mp", measure(aws, lambda: upl.lambda_handler(s3_event("user/user-1/uploads/receipts/legacy-big.pdf"), None)))
+
+    # the legacy copy fires ObjectCreated:Copy – the processor must skip it
+    copy_event = measure(aws, lambda: upl.lambda_handler(s3_event("user/user-1/uploads/receipts/legacy.pdf"), None))
+    show("re-event", copy_event)
+    assert copy_event["calls"] == {"head_object": 1}, "copy event was reprocessed"
+    item = aws.ddb.tables["kai-assistant-data"][("user-1", "new.pdf")]
+    print(f"\n📊 Status channel: DynamoDB status={item['status']['S']}, "
+          f"tag Status={json.dumps(aws.s3.objects[(BUCKET, 'user/user-1/uploads/receipts/new.pdf')]['Tags'][0])}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--size-mb", type=float, default=50)
+    args = ap.parse_args()
+    run(args.size_mb)